@@ -0,0 +1,188 @@
+"""
+Benchmarks for the core/main.py metrics and the end-to-end dashboard
+computation on synthetic exports.
+
+Examples:
+    python benchmarks/bench.py                              # 10k, 1M and 10M rows
+    python benchmarks/bench.py --sizes 10000 100000 -o benchmarks/results/dev.json
+    python benchmarks/bench.py --sizes 1000000 --compare benchmarks/results/v1.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'core'))
+
+import main
+from cube import build_cube
+from streaming import aggregate_csv
+from synthetic import SYNTHETIC_VERSION, write_events
+
+DEFAULT_SIZES = [10_000, 1_000_000, 10_000_000]
+DATA_DIR = os.path.join(ROOT, 'benchmarks', 'data')
+
+
+def metric_cases(data):
+    """Benchmark cases for the individual metric functions on a loaded event table"""
+    repo_matrix = main.buildRepoMatrix(data)
+    repo_activity = repo_matrix.to_dict()
+    top_contributor = main.getContributorStats(data).index[0]
+    cube = build_cube(data)
+    return {
+        'totalActiveDays': lambda: main.totalActiveDays(data),
+        'longestGap': lambda: main.longestGap(data),
+        'busiestDay': lambda: main.busiestDay(data),
+        'longestStreak': lambda: main.longestStreak(data),
+        'calendarMetrics': lambda: main.calendarMetrics(data),
+        'monthWiseActivity': lambda: main.monthWiseActivity(data),
+        'timeWiseActivity': lambda: main.timeWiseActivity(data),
+        'allDeveloperActivity': lambda: main.allDeveloperActivity(data),
+        'repoActivity': lambda: main.repoActivity(data),
+        'buildRepoMatrix': lambda: main.buildRepoMatrix(data),
+        'getTopRepositories': lambda: main.getTopRepositories(repo_activity),
+        'getMostActiveRepositories': lambda: main.getMostActiveRepositories(repo_activity),
+        'RepoMatrix.top': lambda: main.getTopRepositories(repo_matrix),
+        'getCommitFrequency': lambda: main.getCommitFrequency(data),
+        'getActivityByHour': lambda: main.getActivityByHour(data),
+        'getActivityCalendar': lambda: main.getActivityCalendar(data),
+        'activityHeatmap': lambda: main.activityHeatmap(data),
+        'getContributorStats': lambda: main.getContributorStats(data),
+        'getContributorDetails': lambda: main.getContributorDetails(data, top_contributor),
+        'getContributorTimeline': lambda: main.getContributorTimeline(data, top_contributor),
+        'ContributorIndex': lambda: main.ContributorIndex(data).details(top_contributor),
+        'contributorSummaries': lambda: main.contributorSummaries(data),
+        'build_cube': lambda: build_cube(data),
+        'ActivityCube.metrics': lambda: cube.metrics(),
+    }
+
+
+def measure(func, repeat=1, memory=True):
+    """
+    Time a zero-argument callable and optionally record its peak allocation.
+
+    Wall time is the best of `repeat` untraced runs; peak memory comes from
+    one extra run under tracemalloc, which covers numpy and pandas buffers.
+
+    Returns:
+        dict: 'seconds' and, when memory is measured, 'peak_mb'
+    """
+    timings = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    result = {'seconds': round(min(timings), 6)}
+
+    if memory:
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                func()
+            result['peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_size(rows, repeat=1, memory=True, data_dir=DATA_DIR):
+    """Run every benchmark case against a synthetic export with `rows` messages"""
+    path = os.path.join(data_dir, f"events_v{SYNTHETIC_VERSION}_{rows}.csv")
+    if not os.path.exists(path):
+        print(f"Generating {rows:,} rows -> {path}", file=sys.stderr)
+        write_events(path, rows)
+
+    def end_to_end():
+        return main.computeMetrics(main.normalize_events(main.clean_data(path)))
+
+    results = {
+        'clean_data': measure(lambda: main.clean_data(path), repeat, memory),
+    }
+    raw = main.clean_data(path)
+    results['normalize_events'] = measure(lambda: main.normalize_events(raw), repeat, memory)
+    data = main.normalize_events(raw)
+    del raw
+    results['classifyEvents'] = measure(lambda: main.classifyEvents(data['embeds.0.title']), repeat, memory)
+    for name, func in metric_cases(data).items():
+        print(f"  {rows:,} rows: {name}", file=sys.stderr)
+        results[name] = measure(func, repeat, memory)
+    results['computeMetrics'] = measure(lambda: main.computeMetrics(data), repeat, memory)
+    del data
+
+    results['end_to_end'] = measure(end_to_end, repeat, memory)
+    results['streaming_end_to_end'] = measure(lambda: aggregate_csv(path).report(), repeat, memory)
+    return results
+
+
+def environment():
+    """Versions and revision the results were recorded with"""
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                  capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        revision = None
+    return {
+        'revision': revision,
+        'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def print_table(results, baseline=None):
+    for rows, cases in results.items():
+        print(f"\n{int(rows):,} rows")
+        print(f"{'case':<28}{'seconds':>12}{'peak MB':>12}" + (f"{'vs base':>10}" if baseline else ""))
+        for name, result in cases.items():
+            line = f"{name:<28}{result['seconds']:>12.4f}{result.get('peak_mb', float('nan')):>12.1f}"
+            if baseline:
+                base = baseline.get(str(rows), {}).get(name)
+                line += f"{result['seconds'] / base['seconds']:>9.2f}x" if base and base['seconds'] else f"{'-':>10}"
+            print(line)
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the wrapped metrics on synthetic exports.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="row counts to benchmark")
+    parser.add_argument('--repeat', type=int, default=1, help="timed runs per case; the best is kept")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc peak-memory runs")
+    parser.add_argument('--data-dir', default=DATA_DIR, help="where synthetic exports are cached")
+    parser.add_argument('-o', '--output', help="write results as JSON to this file")
+    parser.add_argument('--compare', help="earlier JSON results to compare wall times against")
+    args = parser.parse_args(argv)
+    # Time the computations themselves, not reads from a shared result cache
+    os.environ.pop('RESULT_CACHE_DIR', None)
+
+    results = {}
+    for rows in args.sizes:
+        results[str(rows)] = run_size(rows, args.repeat, not args.no_memory, args.data_dir)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+    print_table(results, baseline)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main_cli()
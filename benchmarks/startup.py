@@ -0,0 +1,162 @@
+"""
+Startup benchmark for the dashboard: cold import time of the libraries it
+uses, and how long core/ui.py takes to draw the sidebar.
+
+Every measurement runs in a fresh interpreter, so nothing is already
+imported. The first paint is timed by running core/ui.py with Streamlit's
+AppTest and timestamping the messages the script sends to the browser.
+
+Examples:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --data exports/GDGVIT_2024.csv -o benchmarks/results/startup.json
+    python benchmarks/startup.py --compare benchmarks/results/startup.json
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench import ROOT, environment
+
+sys.path.insert(0, ROOT)
+from config import DEFAULT_ORG, ORGANIZATIONS
+
+# Modules whose cold import time is tracked; 'dashboard' is what core/ui.py
+# needs before it draws the sidebar
+IMPORT_CASES = {
+    'streamlit': ['streamlit'],
+    'numpy': ['numpy'],
+    'pandas': ['pandas'],
+    'plotly.express': ['plotly.express'],
+    'matplotlib.pyplot': ['matplotlib.pyplot'],
+    'dashboard': ['streamlit', 'dotenv', 'config', 'instrumentation'],
+    'analysis': ['main', 'cube', 'cache', 'snapshot', 'store', 'repo_table'],
+    'charts': ['recap'],
+}
+
+IMPORT_PROBE = """
+import sys, time
+sys.path[:0] = [{root!r}, {core!r}]
+start = time.perf_counter()
+for module in {modules!r}:
+    __import__(module)
+print(time.perf_counter() - start)
+"""
+
+# Runs core/ui.py once and reports, in seconds from the start of the run,
+# when the first sidebar element and the "Data Source" radio were sent
+PAINT_PROBE = """
+import json, os, sys, time
+launched = float(os.environ['STARTUP_LAUNCHED_AT'])
+from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+from streamlit.testing.v1 import AppTest
+
+sent = {{}}
+enqueue = ScriptRunContext.enqueue
+
+def timed_enqueue(self, msg):
+    now = time.perf_counter()
+    if msg.WhichOneof('type') == 'delta' and msg.metadata.delta_path[:1] == [1]:
+        sent.setdefault('sidebar', now)
+        if msg.delta.new_element.WhichOneof('type') == 'radio':
+            sent.setdefault('data_source', now)
+    return enqueue(self, msg)
+
+ScriptRunContext.enqueue = timed_enqueue
+at = AppTest.from_file({ui!r}, default_timeout={timeout})
+start = time.perf_counter()
+process = time.time() - launched
+at.run()
+end = time.perf_counter()
+print(json.dumps({{
+    'launch_to_run': process,
+    'first_sidebar': sent['sidebar'] - start if 'sidebar' in sent else None,
+    'data_source': sent['data_source'] - start if 'data_source' in sent else None,
+    'full_run': end - start,
+    'exceptions': [str(e.value) for e in at.exception],
+}}))
+"""
+
+
+def import_time(modules, repeat=1):
+    """Best wall time of importing modules in a fresh interpreter"""
+    probe = IMPORT_PROBE.format(root=ROOT, core=os.path.join(ROOT, 'core'), modules=modules)
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True).stdout
+        times.append(float(out))
+    return min(times)
+
+
+def first_paint(data=None, timeout=600):
+    """
+    Run the dashboard once in a fresh interpreter and a scratch working
+    directory, optionally with `data` in place as the default org's export.
+
+    Returns:
+        dict: Seconds from process launch to the start of the run, and from
+        the start of the run to the first sidebar element, to the "Data
+        Source" radio and to the end of the run
+    """
+    org = ORGANIZATIONS[DEFAULT_ORG]
+    env = {key: value for key, value in os.environ.items()
+           if key not in ('CSV_DATA_PATH', 'SNAPSHOT_DIR', 'RESULT_CACHE_DIR')}
+    with tempfile.TemporaryDirectory() as cwd:
+        if data:
+            shutil.copy(data, os.path.join(cwd, f"{org['name']}_{org['year']}.csv"))
+        probe = PAINT_PROBE.format(ui=os.path.join(ROOT, 'core', 'ui.py'), timeout=timeout)
+        env['STARTUP_LAUNCHED_AT'] = repr(time.time())
+        out = subprocess.run([sys.executable, '-c', probe], cwd=cwd, env=env,
+                             capture_output=True, text=True, check=True).stdout
+    result = json.loads(out.splitlines()[-1])
+    if result.pop('exceptions'):
+        raise RuntimeError(f"dashboard raised during the run: {out}")
+    return result
+
+
+def print_table(results, baseline=None):
+    for section, cases in results.items():
+        print(f"\n{section}")
+        print(f"{'case':<28}{'seconds':>12}" + (f"{'vs base':>10}" if baseline else ""))
+        for name, seconds in cases.items():
+            line = f"{name:<28}" + (f"{seconds:>12.3f}" if seconds is not None else f"{'-':>12}")
+            if baseline:
+                base = baseline.get(section, {}).get(name)
+                line += f"{seconds / base:>9.2f}x" if base and seconds is not None else f"{'-':>10}"
+            print(line)
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dashboard import time and time to first paint.")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per case; the best is kept")
+    parser.add_argument('--data', help="export to load as the default organization's CSV")
+    parser.add_argument('-o', '--output', help="write results as JSON to this file")
+    parser.add_argument('--compare', help="earlier JSON results to compare wall times against")
+    args = parser.parse_args(argv)
+
+    imports = {name: import_time(modules, args.repeat) for name, modules in IMPORT_CASES.items()}
+    runs = [first_paint(args.data) for _ in range(args.repeat)]
+    results = {
+        'imports': imports,
+        'first_paint': {key: min(run[key] for run in runs) if runs[0][key] is not None else None
+                        for key in runs[0]},
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+    print_table(results, baseline)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main_cli()
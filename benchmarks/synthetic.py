@@ -0,0 +1,184 @@
+"""
+Synthetic Discrub-style webhook exports for benchmarking.
+
+Example:
+    python benchmarks/synthetic.py 1000000 -o benchmarks/data/events_1000000.csv
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+ORG = "GDGVIT"
+
+# Bump when the generated data changes, so cached benchmark exports are
+# regenerated instead of reused
+SYNTHETIC_VERSION = 2
+
+# Title templates covering every pattern repoActivity recognizes, plus a few
+# webhook messages it ignores. {org}, {repo}, {branch}, {n}, {k} and {user}
+# are filled in per row.
+TITLE_TEMPLATES = [
+    ("[{org}/{repo}] New star added", 8),
+    ("[{org}/{repo}] New collaborator added: {user}", 1),
+    ("[{org}/{repo}] New branch created: {branch}", 4),
+    ("[{org}/{repo}] New comment on issue #{n}: Crash on startup", 5),
+    ("[{org}/{repo}] New comment on pull request #{n}: Add dark mode", 5),
+    ("[{org}/{repo}] New review comment on pull request #{n}: Add dark mode", 4),
+    ("[{org}/{repo}] Fork created: {user}/{repo}", 2),
+    ("[{org}/{repo}] Issue opened: #{n} Crash on startup", 4),
+    ("[{org}/{repo}] Issue closed: #{n} Crash on startup", 3),
+    ("[{repo}] GitHub Actions checks success on {branch}", 6),
+    ("[{repo}] commitlint success on {branch}", 2),
+    ("[{repo}] deploy-main success on main", 1),
+    ("[{repo}] Deployed successfully", 1),
+    ("[{repo}] create_commit success on {branch}", 1),
+    ("[{repo}] Lint Code Base success on {branch}", 1),
+    ("[{repo}] GitHub Actions checks failure on {branch}", 2),
+    ("[{repo}] commitlint failure on {branch}", 1),
+    ("[{repo}] deploy-main failure on main", 1),
+    ("[{repo}] Deploy failed", 1),
+    ("[{repo}] Deploy failure", 1),
+    ("[{repo}] Lint Code Base failure on {branch}", 1),
+    ("[{org}/{repo}] Pull request opened: #{n} Add dark mode", 5),
+    ("[{org}/{repo}] Pull request closed: #{n} Add dark mode", 4),
+    ("[{repo}:{branch}] {k} new commits", 12),
+    ("[{repo}:{branch}] 1 new commit", 8),
+    ("[{org}/{repo}] Release published: v1.{n}", 1),
+    ("", 1),
+]
+
+BRANCHES = ["main", "dev", "staging", "feat/auth", "fix/ci"]
+
+# Relative activity by weekday (Monday first) and by hour of day (UTC):
+# quieter weekends, little overnight, a peak in the afternoon
+WEEKDAY_WEIGHTS = np.array([1.0, 1.0, 0.95, 0.9, 0.8, 0.35, 0.25])
+HOUR_WEIGHTS = np.array([0.3, 0.2, 0.1, 0.1, 0.1, 0.1, 0.2, 0.4, 0.7, 1.0, 1.2, 1.3,
+                         1.2, 1.3, 1.5, 1.6, 1.5, 1.3, 1.1, 1.0, 0.9, 0.8, 0.6, 0.4])
+
+
+def _fill(template, rng, size, repos, users):
+    """Render one template for `size` rows with vectorized string concatenation"""
+    titles = pd.Series([template] * size, dtype=object)
+    fields = {
+        '{org}': pd.Series([ORG] * size, dtype=object),
+        '{repo}': pd.Series(rng.choice(repos, size), dtype=object),
+        '{branch}': pd.Series(rng.choice(BRANCHES, size), dtype=object),
+        '{n}': pd.Series(rng.integers(1, 500, size)).astype(str),
+        '{k}': pd.Series(rng.integers(2, 20, size)).astype(str),
+        '{user}': pd.Series(rng.choice(users, size), dtype=object),
+    }
+    # Split on each placeholder in turn and re-join with the per-row values
+    for placeholder, values in fields.items():
+        if placeholder in template:
+            parts = titles.str.split(placeholder, regex=False)
+            titles = parts.str[0]
+            for i in range(1, template.count(placeholder) + 1):
+                titles = titles + values.values + parts.str[i]
+    return titles.to_numpy()
+
+
+def activity_calendar(year, seed=0, idle_stretches=6):
+    """
+    Relative activity for every day of a year.
+
+    Weekends are quieter, a few stretches of up to two weeks (holidays,
+    exams) and scattered single days have no activity at all, so exports
+    have real gaps and several streaks of different lengths.
+
+    Returns:
+        tuple: (np.ndarray of datetime64[D] days, np.ndarray of weights)
+    """
+    rng = np.random.default_rng(seed)
+    days = np.arange(np.datetime64(f"{year}-01-01"), np.datetime64(f"{year + 1}-01-01"))
+    # 1970-01-01 was a Thursday
+    weights = WEEKDAY_WEIGHTS[(days.astype(np.int64) + 3) % 7].copy()
+    for start, length in zip(rng.integers(0, len(days), idle_stretches), rng.integers(3, 15, idle_stretches)):
+        weights[start:start + length] = 0
+    weights[rng.choice(len(days), len(days) // 20, replace=False)] = 0
+    return days, weights
+
+
+def generate_events(rows, seed=0, n_repos=200, n_users=500, year=2024, calendar_seed=None, day_range=None):
+    """
+    Generate a synthetic export with realistic webhook titles and timing.
+
+    Args:
+        rows (int): Number of messages
+        seed (int): Random seed, so benchmarks are reproducible
+        n_repos (int): Number of distinct repositories
+        n_users (int): Number of distinct contributors
+        year (int): Year the timestamps fall in
+        calendar_seed (int): Seed of the activity_calendar; defaults to seed
+        day_range (tuple): Only place messages on days [start, stop) of the
+            year, for exports written in chunks
+
+    Returns:
+        pd.DataFrame: Columns as in a Discrub export (the four the dashboard
+        reads plus a few it ignores)
+    """
+    rng = np.random.default_rng(seed)
+    repos = np.array([f"repo-{i}" for i in range(n_repos)], dtype=object)
+    users = np.array([f"dev{i}" for i in range(n_users)], dtype=object)
+
+    weights = np.array([weight for _, weight in TITLE_TEMPLATES], dtype=float)
+    choice = rng.choice(len(TITLE_TEMPLATES), size=rows, p=weights / weights.sum())
+    titles = np.empty(rows, dtype=object)
+    for index, (template, _) in enumerate(TITLE_TEMPLATES):
+        positions = np.flatnonzero(choice == index)
+        if len(positions):
+            titles[positions] = _fill(template, rng, len(positions), repos, users)
+
+    # Activity skewed towards a few busy contributors, as in real orgs
+    author = users[np.minimum(rng.zipf(1.5, rows) - 1, n_users - 1)]
+    days, weights = activity_calendar(year, seed if calendar_seed is None else calendar_seed)
+    if day_range is not None:
+        days, weights = days[slice(*day_range)], weights[slice(*day_range)]
+    if weights.sum() == 0:
+        weights = np.ones(len(days))
+    day = rng.choice(days, rows, p=weights / weights.sum())
+    hour = rng.choice(24, rows, p=HOUR_WEIGHTS / HOUR_WEIGHTS.sum())
+    seconds = hour * 3600 + rng.integers(0, 3600, rows)
+    timestamps = np.sort(day.astype('datetime64[s]') + seconds.astype('timedelta64[s]'))
+
+    return pd.DataFrame({
+        'id': np.arange(10**17, 10**17 + rows),
+        'timestamp': pd.Series(timestamps).dt.strftime('%Y-%m-%dT%H:%M:%S.%f') + '+00:00',
+        'content': '',
+        'embeds.0.title': titles,
+        'embeds.0.author.name': author,
+        'embeds.0.author.url': 'https://github.com/' + pd.Series(author, dtype=object),
+        'embeds.0.color': 0x24292F,
+        'webhook_id': 123456789,
+    })
+
+
+def write_events(path, rows, seed=0, chunk_rows=1_000_000, **kwargs):
+    """
+    Write a synthetic export to CSV in chunks, so 10M+ rows fit in memory.
+
+    Each chunk covers its own slice of the same activity calendar, keeping
+    the file in timestamp order like a real export.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    written = 0
+    chunk = 0
+    year_days = len(activity_calendar(kwargs.get('year', 2024), seed)[0])
+    while written < rows:
+        size = min(chunk_rows, rows - written)
+        day_range = (year_days * written // rows, year_days * (written + size) // rows)
+        frame = generate_events(size, seed=seed + chunk, calendar_seed=seed, day_range=day_range, **kwargs)
+        frame.to_csv(path, mode='w' if chunk == 0 else 'a', header=chunk == 0, index=False)
+        written += size
+        chunk += 1
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic Discrub-style export.")
+    parser.add_argument('rows', type=int)
+    parser.add_argument('-o', '--output', required=True)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    write_events(args.output, args.rows, seed=args.seed)
@@ -26,6 +26,8 @@ ORGANIZATIONS = {
         "color_secondary": "#764ba2",
         "year": 2024,
         "show_banner": False, 
+        # Read the year from an event store (core/store.py) instead of <name>_<year>.csv
+        # "store": "stores/your_org.sqlite",
     },
 }
 
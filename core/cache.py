@@ -0,0 +1,196 @@
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def file_fingerprint(path):
+    """
+    Cheap fingerprint of a file on disk.
+
+    Args:
+        path (str): Path to the file
+
+    Returns:
+        tuple: Absolute path, modification time (ns) and size in bytes
+    """
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def content_fingerprint(buffer):
+    """
+    Fingerprint raw file contents, for uploads that have no path on disk.
+
+    Args:
+        buffer (bytes): File contents
+
+    Returns:
+        str: SHA-256 hex digest of the contents
+    """
+    return hashlib.sha256(buffer).hexdigest()
+
+
+def estimate_size(value, _seen=None):
+    """
+    Approximate in-memory size of a cached value in bytes.
+
+    DataFrames and Series are measured with deep memory usage and containers
+    are walked recursively. Objects with an `nbytes` attribute (arrays,
+    ActivityCube, RepoMatrix, RepoTable, ContributorIndex, EventTimeline)
+    report their own size; other objects fall back to sys.getsizeof. An
+    object reached more than once, such as a window's reference back to its
+    dataset, is counted once.
+
+    Args:
+        value: Any cached value
+
+    Returns:
+        int: Estimated size in bytes
+    """
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(v, seen) for v in value)
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """
+    LRU cache of loaded datasets and their computed metrics.
+
+    Entries live under a namespace (for example the org key and data source)
+    and are tagged with the fingerprint of the file they were computed from.
+    Looking up a namespace with a different fingerprint discards the stale
+    entry, so a changed CSV is recomputed automatically. Least recently used
+    namespaces are evicted once the total estimated size exceeds max_bytes.
+
+    A cache can be shared by every session of a server process: all methods
+    are thread-safe, and concurrent get_or_compute calls for the same
+    namespace compute the value only once. Cached values are handed to every
+    caller as-is, so callers must treat them as read-only.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        # Namespace -> lock held while its value is being computed
+        self._computing = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def total_bytes(self):
+        with self._lock:
+            return sum(size for _, _, size in self._entries.values())
+
+    def get(self, namespace, fingerprint):
+        """
+        Look up the entry for a namespace.
+
+        Args:
+            namespace (hashable): Cache namespace
+            fingerprint (hashable): Fingerprint of the current source file
+
+        Returns:
+            The cached value, or None when missing or computed from a
+            different version of the file
+        """
+        with self._lock:
+            entry = self._entries.get(namespace)
+            if entry is None:
+                return None
+            if entry[0] != fingerprint:
+                del self._entries[namespace]
+                return None
+            self._entries.move_to_end(namespace)
+            return entry[1]
+
+    def put(self, namespace, fingerprint, value, size=None):
+        """
+        Store a value, evicting least recently used entries over budget.
+
+        Args:
+            namespace (hashable): Cache namespace
+            fingerprint (hashable): Fingerprint of the source file
+            value: Value to cache
+            size (int): Size in bytes; estimated when not given
+        """
+        if size is None:
+            size = estimate_size(value)
+        with self._lock:
+            self._entries[namespace] = (fingerprint, value, size)
+            self._evict(namespace)
+
+    def recharge(self, value, size=None):
+        """
+        Update the size of the entry holding a value that grew (or shrank)
+        in place, such as a dataset that built a member on first use, and
+        evict least recently used entries over budget. Does nothing when
+        the value is no longer cached.
+
+        Args:
+            value: Value stored with put or get_or_compute
+            size (int): Size in bytes; estimated when not given
+        """
+        if size is None:
+            size = estimate_size(value)
+        with self._lock:
+            for namespace, (fingerprint, cached, _) in self._entries.items():
+                if cached is value:
+                    self._entries[namespace] = (fingerprint, value, size)
+                    self._evict(namespace)
+                    return
+
+    def _evict(self, namespace):
+        """Mark a namespace most recently used and drop the oldest entries over budget"""
+        self._entries.move_to_end(namespace)
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while len(self._entries) > 1 and self.total_bytes > self.max_bytes:
+            self._entries.popitem(last=False)
+
+    def get_or_compute(self, namespace, fingerprint, compute):
+        """
+        Return the cached value, computing and storing it on a miss.
+
+        Callers that miss on the same namespace at the same time wait for
+        the first one's computation instead of repeating it.
+
+        Args:
+            namespace (hashable): Cache namespace
+            fingerprint (hashable): Fingerprint of the current source file
+            compute (callable): Zero-argument function producing the value
+
+        Returns:
+            The cached or freshly computed value
+        """
+        value = self.get(namespace, fingerprint)
+        if value is not None:
+            return value
+        with self._lock:
+            computing = self._computing.setdefault(namespace, threading.Lock())
+        with computing:
+            value = self.get(namespace, fingerprint)
+            if value is None:
+                value = compute()
+                self.put(namespace, fingerprint, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,229 @@
+"""
+Batch rendering of per-contributor "wrapped" cards.
+
+Every contributor's card (total activities, top repositories, most active
+day and hour, monthly sparkline) is rendered with matplotlib in a process
+pool. A manifest records the inputs each card was rendered from, so reruns
+skip unchanged cards and an interrupted run picks up where it stopped.
+
+Examples:
+    python core/cards.py GDGVIT_2024 --output-dir cards/
+    python core/cards.py --csv exports/GDGVIT_2024.csv --format svg --workers 8
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import ORGANIZATIONS
+
+from cli import job_branding, job_events, plan_jobs
+from instrumentation import configure_logging
+from main import contributorSummaries
+
+# Bump when the card layout changes, so every card is rendered again
+CARD_VERSION = 1
+MANIFEST_NAME = 'cards.json'
+FORMATS = ['png', 'svg']
+
+
+def card_fingerprint(summary, branding, fmt):
+    """Hash of everything a card is rendered from"""
+    inputs = {
+        'version': CARD_VERSION,
+        'format': fmt,
+        'summary': summary,
+        'branding': {key: branding.get(key) for key in ('name', 'year', 'color_primary', 'color_secondary')},
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def card_filenames(names, fmt):
+    """
+    File name for each contributor's card, stable across runs.
+
+    Names are reduced to safe characters; names that collide after that
+    get a short hash of the full name appended.
+    """
+    slugs = [re.sub(r'[^a-z0-9._-]+', '_', name.lower()).strip('._') or 'contributor' for name in names]
+    taken = {}
+    for slug in slugs:
+        taken[slug] = taken.get(slug, 0) + 1
+    return [
+        f"{slug}-{hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]}.{fmt}" if taken[slug] > 1 else f"{slug}.{fmt}"
+        for name, slug in zip(names, slugs)
+    ]
+
+
+def render_card(summary, branding, path, fmt='png'):
+    """
+    Draw one contributor's card and write it atomically.
+
+    Runs in a worker process, so it takes and returns only picklable values.
+
+    Returns:
+        str: Path of the written card
+    """
+    primary, secondary = branding['color_primary'], branding['color_secondary']
+    fig = Figure(figsize=(6, 3.375), dpi=200, facecolor=primary)
+    fig.patches.append(Rectangle((0, 0), 1, 0.34, transform=fig.transFigure, color=secondary, zorder=-1))
+
+    heading = ' '.join(str(part) for part in (branding['name'], branding['year'], 'Wrapped') if part)
+    fig.text(0.05, 0.9, heading.upper(), color='white',
+             fontsize=8, alpha=0.8, weight='bold')
+    fig.text(0.05, 0.77, summary['name'], color='white', fontsize=18, weight='bold')
+
+    hour = summary['most_active_hour']
+    stats = [
+        ("Activities", f"{summary['total_activities']:,}"),
+        ("Most active day", summary['most_active_day'] or "-"),
+        ("Most active hour", f"{hour}:00" if hour is not None else "-"),
+    ]
+    for i, (label, value) in enumerate(stats):
+        fig.text(0.05 + i * 0.2, 0.6, value, color='white', fontsize=12, weight='bold')
+        fig.text(0.05 + i * 0.2, 0.54, label, color='white', fontsize=7, alpha=0.8)
+
+    fig.text(0.66, 0.66, "TOP REPOSITORIES", color='white', fontsize=7, alpha=0.8, weight='bold')
+    for i, (repo, events) in enumerate(summary['top_repositories']):
+        label = repo if len(repo) <= 24 else repo[:23] + '…'
+        fig.text(0.66, 0.59 - i * 0.065, f"{label}  ({events:,})", color='white', fontsize=8)
+
+    months = list(summary['monthly_activity'])
+    counts = list(summary['monthly_activity'].values())
+    ax = fig.add_axes([0.05, 0.06, 0.9, 0.22])
+    ax.set_axis_off()
+    if counts:
+        ax.plot(range(len(counts)), counts, color='white', linewidth=1.5)
+        ax.fill_between(range(len(counts)), counts, color='white', alpha=0.25)
+        ax.set_xlim(0, max(len(counts) - 1, 1))
+        ax.set_ylim(0, max(max(counts), 1) * 1.1)
+        fig.text(0.05, 0.29, months[0], color='white', fontsize=6, alpha=0.8)
+        fig.text(0.95, 0.29, months[-1], color='white', fontsize=6, alpha=0.8, ha='right')
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fig.savefig(tmp_path, format=fmt, facecolor=primary)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_manifest(output_dir):
+    """Fingerprint of every card rendered into output_dir so far, by file name"""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        manifest = json.load(f)
+    return manifest.get('cards', {}) if manifest.get('version') == CARD_VERSION else {}
+
+
+def save_manifest(output_dir, cards):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({'version': CARD_VERSION, 'cards': cards}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def render_cards(summaries, branding, output_dir, fmt='png', workers=None):
+    """
+    Render a card per contributor, skipping cards that are up to date.
+
+    The manifest is updated as each card finishes, so an interrupted run
+    only redoes the cards that were still pending.
+
+    Args:
+        summaries (list): Output of contributorSummaries
+        branding (dict): Organization entry from ORGANIZATIONS
+        output_dir (str): Directory for the cards and their manifest
+        fmt (str): 'png' or 'svg'
+        workers (int): Worker processes; defaults to the number of CPUs
+
+    Returns:
+        dict: Number of cards 'rendered', 'skipped' and 'failed'
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    pending = []
+    for summary, filename in zip(summaries, card_filenames([s['name'] for s in summaries], fmt)):
+        fingerprint = card_fingerprint(summary, branding, fmt)
+        if manifest.get(filename) == fingerprint and os.path.exists(os.path.join(output_dir, filename)):
+            continue
+        pending.append((summary, filename, fingerprint))
+
+    result = {'rendered': 0, 'skipped': len(summaries) - len(pending), 'failed': 0}
+    if not pending:
+        return result
+
+    with ProcessPoolExecutor(max_workers=max(1, min(workers or os.cpu_count(), len(pending)))) as pool:
+        futures = {pool.submit(render_card, summary, branding, os.path.join(output_dir, filename), fmt):
+                   (summary, filename, fingerprint) for summary, filename, fingerprint in pending}
+        for future in as_completed(futures):
+            summary, filename, fingerprint = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                result['failed'] += 1
+                print(f"{summary['name']}: failed: {e}", file=sys.stderr)
+                continue
+            manifest[filename] = fingerprint
+            save_manifest(output_dir, manifest)
+            result['rendered'] += 1
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render a wrapped card for every contributor.")
+    parser.add_argument('orgs', nargs='*', metavar='ORG',
+                        help=f"ORGANIZATIONS keys from config.py ({', '.join(ORGANIZATIONS)})")
+    parser.add_argument('--csv', action='append', default=[], help="also render cards for this export")
+    parser.add_argument('--data-dir', default=os.getenv('CSV_DATA_PATH', '.'),
+                        help="directory holding <name>_<year>.csv exports (default: $CSV_DATA_PATH or .)")
+    parser.add_argument('--output-dir', default='cards', help="cards go to <output-dir>/<name>/ (default: cards)")
+    parser.add_argument('--format', choices=FORMATS, default='png', help="image format (default: png)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="parallel worker processes")
+    args = parser.parse_args(argv)
+
+    unknown = [org for org in args.orgs if org not in ORGANIZATIONS]
+    if unknown:
+        parser.error(f"unknown organization(s): {', '.join(unknown)}")
+    if not args.orgs and not args.csv:
+        parser.error("give at least one ORG or --csv")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_logging()
+    jobs = plan_jobs(args.orgs, None, args.data_dir) + [{
+        'name': os.path.splitext(os.path.basename(path))[0],
+        'source': path,
+        'store': False,
+        'org_key': None,
+        'org_config': None,
+    } for path in args.csv]
+
+    failures = 0
+    for job in jobs:
+        if not os.path.exists(job['source']):
+            print(f"Skipping missing export: {job['source']}", file=sys.stderr)
+            failures += 1
+            continue
+        summaries = contributorSummaries(job_events(job))
+        result = render_cards(summaries, job_branding(job), os.path.join(args.output_dir, job['name']),
+                              args.format, args.workers)
+        print(f"{job['name']}: {result['rendered']} rendered, {result['skipped']} up to date"
+              + (f", {result['failed']} failed" if result['failed'] else ""))
+        failures += result['failed']
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Headless batch generation of wrapped reports.
+
+Examples:
+    python core/cli.py GDGVIT_2024 GDGVIT_2025 --data-dir exports/
+    python core/cli.py --csv-dir exports/ --output-dir reports/ --workers 8
+    python core/cli.py GDGVIT_2024 --html          # plus a static HTML recap to share
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import ORGANIZATIONS
+
+from cache import file_fingerprint
+from cube import build_cube
+from disk_cache import file_cached
+from incremental import process_incremental
+from instrumentation import configure_logging
+from main import ContributorIndex, clean_data, normalize_events
+from repo_table import RepoTable
+from report import build_report
+from static_export import BANNER_PATH, render_html, write_html
+from store import EventStore, year_range
+from streaming import DEFAULT_CHUNKSIZE, aggregate_csv
+
+
+def org_csv_path(org_config, data_dir):
+    """Expected export for an organization, named like the dashboard expects it"""
+    return os.path.join(data_dir, f"{org_config['name']}_{org_config['year']}.csv")
+
+
+def plan_jobs(org_keys, csv_dir, data_dir):
+    """
+    Work out which exports to process and where their reports go.
+
+    Args:
+        org_keys (list): ORGANIZATIONS keys to process
+        csv_dir (str): Directory whose CSVs are each processed, or None
+        data_dir (str): Directory holding the organizations' exports
+
+    Returns:
+        list: Jobs as dicts with 'name', 'source', 'store' (whether the
+        source is an event store), 'org_key' and 'org_config'
+    """
+    jobs = []
+    for org_key in org_keys:
+        org_config = ORGANIZATIONS[org_key]
+        jobs.append({
+            'name': org_key,
+            'source': org_config.get('store') or org_csv_path(org_config, data_dir),
+            'store': bool(org_config.get('store')),
+            'org_key': org_key,
+            'org_config': org_config,
+        })
+    if csv_dir:
+        for path in sorted(glob.glob(os.path.join(csv_dir, '*.csv'))):
+            jobs.append({
+                'name': os.path.splitext(os.path.basename(path))[0],
+                'source': path,
+                'store': False,
+                'org_key': None,
+                'org_config': None,
+            })
+    return jobs
+
+
+def job_events(job):
+    """Every row of a job's source (the org's year, for a store), normalized"""
+    if job['store']:
+        return normalize_events(EventStore(job['source']).events(*year_range(job['org_config']['year'])))
+    return normalize_events(clean_data(job['source']))
+
+
+def job_branding(job):
+    """Organization entry used to brand a job's recap and cards; defaults for CSVs without one"""
+    return job['org_config'] or {
+        'name': job['name'],
+        'full_name': job['name'],
+        'description': '',
+        'color_primary': '#667eea',
+        'color_secondary': '#764ba2',
+        'year': '',
+    }
+
+
+def job_results(job, chunksize=DEFAULT_CHUNKSIZE, html=None):
+    """
+    Metrics of a job and, with html, its static recap page.
+
+    Returns:
+        tuple: (metrics, page), page being None without html
+    """
+    if html:
+        # The recap needs every row for contributor profiles, so the source is loaded in full
+        events = job_events(job)
+        metrics = build_cube(events).metrics()
+        page = render_html(metrics, RepoTable(metrics['repo_matrix']), ContributorIndex(events), job_branding(job),
+                           plotlyjs=html, banner_path=BANNER_PATH)
+        return metrics, page
+    if job['store']:
+        # The store already holds every export; only the org's year is read
+        return EventStore(job['source']).metrics(*year_range(job['org_config']['year'])), None
+    return aggregate_csv(job['source'], chunksize=chunksize).report(), None
+
+
+def run_job(job, output_dir, chunksize=DEFAULT_CHUNKSIZE, state_dir=None, html=None):
+    """
+    Compute one report and write it as JSON, and optionally as a static
+    HTML recap.
+
+    Runs in a worker process, so it takes and returns only picklable values.
+    With RESULT_CACHE_DIR set, results are shared by the source's
+    fingerprint, so rerunning on an unchanged export does not read it.
+
+    Args:
+        html (str): When set, also write <name>.html embedding plotly.js
+            'inline' or loading it from the 'cdn'. The recap needs every row
+            for contributor profiles, so the source is loaded in full.
+
+    Returns:
+        list: Paths of the written files
+    """
+    configure_logging()
+    if state_dir and not html and not job['store']:
+        metrics, page = process_incremental(
+            job['source'], os.path.join(state_dir, f"{job['name']}.state.json"), chunksize=chunksize).report(), None
+    else:
+        banner = file_fingerprint(BANNER_PATH) if html and os.path.exists(BANNER_PATH) else None
+        metrics, page = file_cached(job['source'], lambda: job_results(job, chunksize, html),
+                                    'run_job', html, job_branding(job), banner)
+
+    report = build_report(metrics, job['org_key'], job['org_config'], job['source'])
+    output_path = os.path.join(output_dir, f"{job['name']}.json")
+    with open(output_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    if not html:
+        return [output_path]
+
+    html_path = write_html(os.path.join(output_dir, f"{job['name']}.html"), page)
+    return [output_path, html_path]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate wrapped reports for one or more organizations.")
+    parser.add_argument('orgs', nargs='*', metavar='ORG',
+                        help=f"ORGANIZATIONS keys from config.py ({', '.join(ORGANIZATIONS)})")
+    parser.add_argument('--all', action='store_true', help="process every configured organization")
+    parser.add_argument('--csv-dir', help="also process every *.csv in this directory")
+    parser.add_argument('--data-dir', default=os.getenv('CSV_DATA_PATH', '.'),
+                        help="directory holding <name>_<year>.csv exports (default: $CSV_DATA_PATH or .)")
+    parser.add_argument('--output-dir', default='reports', help="where JSON reports are written (default: reports)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="parallel worker processes")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="rows read per chunk")
+    parser.add_argument('--state-dir', help="process exports incrementally, keeping watermark state here")
+    parser.add_argument('--html', nargs='?', const='inline', choices=['inline', 'cdn'],
+                        help="also write a static HTML recap per report, with plotly.js inline (default) "
+                             "or loaded from its CDN; loads each export in full")
+    args = parser.parse_args(argv)
+
+    unknown = [org for org in args.orgs if org not in ORGANIZATIONS]
+    if unknown:
+        parser.error(f"unknown organization(s): {', '.join(unknown)}")
+    if args.all:
+        args.orgs = list(ORGANIZATIONS)
+    if not args.orgs and not args.csv_dir:
+        parser.error("give at least one ORG, --all or --csv-dir")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure_logging()
+    jobs = plan_jobs(args.orgs, args.csv_dir, args.data_dir)
+
+    missing = [job['source'] for job in jobs if not os.path.exists(job['source'])]
+    for path in missing:
+        print(f"Skipping missing export: {path}", file=sys.stderr)
+    jobs = [job for job in jobs if job['source'] not in missing]
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    if args.state_dir:
+        os.makedirs(args.state_dir, exist_ok=True)
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(jobs) or 1))) as pool:
+        futures = {pool.submit(run_job, job, args.output_dir, args.chunksize, args.state_dir, args.html): job
+                   for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                print(f"{job['name']}: {', '.join(future.result())}")
+            except Exception as e:
+                failures += 1
+                print(f"{job['name']}: failed: {e}", file=sys.stderr)
+
+    return 1 if failures or missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+import numpy as np
+import pandas as pd
+
+from disk_cache import disk_cached
+from instrumentation import instrumented
+from main import (REPO_METRICS, classifyEvents, calendarFromDaily, heatmapFromDaily, timeBucketsFromHourly,
+                  developerActivityFromCounts, weekdayFrequencyFromCounts, topContributorsFromCounts,
+                  getTopRepositories, RepoMatrix)
+
+# Day code of events without a timestamp; sorts before every real day
+NO_DAY = np.iinfo(np.int32).min
+
+
+class ActivityCube:
+    """
+    Event counts pre-aggregated by day, repository, event type and author.
+
+    `cells` holds one row per combination that occurs, sorted by day:
+    'day' (days since 1970-01-01, NO_DAY for events without a timestamp),
+    'repo' (index into `repos`, -1 when the title names none), 'event_type'
+    (index into REPO_METRICS, -1 when not recognized), 'author' (index into
+    `authors`), 'events' (number of messages), 'count' (commits for commit
+    pushes, else messages) and 'first' (position of the cell's first
+    message among the rows). `hours` holds messages per 'day' and 'hour'
+    for the time-of-day views.
+
+    Repositories and authors are interned in order of first appearance, so
+    every view comes out in the same order (ties included) as
+    computeMetrics on the rows. A window renumbers them by their first
+    appearance inside the window, matching computeMetrics on the rows that
+    fall in it.
+    """
+
+    def __init__(self, cells, hours, repos, authors):
+        self.cells = cells
+        self.hours = hours
+        self.repos = repos        # np.ndarray of repository names, by id
+        self.authors = authors    # pd.DataFrame of 'name' and 'login', by id
+
+    def __len__(self):
+        return len(self.cells)
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the cube, in bytes"""
+        return int(self.cells.memory_usage(deep=True).sum() + self.hours.memory_usage(deep=True).sum()
+                   + pd.Series(self.repos).memory_usage(deep=True) + self.authors.memory_usage(deep=True).sum())
+
+    def window(self, start, end):
+        """
+        The part of the cube between two dates (inclusive).
+
+        Cells are sorted by day, so this is a slice found by binary search.
+        Repositories and authors are then renumbered in order of their first
+        message inside the window, which is how computeMetrics on the
+        window's rows breaks ties between them.
+        """
+        cells = _day_slice(self.cells, start, end).copy()
+        first = cells['first'].to_numpy()
+
+        repo = cells['repo'].to_numpy()
+        known = repo >= 0
+        repo_ids = first_appearance(repo[known], first[known])
+        cells['repo'] = renumber(repo, repo_ids)
+        author_ids = first_appearance(cells['author'].to_numpy(), first)
+        cells['author'] = renumber(cells['author'].to_numpy(), author_ids)
+
+        return ActivityCube(cells.reset_index(drop=True), _day_slice(self.hours, start, end),
+                            self.repos[repo_ids], self.authors.iloc[author_ids].reset_index(drop=True))
+
+    @property
+    def total_events(self):
+        return int(self.cells['events'].sum())
+
+    def _dated(self):
+        return self.cells[self.cells['day'] != NO_DAY]
+
+    def daily(self):
+        """(active days as datetime64[D], events per day), sorted by day"""
+        dated = self._dated()
+        counts = dated.groupby('day', sort=True)['events'].sum()
+        return counts.index.to_numpy(dtype=np.int64).astype('datetime64[D]'), counts.to_numpy(dtype=np.int64)
+
+    def hourly(self):
+        """Events per hour of day, for hours with any"""
+        counts = np.bincount(self.hours['hour'].to_numpy(dtype=np.intp),
+                             weights=self.hours['events'].to_numpy(), minlength=24).astype(np.int64)
+        hourly = pd.Series(counts)
+        return hourly[hourly > 0]
+
+    def repo_matrix(self):
+        """RepoMatrix of the cube's repositories, in order of first appearance"""
+        classified = self.cells[self.cells['event_type'] >= 0]
+        event_type = classified['event_type'].to_numpy(dtype=np.intp)
+        count = classified['count'].to_numpy()
+        n_metrics = len(REPO_METRICS)
+        totals = np.bincount(event_type, weights=count, minlength=n_metrics).astype(np.int64)
+
+        known = classified['repo'].to_numpy() >= 0
+        ids, repo = np.unique(classified['repo'].to_numpy()[known], return_inverse=True)
+        cells = repo * n_metrics + event_type[known]
+        counts = np.bincount(cells, weights=count[known], minlength=len(ids) * n_metrics).astype(np.int64)
+        return RepoMatrix(self.repos[ids], counts, totals)
+
+    def author_counts(self, column):
+        """Events per distinct value of an authors column, in order of first appearance"""
+        per_author = self.cells.groupby('author', sort=True)['events'].sum()
+        values = self.authors[column].iloc[per_author.index.to_numpy()]
+        counts = pd.Series(per_author.to_numpy(), index=values.to_numpy())
+        counts = counts[pd.notna(counts.index)]
+        return counts.groupby(level=0, sort=False).sum()
+
+    @instrumented
+    def metrics(self, top_n=5):
+        """
+        Compute the dashboard metrics from the cube.
+
+        Returns:
+            dict: Same keys and values as computeMetrics
+        """
+        days, daily_counts = self.daily()
+        calendar_metrics = calendarFromDaily(days, daily_counts, top_n=top_n)
+
+        daily = pd.Series(daily_counts, index=pd.DatetimeIndex(days))
+        month_wise_activity = daily.groupby(daily.index.to_period('M')).sum()
+        month_wise_activity.index.name = 'month'
+        daily_activity = pd.Series(daily_counts, index=days.astype(object))
+
+        weekday = np.bincount((days.view(np.int64) + 3) % 7, weights=daily_counts, minlength=7).astype(np.int64)
+        weekday = pd.Series(weekday)
+        hourly = self.hourly()
+
+        repo_matrix = self.repo_matrix()
+        developers = self.author_counts('login')
+
+        return {
+            'total_active_days': calendar_metrics['total_active_days'],
+            'longest_gap': calendar_metrics['longest_gap'],
+            'busiest_day': calendar_metrics['busiest_day'],
+            'longest_streak': calendar_metrics['longest_streak'],
+            'top_streaks': calendar_metrics['top_streaks'],
+            'top_gaps': calendar_metrics['top_gaps'],
+            'month_wise_activity': month_wise_activity,
+            'time_wise_activity': timeBucketsFromHourly(hourly),
+            'developer_activity': developerActivityFromCounts(developers),
+            'repo_matrix': repo_matrix,
+            'top_repos': getTopRepositories(repo_matrix, limit=10),
+            'commit_frequency': weekdayFrequencyFromCounts(weekday[weekday > 0]),
+            'hourly_activity': hourly,
+            'daily_activity': daily_activity,
+            'activity_heatmap': heatmapFromDaily(days, daily_counts),
+            'contributor_stats': topContributorsFromCounts(self.author_counts('name')),
+            'total_events': self.total_events,
+        }
+
+
+@instrumented
+@disk_cached
+def build_cube(data):
+    """
+    Aggregate an event table into a cube.
+
+    Args:
+        data (pd.DataFrame): Event table from normalize_events (titles
+            already classified, as in an EventTimeline, are reused)
+
+    Returns:
+        ActivityCube: Counts of every event in the table
+    """
+    if 'event_type' in data.columns:
+        events = data[['event_type', 'repo', 'count']]
+    else:
+        events = classifyEvents(data['embeds.0.title'])
+
+    timestamps = data['timestamp']
+    day = timestamps.to_numpy().astype('datetime64[D]').view(np.int64)
+    day = np.where(timestamps.isna().to_numpy(), NO_DAY, day).astype(np.int32)
+    hour = timestamps.dt.hour.fillna(-1).to_numpy(dtype=np.int8)
+
+    event_type = events['event_type'].to_numpy(dtype=np.int8)
+    repo_names = events['repo'].where(event_type >= 0)
+    repo, repos = pd.factorize(repo_names, sort=False)
+
+    names = data['embeds.0.author.name'].astype(object)
+    urls = data['embeds.0.author.url'].astype(object)
+    author = pd.DataFrame({'name': names, 'url': urls}).groupby(
+        ['name', 'url'], sort=False, dropna=False).ngroup().to_numpy(dtype=np.int32)
+    first_rows = np.unique(author, return_index=True)[1]
+    authors = pd.DataFrame({
+        'name': names.iloc[first_rows].to_numpy(),
+        'login': author_logins(urls.iloc[first_rows]),
+    })
+
+    rows = pd.DataFrame({
+        'day': day, 'repo': repo.astype(np.int32), 'event_type': event_type,
+        'author': author, 'count': events['count'].to_numpy(dtype=np.int64),
+        'position': np.arange(len(data), dtype=np.int64),
+    })
+    cells = rows.groupby(['day', 'repo', 'event_type', 'author'], sort=False).agg(
+        events=('count', 'size'), count=('count', 'sum'), first=('position', 'min')).reset_index()
+    cells = cells.sort_values('day', kind='stable').reset_index(drop=True)
+
+    dated = day != NO_DAY
+    hours = pd.DataFrame({'day': day[dated], 'hour': hour[dated]}).groupby(
+        ['day', 'hour'], sort=True).size().rename('events').reset_index()
+    return ActivityCube(cells, hours, repos.to_numpy(dtype=object), authors)
+
+
+def author_logins(urls):
+    """GitHub login from each author URL; None for missing or blank URLs"""
+    urls = urls.astype(object)
+    logins = urls.where(urls.notna() & (urls.astype(str) != ''))
+    return logins.dropna().astype(str).str.split('/').str[-1].reindex(logins.index).to_numpy(dtype=object)
+
+
+def _day_slice(table, start, end):
+    """Rows of a day-sorted table between two dates (inclusive)"""
+    day = table['day'].to_numpy()
+    lo = np.searchsorted(day, _day_number(start), side='left')
+    hi = np.searchsorted(day, _day_number(end), side='right')
+    return table.iloc[lo:hi]
+
+
+def _day_number(day):
+    return int(pd.Timestamp(day).to_datetime64().astype('datetime64[D]').view(np.int64))
+
+
+def first_appearance(ids, first):
+    """Distinct ids ordered by the earliest `first` position among their cells"""
+    if len(ids) == 0:
+        return np.empty(0, dtype=np.int64)
+    earliest = pd.Series(first).groupby(ids, sort=False).min()
+    return earliest.sort_values(kind='stable').index.to_numpy(dtype=np.int64)
+
+
+def renumber(ids, order):
+    """Map ids to their position in `order`; ids not in it (-1) stay -1"""
+    positions = np.full(max(ids.max(initial=-1), order.max(initial=-1)) + 2, -1, dtype=np.int32)
+    positions[order] = np.arange(len(order), dtype=np.int32)
+    return positions[ids]
@@ -0,0 +1,313 @@
+"""
+On-disk cache of computed results, shared by every process on a machine.
+
+Several dashboard workers (or CLI runs) loading the same export would each
+compute the same cube and metrics. With RESULT_CACHE_DIR set, functions
+decorated with disk_cached store their results there under a key derived
+from the content of their arguments and the source of the core modules, so
+whichever process computes a result first publishes it for the others.
+Loaders use file_cached instead, keyed by the fingerprint of the export
+they read, so a hit skips reading and parsing it.
+
+Entries are pickles written atomically. Each key is computed by one process
+at a time, while others wait for it and read its result (file locks, POSIX
+only; elsewhere concurrent misses just compute twice). The least recently
+used entries are removed once the directory holds more than
+RESULT_CACHE_DISK_MB. Only point RESULT_CACHE_DIR at a directory that
+untrusted users cannot write to, since entries are unpickled.
+"""
+import functools
+import glob
+import hashlib
+import inspect
+import os
+import pickle
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from cache import file_fingerprint
+from instrumentation import logger
+
+try:
+    import fcntl
+except ImportError:  # no file locks; concurrent misses may compute twice
+    fcntl = None
+
+ENTRY_SUFFIX = '.pkl'
+LOCK_STRIPES = 256
+# Temporary files of interrupted writes older than this are removed on eviction
+STALE_TMP_SECONDS = 3600
+
+
+def content_key(*parts):
+    """
+    SHA-256 of the content of some values.
+
+    DataFrames, Series, Indexes and arrays are hashed by their values (with
+    column names and dtypes), so equal data gives the same key wherever it
+    was loaded from. Containers are walked; anything else is hashed by repr.
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        _update(digest, part)
+    return digest.hexdigest()
+
+
+def _update(digest, value):
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr(('DataFrame', list(value.columns), len(value))).encode())
+        for _, column in value.items():
+            _update(digest, column)
+    elif isinstance(value, (pd.Series, pd.Index)):
+        digest.update(repr((type(value).__name__, value.name, str(value.dtype), len(value))).encode())
+        if pd.api.types.is_string_dtype(value.dtype) and not isinstance(value.dtype, pd.CategoricalDtype):
+            # Joining the text is several times faster than hashing each
+            # string; the lengths keep the boundaries (and missing values)
+            lengths = pd.Series(value).str.len().to_numpy(dtype=np.int64, na_value=-1)
+            digest.update(lengths.tobytes())
+            digest.update('\0'.join(pd.Series(value).fillna('').tolist()).encode('utf-8', 'surrogatepass'))
+        else:
+            digest.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr(('ndarray', str(value.dtype), value.shape)).encode())
+        _update(digest, pd.Series(value.ravel()))
+    elif isinstance(value, dict):
+        digest.update(b'dict')
+        for key in sorted(value, key=repr):
+            _update(digest, key)
+            _update(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(repr((type(value).__name__, len(value))).encode())
+        for item in value:
+            _update(digest, item)
+    else:
+        digest.update(repr(value).encode())
+    digest.update(b';')
+
+
+@functools.lru_cache(maxsize=1)
+def code_version():
+    """Hash of the core modules' source, so results computed by other code are never reused"""
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*.py'))):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    Size-bounded cache of pickled results in a local directory.
+
+    Entries live at <directory>/<key[:2]>/<key>.pkl. Reading an entry marks
+    it as recently used by touching its modification time, which eviction
+    goes by.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.join(directory, 'locks'), exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], key + ENTRY_SUFFIX)
+
+    @contextmanager
+    def _lock(self, name):
+        """Exclusive lock shared with other processes using the same directory"""
+        with open(os.path.join(self.directory, 'locks', name + '.lock'), 'a') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _key_lock(self, key, family=''):
+        # Keys share a fixed set of lock files, so lock files never pile up
+        return self._lock(f"{family}{int(key[:8], 16) % LOCK_STRIPES:03d}")
+
+    def get(self, key):
+        """
+        Read an entry.
+
+        Returns:
+            tuple: (True, value) on a hit, (False, None) when the entry is
+            missing or unreadable
+        """
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return False, None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # evicted meanwhile; the value read is still good
+        return True, value
+
+    def put(self, key, value):
+        """
+        Write an entry atomically, then evict least recently used entries
+        over budget. Failures are logged and otherwise ignored, since the
+        cache is only an optimization.
+        """
+        path = self.path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
+            self._remove(tmp_path)
+            return
+        self.evict(keep=path)
+
+    def get_or_compute(self, key, compute, lock_family=''):
+        """
+        Return the cached value, computing and publishing it on a miss.
+
+        Processes that miss on the same key at the same time wait for the
+        first one's result instead of computing it again. Keys of one
+        `lock_family` share lock files, so a computation may only call
+        get_or_compute for keys of another family.
+        """
+        found, value = self.get(key)
+        if found:
+            return value
+        with self._key_lock(key, lock_family):
+            found, value = self.get(key)
+            if not found:
+                value = compute()
+                self.put(key, value)
+        return value
+
+    def entries(self):
+        """(path, size, mtime) of every entry"""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '??', '*' + ENTRY_SUFFIX)):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def evict(self, keep=None):
+        """
+        Remove least recently used entries until the directory fits
+        max_bytes; `keep` is never removed. Temporary files left by writes
+        that were interrupted more than STALE_TMP_SECONDS ago are removed too.
+        """
+        with self._lock('evict'):
+            self._sweep_tmp()
+            entries = sorted(self.entries(), key=lambda entry: entry[2])
+            total = sum(size for _, size, _ in entries)
+            for path, size, _ in entries:
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                self._remove(path)
+                total -= size
+
+    def _sweep_tmp(self):
+        cutoff = time.time() - STALE_TMP_SECONDS
+        stale = 0
+        for path in glob.glob(os.path.join(self.directory, '??', '*' + ENTRY_SUFFIX + '.*.tmp')):
+            try:
+                if os.stat(path).st_mtime < cutoff:
+                    os.remove(path)
+                    stale += 1
+            except OSError:
+                continue
+        if stale:
+            logger.info(f"Removed {stale} stale temporary files from {self.directory}")
+
+    def clear(self):
+        with self._lock('evict'):
+            for path, _, _ in self.entries():
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+_caches = {}
+
+
+def default_cache():
+    """The DiskCache configured by RESULT_CACHE_DIR and RESULT_CACHE_DISK_MB, or None when unset"""
+    directory = os.getenv('RESULT_CACHE_DIR')
+    if not directory:
+        return None
+    max_bytes = int(os.getenv('RESULT_CACHE_DISK_MB', '2048')) * 1024 * 1024
+    if (directory, max_bytes) not in _caches:
+        _caches[(directory, max_bytes)] = DiskCache(directory, max_bytes)
+    return _caches[(directory, max_bytes)]
+
+
+def file_cached(path, compute, *parts):
+    """
+    Share a result computed from a file through the default DiskCache.
+
+    Unlike disk_cached, the key covers the file's fingerprint (absolute
+    path, modification time and size) rather than its content, with
+    code_version() and `parts`, so a hit skips reading the file. These keys
+    lock their own family, so `compute` may call disk_cached functions.
+    Without RESULT_CACHE_DIR, `compute` is called as-is.
+
+    Args:
+        path (str): File the result is computed from
+        compute (callable): Zero-argument function producing the result
+        *parts: Anything else the result depends on
+
+    Returns:
+        The cached or freshly computed result
+    """
+    cache = default_cache()
+    if cache is None:
+        return compute()
+    key = content_key(code_version(), 'file', file_fingerprint(path), parts)
+    return cache.get_or_compute(key, compute, lock_family='file')
+
+
+def disk_cached(func):
+    """
+    Share a function's results through the default DiskCache.
+
+    The key covers the function, every argument (defaults included) and
+    code_version(). Without RESULT_CACHE_DIR the function is called as-is.
+    Decorated functions must not call one another: keys share lock files,
+    so a nested call could wait on a lock its caller holds.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = default_cache()
+        if cache is None:
+            return func(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = content_key(code_version(), func.__module__, func.__qualname__, bound.arguments)
+        return cache.get_or_compute(key, lambda: func(*args, **kwargs))
+    return wrapper
@@ -0,0 +1,148 @@
+import contextvars
+import functools
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+logger = logging.getLogger('wrapped')
+
+# Trace collecting records for the current thread/task, if any
+_current_trace = contextvars.ContextVar('wrapped_trace', default=None)
+# Stack of open instrumented calls, used to nest peak-memory measurements
+_open_calls = contextvars.ContextVar('wrapped_open_calls', default=())
+
+
+class Trace:
+    """Timing records collected while a collect_trace() block is active"""
+
+    def __init__(self):
+        self.records = []
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.records, **kwargs)
+
+
+@contextmanager
+def collect_trace():
+    """
+    Collect a record for every instrumented call made inside the block.
+
+    Yields:
+        Trace: Filled in as instrumented functions return
+    """
+    trace = Trace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+def start_memory_tracking():
+    """Start tracemalloc so instrumented calls also record peak allocation"""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def stop_memory_tracking():
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def configure_logging(level=None):
+    """
+    Send the 'wrapped' logger's structured lines to stderr.
+
+    Args:
+        level (str): Logging level; defaults to $WRAPPED_LOG_LEVEL or WARNING.
+            INFO emits one JSON line per instrumented call, DEBUG also the
+            metric results that used to be printed.
+    """
+    level = level or os.getenv('WRAPPED_LOG_LEVEL', 'WARNING')
+    logger.setLevel(level.upper())
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.propagate = False
+    if os.getenv('WRAPPED_TRACE_MEMORY'):
+        start_memory_tracking()
+
+
+def _rows(args, result):
+    """Length of the table (or other sized input) a call worked on, if any"""
+    if args and hasattr(args[0], '__len__') and not isinstance(args[0], (str, bytes)):
+        return len(args[0])
+    if hasattr(result, 'shape'):
+        return len(result)
+    return None
+
+
+class _Call:
+    __slots__ = ('start_memory', 'child_peak')
+
+    def __init__(self, start_memory):
+        self.start_memory = start_memory
+        self.child_peak = 0
+
+
+def instrumented(func):
+    """
+    Record wall time, rows processed and peak allocation of each call.
+
+    Rows are the length of the first argument (the event table for metrics,
+    the cube or repository matrix for their methods), else of the table
+    returned. Peak allocation is only measured while tracemalloc is
+    tracing; nested instrumented calls each get their own peak without
+    hiding it from the caller. Records go to the active collect_trace()
+    block and to the 'wrapped' logger as one JSON line at INFO level.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        trace = _current_trace.get()
+        if trace is None and not logger.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+
+        tracing_memory = tracemalloc.is_tracing()
+        call = None
+        calls = _open_calls.get()
+        if tracing_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if calls:
+                calls[-1].child_peak = max(calls[-1].child_peak, peak)
+            tracemalloc.reset_peak()
+            call = _Call(current)
+        token = _open_calls.set(calls + (call,))
+        # Appended up front so records read in call order, callers first
+        record = {'name': func.__qualname__}
+        if trace is not None:
+            trace.records.append(record)
+
+        result = None
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            seconds = time.perf_counter() - start
+            _open_calls.reset(token)
+            peak_bytes = None
+            if tracing_memory and tracemalloc.is_tracing():
+                peak = max(tracemalloc.get_traced_memory()[1], call.child_peak)
+                peak_bytes = max(0, peak - call.start_memory)
+                if calls and calls[-1] is not None:
+                    calls[-1].child_peak = max(calls[-1].child_peak, peak)
+
+            record.update({
+                'seconds': round(seconds, 6),
+                'rows': _rows(args, result),
+                'peak_bytes': peak_bytes,
+                'depth': len(calls),
+            })
+            logger.info(json.dumps({'event': 'metric', **record}))
+
+    return wrapper
@@ -1,318 +1,531 @@
+import calendar
+import re
+import threading
+
 import pandas as pd
 import numpy as np
 
+from disk_cache import disk_cached
+from instrumentation import configure_logging, instrumented, logger
 
-def clean_data(path):
-    data = pd.read_csv(path)
-    # data.drop(["author.bot", "author.avatar", "author.discriminator", "author.global_name", "author.id", "author.username", "call", "channel_id", "components", "content", "edited_timestamp", "embeds.0.author.icon_url", "embeds.0.author.proxy_icon_url", "embeds.0.color", "embeds.0.content_scan_version", "embeds.0.type",
-    #           "flags", "interaction", "mention_everyone", "mentions", "message_reference", "nonce", "pinned", "position", "reactions", "referenced_message", "resolved", "role_subscription_data", "sticker_items", "stickers", "thread", "tts", "type", "userName", "webhook_id", "mention_channels"], axis=1, inplace=True)
-    # # Select columns from index 10 to 56 (inclusive)
-    # cols_to_drop = data.columns[8:57]
-    # data.drop(cols_to_drop, axis=1, inplace=True)
-    return data
 
+# Columns of a Discrub export that the metrics actually read, with the dtype
+# each is loaded as. Author names and URLs repeat heavily, so they are
+# stored as categories; timestamps stay strings until normalize_events.
+EVENT_SCHEMA = {
+    'timestamp': 'string',
+    'embeds.0.title': 'string',
+    'embeds.0.author.name': 'category',
+    'embeds.0.author.url': 'category',
+}
+EVENT_COLUMNS = list(EVENT_SCHEMA)
 
-def totalActiveDays(data):
-    data['timestamp'] = pd.to_datetime(
-        data['timestamp'], format='ISO8601', errors='coerce')
-    data['date'] = pd.to_datetime(data['timestamp']).dt.date
 
-    data = data.dropna(subset=['date'])
-    unique_dates = data['date'].unique()
-    print(f"Total Active Days: {len(unique_dates)}")
-    return len(unique_dates)
+@instrumented
+def clean_data(path, chunksize=None):
+    """
+    Load a Discrub CSV export, keeping only the columns the metrics use.
+
+    Discord message columns the metrics never read (components, stickers,
+    reactions, ...) are skipped while parsing instead of being loaded and
+    dropped afterwards.
+
+    Args:
+        path (str or file-like): CSV export to read
+        chunksize (int): When given, return an iterator of DataFrames with
+            at most this many rows each instead of one DataFrame
+
+    Returns:
+        pd.DataFrame: EVENT_COLUMNS typed according to EVENT_SCHEMA (or an
+        iterator of such frames when chunksize is set)
+
+    Raises:
+        ValueError: If the export is missing any of EVENT_COLUMNS
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    missing = [column for column in EVENT_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(
+            f"CSV is missing required column(s): {', '.join(missing)}. "
+            f"Expected {', '.join(EVENT_COLUMNS)}; found {len(header)} column(s): {', '.join(header[:20])}"
+            + (", ..." if len(header) > 20 else ""))
+
+    if hasattr(path, 'seek'):
+        path.seek(0)
+    if chunksize:
+        return (chunk[EVENT_COLUMNS] for chunk in
+                pd.read_csv(path, usecols=EVENT_COLUMNS, dtype=EVENT_SCHEMA, chunksize=chunksize))
+    return pd.read_csv(path, usecols=EVENT_COLUMNS, dtype=EVENT_SCHEMA)[EVENT_COLUMNS]
+
+
+@instrumented
+def normalize_events(data):
+    """
+    Build the normalized event table every metric works on.
 
+    Timestamps are parsed exactly once (to naive UTC) and the calendar
+    columns the metrics group by are derived from them up front.
 
+    Args:
+        data (pd.DataFrame): Raw activity data as loaded from the CSV
+
+    Returns:
+        pd.DataFrame: Copy of the data with a parsed 'timestamp' column and
+        'date', 'hour', 'weekday' and 'month' columns
+    """
+    events = data.copy()
+    events['timestamp'] = pd.to_datetime(
+        events['timestamp'], format='ISO8601', errors='coerce', utc=True).dt.tz_convert(None)
+    events['date'] = events['timestamp'].dt.normalize()
+    events['hour'] = events['timestamp'].dt.hour
+    events['weekday'] = events['timestamp'].dt.dayofweek
+    events['month'] = events['timestamp'].dt.to_period('M')
+    return events
+
+
+def dailyCounts(data):
+    """
+    Events per active day, built in one pass over the event table.
+
+    Args:
+        data (pd.DataFrame): Event table from normalize_events
+
+    Returns:
+        tuple: (active days as a sorted datetime64[D] array, np.ndarray of
+        event counts per day)
+    """
+    days = data['date'].dropna().to_numpy().astype('datetime64[D]').view(np.int64)
+    if len(days) == 0:
+        return np.empty(0, dtype='datetime64[D]'), np.empty(0, dtype=np.int64)
+    first = days.min()
+    counts = np.bincount(days - first)
+    offsets = np.flatnonzero(counts)
+    return (offsets + first).astype('datetime64[D]'), counts[offsets]
+
+
+def calendarFromDaily(days, counts, top_n=5):
+    """
+    Calendar metrics from per-day event counts, computed together.
+
+    Gaps are runs of inactive days between consecutive active days; streaks
+    are runs of consecutive active days, measured in day-to-day steps (so two
+    active days in a row are a streak of 1). Ties go to the earliest run.
+
+    Args:
+        days (np.ndarray): Sorted unique active days (datetime64[D])
+        counts (np.ndarray): Events on each of those days
+        top_n (int): Number of longest streaks and gaps to list
+
+    Returns:
+        dict: 'total_active_days', 'longest_gap', 'longest_streak' and
+        'busiest_day' as returned by the individual metrics, plus
+        'top_streaks' and 'top_gaps' as lists of [length, start, end],
+        longest first
+    """
+    dates = days.astype(object)
+    steps = np.diff(days).astype(np.int64)
+
+    # Gaps: every step of more than one day, longest (then earliest) first
+    gaps = steps - 1
+    gap_positions = np.flatnonzero(gaps > 0)
+    gap_positions = gap_positions[np.argsort(-gaps[gap_positions], kind='stable')]
+    top_gaps = [[int(gaps[i]), dates[i], dates[i + 1]] for i in gap_positions[:max(top_n, 1)]]
+
+    # Streaks: runs of one-day steps, found from the edges of the run mask
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], steps == 1, [0])).astype(np.int8)))
+    run_starts, run_ends = edges[::2], edges[1::2]
+    run_lengths = run_ends - run_starts
+    order = np.argsort(-run_lengths, kind='stable')
+    top_streaks = [[int(run_lengths[i]), dates[run_starts[i]], dates[run_ends[i]]] for i in order[:max(top_n, 1)]]
+
+    if len(counts):
+        busiest = int(np.argmax(counts))
+        busiest_day = [dates[busiest], counts[busiest]]
+    else:
+        busiest_day = [None, 0]
+
+    return {
+        'total_active_days': len(days),
+        'longest_gap': top_gaps[0] if top_gaps else [0, None, None],
+        'longest_streak': top_streaks[0] if top_streaks else [0, None, None],
+        'busiest_day': busiest_day,
+        'top_streaks': top_streaks[:top_n],
+        'top_gaps': top_gaps[:top_n],
+    }
+
+
+@instrumented
+def calendarMetrics(data, top_n=5):
+    """
+    Active days, longest gap and streak, busiest day and the top-N streaks
+    and gaps of an event table, from a single pass over its dates.
+
+    Args:
+        data (pd.DataFrame): Event table from normalize_events
+        top_n (int): Number of longest streaks and gaps to list
+
+    Returns:
+        dict: See calendarFromDaily
+    """
+    return calendarFromDaily(*dailyCounts(data), top_n=top_n)
+
+
+def heatmapFromDaily(days, counts):
+    """
+    Weekday x week grid of event counts, for any range of days.
+
+    Weeks start on Monday and are laid out consecutively from the first
+    active day's week to the last one's, so multi-year data gets one column
+    per calendar week rather than folding years onto the same week number.
+
+    Args:
+        days (np.ndarray): Sorted unique active days (datetime64[D])
+        counts (np.ndarray): Events on each of those days
+
+    Returns:
+        pd.DataFrame: Rows Monday..Sunday, one column per week labelled with
+        its Monday; days before the first or after the last active day are NaN
+    """
+    if len(days) == 0:
+        return pd.DataFrame(index=list(calendar.day_name), columns=pd.DatetimeIndex([]), dtype=float)
+
+    day_numbers = days.view(np.int64)
+    # 1970-01-01 (day 0) was a Thursday, so Monday-based weekday is (day + 3) % 7
+    first_monday = day_numbers[0] - (day_numbers[0] + 3) % 7
+    offsets = day_numbers - first_monday
+    n_weeks = offsets[-1] // 7 + 1
+
+    grid = np.bincount(offsets, weights=counts, minlength=n_weeks * 7).reshape(n_weeks, 7).T
+    cell_offsets = np.arange(n_weeks * 7).reshape(n_weeks, 7).T
+    grid[(cell_offsets < offsets[0]) | (cell_offsets > offsets[-1])] = np.nan
+
+    week_starts = (first_monday + 7 * np.arange(n_weeks)).astype('datetime64[D]')
+    return pd.DataFrame(grid, index=list(calendar.day_name), columns=pd.DatetimeIndex(week_starts, name='week'))
+
+
+@instrumented
+def activityHeatmap(data):
+    """Weekday x week activity grid of an event table; see heatmapFromDaily"""
+    return heatmapFromDaily(*dailyCounts(data))
+
+
+@instrumented
+def totalActiveDays(data):
+    total_active_days = calendarMetrics(data, top_n=0)['total_active_days']
+    logger.debug(f"Total Active Days: {total_active_days}")
+    return total_active_days
+
+
+@instrumented
 def longestGap(data):
-    longestGap = 0
-    gap = 0
-    start_date = None
-    end_date = None
-
-    data['timestamp'] = pd.to_datetime(
-        data['timestamp'], format='ISO8601', errors='coerce')
-    data['date'] = pd.to_datetime(data['timestamp']).dt.date
-
-    data = data.dropna(subset=['date'])
-    unique_dates = sorted(data['date'].unique())
-
-    for i in range(1, len(unique_dates)):
-        current_gap = (unique_dates[i] - unique_dates[i - 1]).days - 1
-        if current_gap > 0:
-            gap = current_gap
-            if gap > longestGap:
-                longestGap = gap
-                start_date = unique_dates[i - 1]
-                end_date = unique_dates[i]
-        else:
-            gap = 0
+    longestGap, start_date, end_date = calendarMetrics(data, top_n=0)['longest_gap']
 
-    print(f"Longest Gap: {longestGap}")
-    print(f"Start Date: {start_date}")
-    print(f"End Date: {end_date}")
+    logger.debug(f"Longest Gap: {longestGap} ({start_date} to {end_date})")
 
     return [longestGap, start_date, end_date]
 
 
+@instrumented
 def busiestDay(data):
-    data['timestamp'] = pd.to_datetime(
-        data['timestamp'], format='ISO8601', errors='coerce')
-    data['date'] = pd.to_datetime(data['timestamp']).dt.date
-    busiest_day = data['date'].value_counts().idxmax()
-    busiest_day_count = data['date'].value_counts().max()
-    print(f"Busiest Day: {busiest_day}")
-    print(f"Total Messages: {busiest_day_count}")
+    busiest_day, busiest_day_count = calendarMetrics(data, top_n=0)['busiest_day']
+    logger.debug(f"Busiest Day: {busiest_day} ({busiest_day_count} messages)")
     return [busiest_day, busiest_day_count]
 
 
+@instrumented
 def longestStreak(data):
-    longestStreak = 0
-    streak = 0
-
-    data['timestamp'] = pd.to_datetime(
-        data['timestamp'], format='ISO8601', errors='coerce')
-    data['date'] = pd.to_datetime(data['timestamp']).dt.date
+    longestStreak, start_date, end_date = calendarMetrics(data, top_n=0)['longest_streak']
 
-    data = data.dropna(subset=['date'])
-    unique_dates = sorted(data['date'].unique())
-
-    for i in range(1, len(unique_dates)):
-        if (unique_dates[i] - unique_dates[i - 1]).days == 1:
-            if streak == 0:
-                temp_start_date = unique_dates[i - 1]
-            streak += 1
-        else:
-            if streak > longestStreak:
-                longestStreak = streak
-                start_date = temp_start_date
-                end_date = unique_dates[i - 1]
-            streak = 0
-            temp_start_date = None
-
-    if streak > longestStreak:
-        longestStreak = streak
-        start_date = temp_start_date
-        end_date = unique_dates[-1]
-
-    print(f"Longest Streak: {longestStreak}")
-    print(f"Start Date: {start_date}")
-    print(f"End Date: {end_date}")
+    logger.debug(f"Longest Streak: {longestStreak} ({start_date} to {end_date})")
 
     return [longestStreak, start_date, end_date]
 
 
+@instrumented
 def monthWiseActivity(data):
-    data['timestamp'] = pd.to_datetime(
-        data['timestamp'], format='ISO8601', errors='coerce')
-    data['month'] = pd.to_datetime(data['timestamp']).dt.to_period('M')
     month_wise_activity = data.groupby('month').size()
-    print(month_wise_activity)
+    logger.debug("Month-wise activity:\n%s", month_wise_activity)
     return month_wise_activity
 
 
+def timeBucketsFromHourly(hourly_counts):
+    """Sum event counts per hour of day into four-hour buckets"""
+    return hourly_counts.groupby(pd.cut(hourly_counts.index, np.arange(0, 25, 4))).sum()
+
+
+@instrumented
 def timeWiseActivity(data):
-    data['timestamp'] = pd.to_datetime(
-        data['timestamp'], format='ISO8601', errors='coerce')
-    data['hour'] = pd.to_datetime(data['timestamp']).dt.hour
-    time_wise_activity = data.groupby('hour').size()
-    time_wise_activity = time_wise_activity.groupby(
-        pd.cut(time_wise_activity.index, np.arange(0, 25, 4))).sum()
-    print(time_wise_activity)
+    time_wise_activity = timeBucketsFromHourly(data.groupby('hour').size())
+    logger.debug("Time-wise activity:\n%s", time_wise_activity)
     return time_wise_activity
 
 
+def developerCounts(data):
+    """
+    Count events per GitHub login, taken from the author URL.
+
+    Args:
+        data (pd.DataFrame): Event table from normalize_events
+
+    Returns:
+        pd.Series: Events per login, in order of first appearance
+    """
+    urls = data['embeds.0.author.url'].dropna().astype(str)
+    dev_names = urls[urls != ''].str.split('/').str[-1]
+    return dev_names.groupby(dev_names, sort=False).size()
+
+
+def developerActivityFromCounts(counts):
+    """
+    Shape per-login counts into allDeveloperActivity's return value.
+
+    Args:
+        counts (pd.Series): Events per login, in order of first appearance
+
+    Returns:
+        list: [login -> events, most active first, most active login]; the
+        login is None when no event has an author URL
+    """
+    # Most active first; ties keep the order developers first appear in
+    counts = counts.sort_values(ascending=False, kind='stable')
+    developer_activity = dict(zip(counts.index, counts.tolist()))
+    return [developer_activity, next(iter(developer_activity), None)]
+
+
+@instrumented
 def allDeveloperActivity(data):
-    developer_activity = {}
+    developer_activity, most_active_developer = developerActivityFromCounts(developerCounts(data))
+    logger.debug(f"Developers: {len(developer_activity)}, most active: {most_active_developer}")
+
+    return [developer_activity, most_active_developer]
+
+
+# Per-repository counters, in the order repoActivity reports them. An event
+# type code is the index of its counter in this list.
+REPO_METRICS = ['stars', 'issues_opened', 'issues_resolved', 'pr_opened', 'pr_closed', 'commits',
+                'branches', 'forks', 'actions_success', 'action_failures', 'new_collaborator', 'comments']
+
+# Repository name extraction for the three webhook title layouts
+_ORG_REPO = re.compile(r'^[^\]/]*/([^\]/]*)')      # "[org/repo] New star added"
+_BRACKET_REPO = re.compile(r'^.([^\]]*)\]')        # "[repo] GitHub Actions checks success"
+_BRANCH_REPO = re.compile(r'^.([^:]*)')             # "[repo:branch] 3 new commits"
+_COMMIT_COUNT = re.compile(r'^[^ ]* ([^ ]*)')
+
+
+def _any_of(*phrases):
+    return re.compile('|'.join(re.escape(phrase) for phrase in phrases))
+
 
-    data['embeds.0.author.url'] = data['embeds.0.author.url'].fillna('')
+# Title rules in priority order: the first rule whose pattern matches wins
+EVENT_RULES = [
+    ('stars', _any_of('New star added'), _ORG_REPO),
+    ('new_collaborator', _any_of('New collaborator added'), _ORG_REPO),
+    ('branches', _any_of('New branch created'), _ORG_REPO),
+    ('comments', _any_of('New comment on', 'New review comment'), _ORG_REPO),
+    ('forks', _any_of('Fork created'), _ORG_REPO),
+    ('issues_opened', _any_of('Issue opened'), _ORG_REPO),
+    ('issues_resolved', _any_of('Issue closed'), _ORG_REPO),
+    ('actions_success', _any_of('GitHub Actions checks success', 'commitlint success', 'deploy-main success',
+                                'Deployed successfully', 'create_commit success', 'Lint Code Base success'), _BRACKET_REPO),
+    ('action_failures', _any_of('GitHub Actions checks failure', 'commitlint failure', 'deploy-main failure',
+                                'Deploy failed', 'Deploy failure', 'Lint Code Base failure'), _BRACKET_REPO),
+    ('pr_opened', _any_of('Pull request opened'), _ORG_REPO),
+    ('pr_closed', _any_of('Pull request closed'), _ORG_REPO),
+    ('commits', _any_of('new commit'), _BRANCH_REPO),
+]
 
-    for url in data['embeds.0.author.url']:
-        if url != '':
-            dev_name = url.split('/')[-1]
-            if dev_name in developer_activity:
-                developer_activity[dev_name] += 1
-            else:
-                developer_activity[dev_name] = 1
 
-    developer_activity = dict(
-        sorted(developer_activity.items(), key=lambda item: item[1], reverse=True))
-    for key, value in developer_activity.items():
-        print(f"{key}: {value}")
-    print("Most Active Developer: ", list(developer_activity.keys())[0])
+@instrumented
+def classifyEvents(titles):
+    """
+    Classify webhook titles into event types and repository names.
+
+    Each rule is matched once over the titles not claimed by an earlier rule,
+    so the whole column is classified with vectorized string operations.
+
+    Args:
+        titles (pd.Series): The 'embeds.0.title' column
+
+    Returns:
+        pd.DataFrame: Aligned with titles; 'event_type' (index into
+        REPO_METRICS, -1 for unrecognised titles), 'repo' and 'count'
+        (number of commits for commit pushes, 1 otherwise)
+    """
+    titles = titles.fillna('').astype(str)
+    event_type = np.full(len(titles), -1, dtype=np.int8)
+    repo = np.full(len(titles), None, dtype=object)
+    count = np.ones(len(titles), dtype=np.int64)
+    unmatched = np.flatnonzero(titles.to_numpy() != '')
+
+    for metric, pattern, repo_pattern in EVENT_RULES:
+        if len(unmatched) == 0:
+            break
+        candidates = titles.iloc[unmatched]
+        hits = candidates.str.contains(pattern).to_numpy()
+        if not hits.any():
+            continue
+        matched = candidates[hits]
+        positions = unmatched[hits]
+        event_type[positions] = REPO_METRICS.index(metric)
+        repo[positions] = matched.str.extract(repo_pattern, expand=False).to_numpy()
+        if metric == 'commits':
+            count[positions] = pd.to_numeric(
+                matched.str.extract(_COMMIT_COUNT, expand=False), errors='coerce').fillna(0).to_numpy()
+        unmatched = unmatched[~hits]
 
-    return [developer_activity, list(developer_activity.keys())[0]]
+    return pd.DataFrame({'event_type': event_type, 'repo': repo, 'count': count}, index=titles.index)
 
 
+class RepoMatrix:
+    """
+    Per-repository activity as interned repository ids and a dense matrix.
+
+    Repository names are stored once, in order of first appearance; a
+    repository's id is its position in `repos` and its row in `counts`, an
+    int64 matrix of repos x REPO_METRICS. Totals include events whose
+    repository could not be parsed, so they can exceed the column sums.
+    """
+
+    def __init__(self, repos, counts, totals):
+        self.repos = np.asarray(repos, dtype=object)
+        self.counts = np.asarray(counts, dtype=np.int64).reshape(len(self.repos), len(REPO_METRICS))
+        self.totals = np.asarray(totals, dtype=np.int64)
+        self._activity = None
+        self._ids = None
+
+    def __len__(self):
+        return len(self.repos)
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the matrix, in bytes"""
+        return int(pd.Series(self.repos).memory_usage(deep=True) + self.counts.nbytes + self.totals.nbytes)
+
+    @property
+    def activity(self):
+        """Total events per repository, by id"""
+        if self._activity is None:
+            self._activity = self.counts.sum(axis=1)
+        return self._activity
+
+    def id(self, repo):
+        """Id of a repository by name, or None if it has no activity"""
+        if self._ids is None:
+            self._ids = {name: i for i, name in enumerate(self.repos)}
+        return self._ids.get(repo)
+
+    def top(self, limit=10):
+        """
+        Ids of the most active repositories, most active first.
+
+        Only the top `limit` are sorted (found with np.argpartition); ties keep
+        the order in which repositories first appear.
+        """
+        activity = self.activity
+        if limit >= len(activity):
+            candidates = np.arange(len(activity))
+        elif limit <= 0:
+            return np.empty(0, dtype=np.intp)
+        else:
+            # Everything above the limit-th largest value, then the earliest
+            # repositories tied with it
+            threshold = activity[np.argpartition(-activity, limit - 1)[limit - 1]]
+            above = np.flatnonzero(activity > threshold)
+            tied = np.flatnonzero(activity == threshold)[:limit - len(above)]
+            candidates = np.concatenate((above, tied))
+        return candidates[np.lexsort((candidates, -activity[candidates]))]
+
+    def top_repositories(self, limit=10):
+        """Top repositories as getTopRepositories returns them"""
+        return [(self.repos[i], dict(zip(REPO_METRICS, self.counts[i].tolist()))) for i in self.top(limit)]
+
+    def to_frame(self):
+        """Repos x REPO_METRICS DataFrame backed by the count matrix"""
+        return pd.DataFrame(self.counts, index=pd.Index(self.repos, name='repository'),
+                            columns=REPO_METRICS, copy=False)
+
+    def to_dict(self):
+        """Repository name -> {metric: count}, as in repoActivity's first element"""
+        return {repo: dict(zip(REPO_METRICS, row)) for repo, row in zip(self.repos.tolist(), self.counts.tolist())}
+
+
+@instrumented
+def buildRepoMatrix(data):
+    """
+    Count repository events per metric.
+
+    Args:
+        data (pd.DataFrame): Event table from normalize_events
+
+    Returns:
+        RepoMatrix: Repositories in order of first appearance in the export
+    """
+    if 'event_type' in data.columns:
+        # Already classified, as in an EventTimeline window
+        events = data[['event_type', 'repo', 'count']]
+    else:
+        events = classifyEvents(data['embeds.0.title'])
+    events = events[events['event_type'] >= 0]
+    event_type = events['event_type'].to_numpy(dtype=np.intp)
+    count = events['count'].to_numpy(dtype=np.int64)
+    n_metrics = len(REPO_METRICS)
+
+    totals = np.bincount(event_type, weights=count, minlength=n_metrics).astype(np.int64)
+
+    # Intern repository names; events without one get code -1 and are dropped
+    repo_ids, repos = pd.factorize(events['repo'], sort=False)
+    known = repo_ids >= 0
+    cells = repo_ids[known] * n_metrics + event_type[known]
+    counts = np.bincount(cells, weights=count[known], minlength=len(repos) * n_metrics).astype(np.int64)
+    return RepoMatrix(repos.to_numpy(dtype=object), counts, totals)
+
+
+@instrumented
 def repoActivity(data):
-    repo_activity = {}
-    data['embeds.0.title'] = data['embeds.0.title'].fillna('')
-    stars, issues_opened, issues_resolved, pr_opened, pr_closed, commits, branches, forks, actions_success, action_failures, new_collaborator, comments = 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
-    for title in data['embeds.0.title']:
-        if title != '':
-            if ('New star added' in title):
-                stars += 1
-                repoName = title.split(']')[0].split('/')[1]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['stars'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 1, 'issues_opened': 0, 'issues_resolved': 0, 'pr_opened': 0, 'pr_closed': 0, 'commits': 0,
-                                               'branches': 0, 'forks': 0, 'actions_success': 0, 'action_failures': 0, 'new_collaborator': 0, 'comments': 0}
-            elif ('New collaborator added' in title):
-                new_collaborator += 1
-                repoName = title.split(']')[0].split('/')[1]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['new_collaborator'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 0, 'issues_resolved': 0, 'pr_opened': 0, 'pr_closed': 0, 'commits': 0,
-                                               'branches': 0, 'forks': 0, 'actions_success': 0, 'action_failures': 0, 'new_collaborator': 1, 'comments': 0}
-            elif ('New branch created' in title):
-                branches += 1
-                repoName = title.split(']')[0].split('/')[1]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['branches'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 0, 'issues_resolved': 0, 'pr_opened': 0, 'pr_closed': 0, 'commits': 0,
-                                               'branches': 1, 'forks': 0, 'actions_success': 0, 'action_failures': 0, 'new_collaborator': 0, 'comments': 0}
-            elif ('New comment on' in title):
-                comments += 1
-                repoName = title.split(']')[0].split('/')[1]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['comments'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 0, 'issues_resolved': 0, 'pr_opened': 0, 'pr_closed': 0, 'commits': 0,
-                                               'branches': 0, 'forks': 0, 'actions_success': 0, 'action_failures': 0, 'new_collaborator': 0, 'comments': 1}
-            elif ('New review comment' in title):
-                comments += 1
-                repoName = title.split(']')[0].split('/')[1]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['comments'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 0, 'issues_resolved': 0, 'pr_opened': 0, 'pr_closed': 0, 'commits': 0,
-                                               'branches': 0, 'forks': 0, 'actions_success': 0, 'action_failures': 0, 'new_collaborator': 0, 'comments': 1}
-            elif ('Fork created' in title):
-                forks += 1
-                repoName = title.split(']')[0].split('/')[1]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['forks'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 0, 'issues_resolved': 0, 'pr_opened': 0, 'pr_closed': 0, 'commits': 0,
-                                               'branches': 0, 'forks': 1, 'actions_success': 0, 'action_failures': 0, 'new_collaborator': 0, 'comments': 0}
-
-            elif ('Issue opened' in title):
-                issues_opened += 1
-                repoName = title.split(']')[0].split('/')[1]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['issues_opened'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 1, 'issues_resolved': 0, 'pr_opened': 0, 'pr_closed': 0, 'commits': 0,
-                                               'branches': 0, 'forks': 0, 'actions_success': 0, 'action_failures': 0, 'new_collaborator': 0, 'comments': 0}
-            elif ('Issue closed' in title):
-                issues_resolved += 1
-                repoName = title.split(']')[0].split('/')[1]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['issues_resolved'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 0, 'issues_resolved': 1, 'pr_opened': 0, 'pr_closed': 0, 'commits': 0,
-                                               'branches': 0, 'forks': 0, 'actions_success': 0, 'action_failures': 0, 'new_collaborator': 0, 'comments': 0}
-            elif ('GitHub Actions checks success' in title or 'commitlint success' in title or 'deploy-main success' in title or 'Deployed successfully' in title or 'create_commit success' in title or 'Lint Code Base success' in title):
-                actions_success += 1
-                repoName = title[1:title.index(']')]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['actions_success'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 0, 'issues_resolved': 0, 'pr_opened': 0, 'pr_closed': 0, 'commits': 0,
-                                               'branches': 0, 'forks': 0, 'actions_success': 1, 'action_failures': 0, 'new_collaborator': 0, 'comments': 0}
-            elif ('GitHub Actions checks failure' in title or 'commitlint failure' in title or 'deploy-main failure' in title or 'Deploy failed' in title or 'Deploy failure' in title or 'Lint Code Base failure' in title):
-                action_failures += 1
-                # here repo name is <name>
-                repoName = title[1:title.index(']')]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['action_failures'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 0, 'issues_resolved': 0, 'pr_opened': 0, 'pr_closed': 0, 'commits': 0,
-                                               'branches': 0, 'forks': 0, 'actions_success': 0, 'action_failures': 1, 'new_collaborator': 0, 'comments': 0}
-            elif ('Pull request opened' in title):
-                pr_opened += 1
-                repoName = title.split(']')[0].split('/')[1]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['pr_opened'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 0, 'issues_resolved': 0, 'pr_opened': 1, 'pr_closed': 0, 'commits': 0,
-                                               'branches': 0, 'forks': 0, 'actions_success': 0, 'action_failures': 0, 'new_collaborator': 0, 'comments': 0}
-            elif ('Pull request closed' in title):
-                pr_closed += 1
-                repoName = title.split(']')[0].split('/')[1]
-                if repoName in repo_activity:
-                    repo_activity[repoName]['pr_closed'] += 1
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 0, 'issues_resolved': 0, 'pr_opened': 0, 'pr_closed': 1, 'commits': 0,
-                                               'branches': 0, 'forks': 0, 'actions_success': 0, 'action_failures': 0, 'new_collaborator': 0, 'comments': 0}
-
-            elif ('new commit' in title):
-                repoName = title[1:].split(':')[0]
-                val = int(title.split(' ')[1])
-                commits += val
-                if repoName in repo_activity:
-                    repo_activity[repoName]['commits'] += val
-                else:
-                    repo_activity[repoName] = {'stars': 0, 'issues_opened': 0, 'issues_resolved': 0, 'pr_opened': 0, 'pr_closed': 0, 'commits': val,
-                                               'branches': 0, 'forks': 0, 'actions_success': 0, 'action_failures': 0, 'new_collaborator': 0, 'comments': 0}
-                    
-    
-                    
-    print("Repository Activity")
-    print("RepoName   Stars Issues PRs Commits Branches Forks Actions colab comments")
-    c = 0
-    for key, value in repo_activity.items():
-        c += 1
-        print(f"{c}: {key},{value}")
-    print("Total Activity")
-    print(f"Number of repositories", len(repo_activity.keys()))
-    print(f"Stars: {stars}")
-    print(f"Issues Opened: {issues_opened}")
-    print(f"Issues Resolved: {issues_resolved}")
-    print(f"Pull Requests Opened: {pr_opened}")
-    print(f"Pull Requests Closed: {pr_closed}")
-    print(f"Commits: {commits}")
-    print(f"Branches: {branches}")
-    print(f"Forks: {forks}")
-    print(f"Actions: {actions_success}")
-    print(f"Action Failures: {action_failures}")
-    print(f"New Collaborator: {new_collaborator}")
-    print(f"Comments: {comments}")
-
-    return [repo_activity, stars, issues_opened, issues_resolved, pr_opened, pr_closed, commits, branches, forks, actions_success, action_failures, new_collaborator, comments]
+    repo_matrix = buildRepoMatrix(data)
+    logger.debug(f"Repository activity: {len(repo_matrix)} repositories, totals "
+                 + ", ".join(f"{name}={total}" for name, total in zip(REPO_METRICS, repo_matrix.totals.tolist())))
+
+    return [repo_matrix.to_dict()] + repo_matrix.totals.tolist()
 
+@instrumented
 def getTopRepositories(repo_activity, limit=10):
     """Get top repositories by activity"""
+    if isinstance(repo_activity, RepoMatrix):
+        return repo_activity.top_repositories(limit)
     sorted_repos = sorted(repo_activity.items(), 
                          key=lambda x: sum(x[1].values()), 
                          reverse=True)
     return sorted_repos[:limit]
 
+@instrumented
 def getCommitFrequency(data):
     """Get commit frequency by day of week"""
-    data['timestamp'] = pd.to_datetime(data['timestamp'], format='ISO8601', errors='coerce')
-    data['day_of_week'] = pd.to_datetime(data['timestamp']).dt.day_name()
-    frequency = data['day_of_week'].value_counts().sort_index()
-    return frequency
+    return weekdayFrequencyFromCounts(data['weekday'].value_counts())
 
+def weekdayFrequencyFromCounts(weekday_counts):
+    """Label event counts per weekday number (Monday=0) with day names"""
+    frequency = pd.Series(weekday_counts.to_numpy(), index=[calendar.day_name[int(d)] for d in weekday_counts.index])
+    return frequency.sort_index()
+
+@instrumented
 def getActivityByHour(data):
     """Get activity distribution by hour"""
-    data['timestamp'] = pd.to_datetime(data['timestamp'], format='ISO8601', errors='coerce')
-    data['hour'] = pd.to_datetime(data['timestamp']).dt.hour
     hourly = data['hour'].value_counts().sort_index()
     return hourly
 
+@instrumented
 def getActivityCalendar(data):
     """Get daily activity for heatmap"""
-    data['timestamp'] = pd.to_datetime(data['timestamp'], format='ISO8601', errors='coerce')
-    data['date'] = data['timestamp'].dt.date
     daily_activity = data.groupby('date').size()
+    daily_activity.index = daily_activity.index.date
     return daily_activity
 
+@instrumented
 def getMostActiveRepositories(repo_activity, limit=10):
     """Get most active repositories by type"""
+    if isinstance(repo_activity, RepoMatrix):
+        return [(repo_activity.repos[i], int(repo_activity.activity[i])) for i in repo_activity.top(limit)]
     repos_with_types = {}
     for repo, metrics in repo_activity.items():
         total = sum(metrics.values())
@@ -321,6 +534,7 @@ def getMostActiveRepositories(repo_activity, limit=10):
     sorted_repos = sorted(repos_with_types.items(), key=lambda x: x[1], reverse=True)
     return sorted_repos[:limit]
 
+@instrumented
 def getContributorStats(data):
     """
     Get top contributors with proper filtering and cleaning.
@@ -329,175 +543,515 @@ def getContributorStats(data):
     if 'embeds.0.author.name' not in data.columns:
         return pd.Series()
     
-    # Create a copy to avoid modifying original
-    author_data = data['embeds.0.author.name'].copy()
-    
-    # Fill NaN values but mark for removal
-    author_data = author_data.fillna('')
-    
-    # Filter out empty strings and 'Unknown' entries
-    author_data = author_data[
-        (author_data.str.strip() != '') & 
-        (author_data.str.lower() != 'unknown') &
-        (author_data.str.lower() != 'nan')
+    names = data['embeds.0.author.name'].dropna().astype(object)
+    return topContributorsFromCounts(names.groupby(names, sort=False).size())
+
+def topContributorsFromCounts(author_counts, limit=10):
+    """
+    Top contributors from per-author event counts.
+
+    Args:
+        author_counts (pd.Series): Events per author name, in order of first appearance
+        limit (int): Number of contributors to return
+
+    Returns:
+        pd.Series: Events per contributor, most active first, with blank and
+        'Unknown' authors removed
+    """
+    names = author_counts.index.astype(str)
+    author_counts = author_counts[
+        (names.str.strip() != '') &
+        (~names.str.lower().isin(['unknown', 'nan']))
     ]
     
-    if len(author_data) == 0:
+    if len(author_counts) == 0:
         return pd.Series()
     
-    # Get value counts and take top 10
-    contributors = author_data.value_counts().head(10)
-    
-    return contributors
+    # Most active first; ties keep the order contributors first appear in
+    return author_counts.sort_values(ascending=False, kind='stable').head(limit)
 
-def getContributorDetails(data, contributor_name):
+# Words stripped from the front of a repository name parsed out of a title
+_ACTION_WORDS = ['opened', 'closed', 'merged', 'created', 'deleted', 'pushed', 'starred']
+# Each word at most once, in the order above, with the whitespace after it
+_ACTION_PREFIX = re.compile('^' + ''.join(rf'(?:{word}\s*)?' for word in _ACTION_WORDS), re.IGNORECASE)
+_INVALID_NAMES = ['unknown', 'nan', '']
+# Columns of a contributor's recent activities timeline
+TIMELINE_COLUMNS = ['timestamp', 'embeds.0.title', 'embeds.0.author.url']
+
+
+def _titleRepositories(titles):
     """
-    Get detailed statistics for a specific contributor.
-    
+    Extract the repository name mentioned in each title.
+
+    Args:
+        titles (pd.Series): Event titles with missing values filled
+
+    Returns:
+        pd.Series: Repository name per title, NaN where none was found
+    """
+    # Titles repeat heavily, so each distinct title is parsed once and the
+    # results are mapped back through the codes
+    index = titles.index
+    codes, distinct = pd.factorize(titles, sort=False)
+    titles = pd.Series(distinct, dtype=object)
+
+    # Patterns: "Action in RepositoryName", "org/repo" and "RepositoryName: Action"
+    repos = pd.Series(np.select(
+        [titles.str.contains(' in ', regex=False),
+         titles.str.contains('/', regex=False),
+         titles.str.contains(':', regex=False)],
+        [titles.str.rsplit(' in ', n=1).str[-1],
+         titles.str.split('/', n=1).str[0],
+         titles.str.split(':', n=1).str[0]],
+        default=None), dtype=object).str.strip()
+
+    # Remove common action words from repo name
+    repos = repos.str.replace(_ACTION_PREFIX, '', regex=True)
+
+    repos = repos.where(~repos.str.lower().isin(_INVALID_NAMES) & repos.notna())
+    return pd.Series(_byCode(repos.to_numpy(), codes), index=index, dtype=object)
+
+
+def _byCode(values, codes):
+    """Values of factorized codes; missing (-1) codes give None"""
+    return np.append(values.astype(object), None)[codes]
+
+
+def _activityTypes(titles):
+    """
+    Bucket each title into a contributor activity type.
+
+    Args:
+        titles (pd.Series): Event titles with missing values filled
+
+    Returns:
+        np.ndarray: Activity type label per title
+    """
+    # Classified once per distinct title, like _titleRepositories
+    codes, distinct = pd.factorize(titles, sort=False)
+    title = pd.Series(distinct, dtype=object).str.lower()
+
+    def has(word):
+        return title.str.contains(word, regex=False).to_numpy()
+
+    pull_request, issue = has('pull request'), has('issue')
+    opened, closed = has('opened'), has('closed')
+    types = np.select(
+        [has('star'),
+         pull_request & opened, pull_request & (closed | has('merged')), pull_request,
+         issue & opened, issue & closed, issue,
+         has('commit') | has('push'), has('fork'), has('branch'), has('comment'),
+         has('created') & has('repository')],
+        ['Stars',
+         'PRs Opened', 'PRs Merged', 'Pull Requests',
+         'Issues Opened', 'Issues Closed', 'Issues',
+         'Commits', 'Forks', 'Branches', 'Comments',
+         'Repository Created'],
+        default='Other')
+    return _byCode(types, codes)
+
+
+def _contributorProfile(contributor_name, contributor_data):
+    """
+    Compute the detailed statistics for one contributor's events.
+
     Args:
-        data (pd.DataFrame): Activity data
         contributor_name (str): Name of the contributor
-        
+        contributor_data (pd.DataFrame): The contributor's rows of the event table
+
     Returns:
         dict: Detailed contributor statistics
     """
-    # Filter data for the contributor
-    contributor_data = data[data['embeds.0.author.name'].str.lower() == contributor_name.lower()]
-    
-    if len(contributor_data) == 0:
-        return None
-    
+    titles = contributor_data['embeds.0.title'].fillna('').astype(str)
+
+    activity_types = pd.Series(_activityTypes(titles))
+    repositories = _titleRepositories(titles).dropna().unique()
+
     stats = {
         'name': contributor_name,
         'total_activities': len(contributor_data),
         'first_activity': contributor_data['timestamp'].min(),
         'last_activity': contributor_data['timestamp'].max(),
-        'activity_type_breakdown': {},
-        'monthly_activity': {},
+        'activity_type_breakdown': activity_types.groupby(activity_types, sort=False).size().to_dict(),
+        'monthly_activity': contributor_data['month'].value_counts().sort_index().to_dict(),
         'most_active_day': None,
         'most_active_hour': None,
-        'repositories_contributed': set()
+        'repositories_contributed': sorted(repositories.tolist())
     }
-    
-    # Parse timestamp
-    contributor_data = contributor_data.copy()
-    contributor_data['timestamp'] = pd.to_datetime(contributor_data['timestamp'], errors='coerce')
-    
-    # Activity type breakdown and repository extraction
-    for _, row in contributor_data.iterrows():
-        title = str(row.get('embeds.0.title', '')).lower()
-        title_original = str(row.get('embeds.0.title', ''))
-        
-        # Extract repository name - improved logic
-        repo_name = None
-        
-        # Try multiple extraction patterns
-        if ' in ' in title_original:
-            # Pattern: "Action in RepositoryName"
-            parts = title_original.split(' in ')
-            if len(parts) > 1:
-                repo_name = parts[-1].strip()
-        elif '/' in title_original:
-            # Pattern: "RepositoryName/Action" or "org/repo"
-            parts = title_original.split('/')
-            if len(parts) >= 1:
-                repo_name = parts[0].strip()
-        elif ':' in title_original:
-            # Pattern: "RepositoryName: Action"
-            parts = title_original.split(':')
-            if len(parts) > 0:
-                repo_name = parts[0].strip()
-        
-        # Clean up repository name
-        if repo_name and repo_name.lower() not in ['unknown', 'nan', '']:
-            # Remove common action words from repo name
-            action_words = ['opened', 'closed', 'merged', 'created', 'deleted', 'pushed', 'starred']
-            for word in action_words:
-                if repo_name.lower().startswith(word):
-                    repo_name = repo_name[len(word):].strip()
-            
-            if repo_name and repo_name.lower() not in ['unknown', 'nan', '']:
-                stats['repositories_contributed'].add(repo_name)
-        
-        # Activity type breakdown
-        if 'star' in title:
-            activity_type = 'Stars'
-        elif 'pull request' in title:
-            if 'opened' in title:
-                activity_type = 'PRs Opened'
-            elif 'closed' in title or 'merged' in title:
-                activity_type = 'PRs Merged'
-            else:
-                activity_type = 'Pull Requests'
-        elif 'issue' in title:
-            if 'opened' in title:
-                activity_type = 'Issues Opened'
-            elif 'closed' in title:
-                activity_type = 'Issues Closed'
-            else:
-                activity_type = 'Issues'
-        elif 'commit' in title or 'push' in title:
-            activity_type = 'Commits'
-        elif 'fork' in title:
-            activity_type = 'Forks'
-        elif 'branch' in title:
-            activity_type = 'Branches'
-        elif 'comment' in title:
-            activity_type = 'Comments'
-        elif 'created' in title and 'repository' in title:
-            activity_type = 'Repository Created'
-        else:
-            activity_type = 'Other'
-        
-        stats['activity_type_breakdown'][activity_type] = stats['activity_type_breakdown'].get(activity_type, 0) + 1
-    
-    # Monthly activity
-    contributor_data['month'] = contributor_data['timestamp'].dt.to_period('M')
-    monthly = contributor_data['month'].value_counts().sort_index()
-    stats['monthly_activity'] = monthly.to_dict()
-    
+
     # Most active day
-    contributor_data['day'] = contributor_data['timestamp'].dt.day_name()
-    day_counts = contributor_data['day'].value_counts()
+    day_counts = contributor_data['weekday'].value_counts()
     if len(day_counts) > 0:
-        stats['most_active_day'] = day_counts.idxmax()
-    
+        stats['most_active_day'] = calendar.day_name[int(day_counts.idxmax())]
+
     # Most active hour
-    contributor_data['hour'] = contributor_data['timestamp'].dt.hour
     hour_counts = contributor_data['hour'].value_counts()
     if len(hour_counts) > 0:
         stats['most_active_hour'] = int(hour_counts.idxmax())
+
+    return stats
+
+@instrumented
+def getContributorDetails(data, contributor_name):
+    """
+    Get detailed statistics for a specific contributor.
+    
+    Args:
+        data (pd.DataFrame): Event table from normalize_events
+        contributor_name (str): Name of the contributor
+        
+    Returns:
+        dict: Detailed contributor statistics
+    """
+    # Filter data for the contributor
+    contributor_data = data[data['embeds.0.author.name'].str.lower() == contributor_name.lower()]
     
-    stats['repositories_contributed'] = sorted(list(stats['repositories_contributed']))
+    if len(contributor_data) == 0:
+        return None
     
-    return stats
+    return _contributorProfile(contributor_name, contributor_data)
+
 
+@instrumented
 def getContributorTimeline(data, contributor_name, limit=20):
     """
     Get recent activities timeline for a contributor.
     
     Args:
-        data (pd.DataFrame): Activity data
+        data (pd.DataFrame): Event table from normalize_events
         contributor_name (str): Name of the contributor
         limit (int): Number of recent activities to return
         
     Returns:
         pd.DataFrame: Recent activities
     """
-    contributor_data = data[data['embeds.0.author.name'].str.lower() == contributor_name.lower()].copy()
-    
+    contributor_data = data[data['embeds.0.author.name'].str.lower() == contributor_name.lower()]
+    return _contributorTimeline(contributor_data, limit)
+
+def _contributorTimeline(contributor_data, limit):
+    """Most recent events first, limited to the given number of rows"""
     if len(contributor_data) == 0:
         return pd.DataFrame()
     
-    contributor_data['timestamp'] = pd.to_datetime(contributor_data['timestamp'], errors='coerce')
-    contributor_data = contributor_data.sort_values('timestamp', ascending=False).head(limit)
+    # Stable, so activities at the same time keep their order in the export
+    contributor_data = contributor_data.sort_values('timestamp', ascending=False, kind='stable').head(limit)
     
-    return contributor_data[['timestamp', 'embeds.0.title', 'embeds.0.author.url']].reset_index(drop=True)
+    return contributor_data[TIMELINE_COLUMNS].reset_index(drop=True)
+
+
+def _busiest(codes, values, groups, size):
+    """
+    Most frequent value (0 to size - 1) per group, like value_counts().idxmax()
+    on each group: ties go to the value seen first; -1 for a group without
+    any known value
+    """
+    values = np.asarray(values, dtype=float)
+    known = ~np.isnan(values)
+    cells = codes[known] * size + values[known].astype(np.intp)
+    counts = np.bincount(cells, minlength=groups * size).reshape(groups, size)
+    first_seen = np.full(groups * size, len(cells), dtype=np.int64)
+    seen, first = np.unique(cells, return_index=True)
+    first_seen[seen] = first
+    first_seen = np.where(counts == counts.max(axis=1, keepdims=True), first_seen.reshape(groups, size), len(cells))
+    return np.where(counts.any(axis=1), first_seen.argmin(axis=1), -1)
+
+@instrumented
+def contributorProfiles(data, limit=20):
+    """
+    Detailed statistics and recent timeline of every contributor, computed
+    in one grouped pass instead of a scan per contributor.
+
+    Contributors are keyed like ContributorIndex (case-folded name).
+
+    Args:
+        data (pd.DataFrame): Event table from normalize_events
+        limit (int): Recent activities kept per contributor
+
+    Returns:
+        dict: Per case-folded name, the statistics getContributorDetails
+        returns (named as first spelled in the table), with the
+        contributor's getContributorTimeline under 'timeline'
+    """
+    events = data[data['embeds.0.author.name'].notna().to_numpy()]
+    names = events['embeds.0.author.name'].astype(str).to_numpy()
+    codes, keys = pd.factorize(pd.Series(names).str.lower(), sort=False)
+    n = len(keys)
+    if n == 0:
+        return {}
+
+    totals = np.bincount(codes, minlength=n)
+    first_rows = np.unique(codes, return_index=True)[1]
+    timestamps = events['timestamp'].reset_index(drop=True)
+    first_activity = timestamps.groupby(codes).min()
+    last_activity = timestamps.groupby(codes).max()
+    day = _busiest(codes, events['weekday'], n, 7)
+    hour = _busiest(codes, events['hour'], n, 24)
+
+    titles = events['embeds.0.title'].fillna('').astype(str).reset_index(drop=True)
+    breakdown = [{} for _ in range(n)]
+    # Without sorting, types are listed in the order each contributor first had them
+    types = pd.DataFrame({'code': codes, 'type': _activityTypes(titles)}).groupby(['code', 'type'], sort=False).size()
+    for (code, activity_type), count in types.items():
+        breakdown[code][activity_type] = int(count)
+
+    monthly = [{} for _ in range(n)]
+    months = pd.DataFrame({'code': codes, 'month': events['month'].reset_index(drop=True)}).groupby(
+        ['code', 'month']).size()
+    for (code, month), count in months.items():
+        monthly[code][month] = int(count)
+
+    repos = pd.DataFrame({'code': codes, 'repo': _titleRepositories(titles).to_numpy()}).dropna()
+    repositories = repos.groupby('code')['repo'].unique()
+
+    # Newest first per contributor, undated activities last, ties in export order
+    micros = timestamps.to_numpy().astype('datetime64[us]').view(np.int64)
+    newest = np.where(timestamps.isna().to_numpy(), np.iinfo(np.int64).max, -micros)
+    order = np.lexsort((newest, codes))
+    starts = np.searchsorted(codes[order], np.arange(n + 1))
+    rank = np.arange(len(order)) - np.repeat(starts[:-1], totals)
+    recent = events.iloc[order[rank < limit]][TIMELINE_COLUMNS].reset_index(drop=True)
+    recent_starts = np.concatenate([[0], np.cumsum(np.minimum(totals, limit))])
+
+    return {key: {
+        'name': names[first_rows[code]],
+        'total_activities': int(totals[code]),
+        'first_activity': first_activity[code],
+        'last_activity': last_activity[code],
+        'activity_type_breakdown': breakdown[code],
+        'monthly_activity': monthly[code],
+        'most_active_day': calendar.day_name[day[code]] if day[code] >= 0 else None,
+        'most_active_hour': int(hour[code]) if hour[code] >= 0 else None,
+        'repositories_contributed': sorted(repositories.get(code, [])),
+        'timeline': recent.iloc[recent_starts[code]:recent_starts[code + 1]].reset_index(drop=True),
+    } for code, key in enumerate(keys)}
+
+@instrumented
+@disk_cached
+def contributorSummaries(data, top_repos=3):
+    """
+    Card-sized profile of every contributor, computed in one grouped pass.
+
+    Contributors are keyed like ContributorIndex (case-folded name), so
+    each appears once, under the first of their spellings in the
+    Contributors tab's sorted list.
+
+    Args:
+        data (pd.DataFrame): Event table from normalize_events
+        top_repos (int): Repositories listed per contributor
+
+    Returns:
+        list: One dict per contributor, sorted by name, with 'name',
+        'total_activities', 'top_repositories' ((repository, events) pairs,
+        most events first, named as in the repository metrics), 'most_active_day', 'most_active_hour' and
+        'monthly_activity' (events per month over the whole table's months)
+    """
+    names = data['embeds.0.author.name']
+    valid = names.notna() & ~names.astype(str).str.strip().str.lower().isin(_INVALID_NAMES)
+    events = data[valid.to_numpy()]
+    names = events['embeds.0.author.name'].astype(str)
+    codes, keys = pd.factorize(names.str.lower(), sort=False)
+    n = len(keys)
+    if n == 0:
+        return []
+
+    totals = np.bincount(codes, minlength=n)
+    display_names = names.groupby(codes).min().to_numpy()
+
+    day = _busiest(codes, events['weekday'], n, 7)
+    hour = _busiest(codes, events['hour'], n, 24)
+
+    months = data['month'].dropna()
+    month_range = pd.period_range(months.min(), months.max(), freq='M') if len(months) else pd.PeriodIndex([], freq='M')
+    month_labels = month_range.astype(str).tolist()
+    month = events['month']
+    dated = month.notna().to_numpy()
+    offsets = (month[dated].dt.year * 12 + month[dated].dt.month).to_numpy() - (
+        month_range[0].year * 12 + month_range[0].month if len(month_range) else 0)
+    monthly = np.bincount(codes[dated] * len(month_range) + offsets,
+                          minlength=n * len(month_range)).reshape(n, len(month_range))
+
+    # Titles repeat heavily, so they are classified once per distinct title
+    title_codes, titles = pd.factorize(events['embeds.0.title'].fillna('').astype(str))
+    classified = classifyEvents(pd.Series(titles, dtype=object))
+    repos = pd.Series(classified['repo'].where(classified['event_type'] >= 0).to_numpy()[title_codes])
+    has_repo = repos.notna().to_numpy()
+    repo_counts = pd.DataFrame({'code': codes[has_repo], 'repo': repos[has_repo].to_numpy()}).groupby(
+        ['code', 'repo'], sort=False).size().rename('events').reset_index()
+    # Most events first; ties keep the order repositories first appear in
+    repo_counts = repo_counts.sort_values(['code', 'events'], ascending=[True, False], kind='stable')
+    top = repo_counts.groupby('code', sort=False).head(top_repos)
+    top_by_code = {code: list(zip(group['repo'].tolist(), group['events'].tolist()))
+                   for code, group in top.groupby('code', sort=False)}
+
+    summaries = [{
+        'name': display_names[code],
+        'total_activities': int(totals[code]),
+        'top_repositories': top_by_code.get(code, []),
+        'most_active_day': calendar.day_name[day[code]] if day[code] >= 0 else None,
+        'most_active_hour': int(hour[code]) if hour[code] >= 0 else None,
+        'monthly_activity': dict(zip(month_labels, monthly[code].tolist())),
+    } for code in range(n)]
+    return sorted(summaries, key=lambda summary: summary['name'])
+
+@instrumented
+@disk_cached
+def computeMetrics(data):
+    """
+    Compute every dashboard metric for an event table in one go.
+
+    Args:
+        data (pd.DataFrame): Event table from normalize_events
+
+    Returns:
+        dict: Metric results, keyed by name, as returned by the individual
+        metric functions; repository activity is kept as a RepoMatrix
+        ('repo_matrix') rather than repoActivity's dict of dicts
+    """
+    repo_matrix = buildRepoMatrix(data)
+    calendar_metrics = calendarMetrics(data)
+    return {
+        'total_active_days': calendar_metrics['total_active_days'],
+        'longest_gap': calendar_metrics['longest_gap'],
+        'busiest_day': calendar_metrics['busiest_day'],
+        'longest_streak': calendar_metrics['longest_streak'],
+        'top_streaks': calendar_metrics['top_streaks'],
+        'top_gaps': calendar_metrics['top_gaps'],
+        'month_wise_activity': monthWiseActivity(data),
+        'time_wise_activity': timeWiseActivity(data),
+        'developer_activity': allDeveloperActivity(data),
+        'repo_matrix': repo_matrix,
+        'top_repos': getTopRepositories(repo_matrix, limit=10),
+        'commit_frequency': getCommitFrequency(data),
+        'hourly_activity': getActivityByHour(data),
+        'daily_activity': getActivityCalendar(data),
+        'activity_heatmap': activityHeatmap(data),
+        'contributor_stats': getContributorStats(data),
+        'total_events': len(data),
+    }
+
+class ContributorIndex:
+    """
+    Row positions of every contributor in an event table, keyed by the
+    case-folded contributor name.
+
+    Built once per dataset so switching between contributors is a lookup
+    instead of a scan; profiles and timelines are computed on first request
+    and memoized per contributor. The index is shared between sessions, so
+    memos are written under a lock.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        names = data['embeds.0.author.name']
+        keys = names.str.lower().to_numpy()
+        self._positions = names.groupby(keys, sort=False).indices
+        self._details = {}
+        self._timelines = {}
+        self._contributors = None
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self):
+        """
+        Approximate memory held by the index and the timelines it memoized,
+        in bytes; the event table it indexes is not included
+        """
+        with self._lock:
+            timelines = list(self._timelines.values())
+        return int(sum(positions.nbytes for positions in self._positions.values())
+                   + sum(timeline.memory_usage(deep=True).sum() for timeline in timelines))
+
+    def contributors(self):
+        """Sorted contributor names, excluding unknown and blank authors; computed once"""
+        if self._contributors is None:
+            names = self.data['embeds.0.author.name'].dropna().unique().tolist()
+            self._contributors = sorted(c for c in names if c.strip().lower() not in _INVALID_NAMES)
+        return list(self._contributors)
+
+    def rows(self, contributor_name):
+        """The contributor's rows of the event table"""
+        positions = self._positions.get(contributor_name.lower(), np.empty(0, dtype=np.intp))
+        return self.data.iloc[positions]
+
+    @instrumented
+    def details(self, contributor_name):
+        """Memoized equivalent of getContributorDetails"""
+        key = contributor_name.lower()
+        if key not in self._details:
+            contributor_data = self.rows(contributor_name)
+            stats = _contributorProfile(contributor_name, contributor_data) if len(contributor_data) else None
+            with self._lock:
+                self._details.setdefault(key, stats)
+        stats = self._details[key]
+        return stats if stats is None else {**stats, 'name': contributor_name}
+
+    @instrumented
+    def timeline(self, contributor_name, limit=20):
+        """Memoized equivalent of getContributorTimeline"""
+        key = (contributor_name.lower(), limit)
+        if key not in self._timelines:
+            timeline = _contributorTimeline(self.rows(contributor_name), limit)
+            with self._lock:
+                self._timelines.setdefault(key, timeline)
+        return self._timelines[key]
+
+class EventTimeline:
+    """
+    Event table sorted by timestamp, for views over a date range.
+
+    The table is sorted once (not copied at all if it already is), so a
+    window is two np.searchsorted lookups and a positional slice. With
+    classify, titles are classified once up front and repository metrics
+    over a window skip the regex pass. Events without a timestamp sort last
+    and fall outside every window.
+    """
+
+    def __init__(self, data, classify=True):
+        source = data
+        if not data['timestamp'].is_monotonic_increasing:
+            order = np.argsort(data['timestamp'].to_numpy(), kind='stable')
+            data = data.iloc[order].reset_index(drop=True)
+        self.data = data.assign(**classifyEvents(data['embeds.0.title'])) if classify else data
+        # Whether self.data is a new table rather than the caller's
+        self._copied = self.data is not source
+        self._timestamps = data['timestamp'].to_numpy()
+        self._timestamps = self._timestamps[:len(data) - int(data['timestamp'].isna().sum())]
+
+    @property
+    def nbytes(self):
+        """
+        Approximate memory held by the timeline, in bytes: its table when it
+        was sorted or classified into a new one, else nothing
+        """
+        return int(self.data.memory_usage(deep=True).sum()) if self._copied else 0
+
+    def bounds(self, start, end):
+        """
+        Row positions of the events between two dates.
+
+        Args:
+            start (datetime.date): First day of the window
+            end (datetime.date): Last day of the window, inclusive
+
+        Returns:
+            tuple: (first row, one past the last row)
+        """
+        dtype = self._timestamps.dtype
+        lo = np.searchsorted(self._timestamps, pd.Timestamp(start).to_datetime64().astype(dtype), side='left')
+        hi = np.searchsorted(self._timestamps, (pd.Timestamp(end) + pd.Timedelta(days=1)).to_datetime64().astype(dtype),
+                             side='left')
+        return int(lo), int(max(lo, hi))
+
+    def window(self, start, end):
+        """Events between two dates (inclusive), as a slice of the sorted table"""
+        lo, hi = self.bounds(start, end)
+        return self.data.iloc[lo:hi]
 
 def main():
     # data=clean_data("data.csv")
     # data.to_csv("clean_data.csv",index=False)
-    data = pd.read_csv("clean_data.csv")
+    configure_logging('DEBUG')
+    data = normalize_events(clean_data("clean_data.csv"))
     longestStreak(data)
     monthWiseActivity(data)
     totalActiveDays(data)
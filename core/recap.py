@@ -0,0 +1,206 @@
+"""
+Charts and headline figures of the recap, shared by the dashboard
+(core/ui.py) and the static HTML export (core/static_export.py).
+"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from main import REPO_METRICS
+
+
+def _totals(metrics):
+    return dict(zip(REPO_METRICS, metrics['repo_matrix'].totals.tolist()))
+
+
+def key_metrics(metrics):
+    """
+    The headline counters shown at the top of the Overview.
+
+    Args:
+        metrics (dict): Output of computeMetrics or ActivityCube.metrics
+
+    Returns:
+        list: (label, value) pairs, two rows of five
+    """
+    repo_matrix = metrics['repo_matrix']
+    totals = _totals(metrics)
+    return [
+        ("Active Days", metrics['total_active_days']),
+        ("Total Stars", totals['stars']),
+        ("Pull Requests", totals['pr_opened'] + totals['pr_closed']),
+        ("Issues", totals['issues_opened'] + totals['issues_resolved']),
+        ("Commits", totals['commits']),
+        ("Branches", totals['branches']),
+        ("Forks", totals['forks']),
+        ("Actions Success", totals['actions_success']),
+        ("Action Failures", totals['action_failures']),
+        ("Repositories", len(repo_matrix)),
+    ]
+
+
+def summary_statistics(metrics):
+    """
+    The Summary Statistics block of the Overview.
+
+    Returns:
+        dict: Section title -> list of (label, formatted value)
+    """
+    repo_count = len(metrics['repo_matrix'])
+    totals = _totals(metrics)
+    total_events = metrics['total_events']
+    total_active_days = metrics['total_active_days']
+    actions = totals['actions_success'] + totals['action_failures']
+    prs = totals['pr_opened'] + totals['pr_closed']
+    return {
+        "Repository Metrics": [
+            ("Total Repositories", f"{repo_count}"),
+            ("Avg Stars per Repo", f"{totals['stars'] / repo_count if repo_count > 0 else 0:.1f}"),
+            ("Avg Commits per Repo", f"{totals['commits'] / repo_count if repo_count > 0 else 0:.1f}"),
+        ],
+        "Activity Metrics": [
+            ("Total Events", f"{total_events}"),
+            ("Avg Events per Day", f"{total_events / total_active_days if total_active_days > 0 else 0:.1f}"),
+            ("Most Active Day", f"{metrics['commit_frequency'].idxmax()}"),
+        ],
+        "Action Metrics": [
+            ("Action Success Rate", f"{totals['actions_success'] / actions * 100 if actions > 0 else 0:.1f}%"),
+            ("Total Actions", f"{actions}"),
+            ("PR Merge Rate", f"{totals['pr_closed'] / prs * 100 if prs > 0 else 0:.1f}%"),
+        ],
+    }
+
+
+def heatmap_figure(heatmap_data):
+    """Weekday x week heatmap of activity_heatmap"""
+    fig = go.Figure(data=go.Heatmap(
+        z=heatmap_data.values,
+        x=heatmap_data.columns,
+        y=heatmap_data.index,
+        colorscale='Greens',
+        showscale=True,
+        hoverongaps=False
+    ))
+    fig.update_layout(
+        title="Activity Heatmap (Weekly View)",
+        xaxis_title="Week",
+        yaxis_title="Day of Week",
+        height=300
+    )
+    return fig
+
+
+def monthly_activity_figure(month_wise_activity):
+    fig = px.bar(
+        x=month_wise_activity.index.astype(str),
+        y=month_wise_activity.values,
+        labels={'x': 'Month', 'y': 'Activity Count'},
+        color=month_wise_activity.values,
+        color_continuous_scale='Blues'
+    )
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+
+def hourly_activity_figure(hourly_activity):
+    fig = px.bar(
+        x=hourly_activity.index,
+        y=hourly_activity.values,
+        labels={'x': 'Hour of Day', 'y': 'Activity Count'},
+        color=hourly_activity.values,
+        color_continuous_scale='Purples'
+    )
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+
+def weekday_activity_figure(commit_frequency):
+    fig = px.bar(
+        x=commit_frequency.index,
+        y=commit_frequency.values,
+        labels={'x': 'Day of Week', 'y': 'Activity Count'},
+        color=commit_frequency.values,
+        color_continuous_scale='Oranges'
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+def top_repositories_figure(repo_table, limit=10):
+    """Horizontal bar chart of the most active repositories"""
+    fig = px.bar(
+        repo_table.top_activity(limit),
+        x='Activity',
+        y='Repository',
+        orientation='h',
+        color='Activity',
+        color_continuous_scale='Viridis'
+    )
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+
+def top_contributors_figure(contributor_stats):
+    """Horizontal bar chart of contributor_stats; None when there is nobody to show"""
+    if contributor_stats is None or len(contributor_stats) == 0:
+        return None
+    contrib_df = pd.DataFrame({
+        'Contributor': contributor_stats.index,
+        'Contributions': contributor_stats.values
+    })
+    fig = px.bar(
+        contrib_df,
+        x='Contributions',
+        y='Contributor',
+        orientation='h',
+        color='Contributions',
+        color_continuous_scale='Reds'
+    )
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+
+def activity_breakdown_figure(contributor_name, activity_breakdown):
+    """Pie chart of a contributor's activity types; None when they have none"""
+    if not activity_breakdown:
+        return None
+    activity_df = pd.DataFrame({
+        'Activity Type': list(activity_breakdown.keys()),
+        'Count': list(activity_breakdown.values())
+    })
+    return px.pie(
+        activity_df,
+        values='Count',
+        names='Activity Type',
+        title=f"{contributor_name}'s Activity Distribution"
+    )
+
+
+def timeline_table(timeline_data):
+    """A contributor timeline formatted for display"""
+    display_data = timeline_data.copy()
+    display_data['timestamp'] = pd.to_datetime(display_data['timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
+    display_data.columns = ['Date & Time', 'Activity', 'URL']
+    return display_data
+
+
+def timeline_daily_counts(timeline_data):
+    """Activities per day of a contributor timeline, as 'date' and 'count' columns"""
+    # Counted with NumPy: the static export does this for every contributor
+    timestamps = pd.to_datetime(timeline_data['timestamp']).dropna()
+    days, counts = np.unique(timestamps.to_numpy().astype('datetime64[D]'), return_counts=True)
+    return pd.DataFrame({'date': days.astype(object), 'count': counts})
+
+
+def contributor_timeline_figure(contributor_name, timeline_data):
+    """Activities per day of a contributor's recent timeline"""
+    activity_by_date = timeline_daily_counts(timeline_data)
+
+    return px.bar(
+        activity_by_date,
+        x='date',
+        y='count',
+        title=f"{contributor_name}'s Activity Over Time",
+        labels={'date': 'Date', 'count': 'Number of Activities'}
+    )
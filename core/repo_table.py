@@ -0,0 +1,110 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Columns of the repository table, each the sum of one or more REPO_METRICS
+TABLE_COLUMNS = {
+    'Stars': ['stars'],
+    'PRs': ['pr_opened', 'pr_closed'],
+    'Issues': ['issues_opened', 'issues_resolved'],
+    'Commits': ['commits'],
+    'Forks': ['forks'],
+    'Branches': ['branches'],
+    'Actions Success': ['actions_success'],
+    'Actions Failed': ['action_failures'],
+    'Comments': ['comments'],
+    'Collaborators': ['new_collaborator'],
+}
+# Columns of the shorter top-repositories table
+TOP_COLUMNS = ['Repository', 'Stars', 'PRs', 'Issues', 'Commits', 'Forks', 'Actions Success', 'Branches']
+
+
+class RepoTable:
+    """
+    Repository details table, materialized once per dataset.
+
+    Sort orders are computed on first use per column and kept, so sorting
+    and paging only slice the table. CSV exports are generated on first
+    download and kept as bytes. The table is shared between sessions, so
+    both are memoized under a lock.
+    """
+
+    def __init__(self, repo_matrix):
+        self.repo_matrix = repo_matrix
+        counts = repo_matrix.to_frame()
+        self.frame = pd.DataFrame({
+            '#': np.arange(1, len(counts) + 1),
+            'Repository': counts.index.to_numpy(),
+            **{label: counts[metrics].sum(axis=1).to_numpy() for label, metrics in TABLE_COLUMNS.items()},
+        })
+        self._orders = {}
+        self._csv = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def nbytes(self):
+        """
+        Approximate memory held by the table, its sort orders and CSV
+        exports, in bytes; the RepoMatrix it was built from is not included
+        """
+        with self._lock:
+            orders = list(self._orders.values())
+            exports = list(self._csv.values())
+        return int(self.frame.memory_usage(deep=True).sum()
+                   + sum(order.nbytes for order in orders)
+                   + sum(len(csv) for csv in exports))
+
+    def order(self, sort_by):
+        """Row positions sorted by a column, highest first; ties keep repository order"""
+        if sort_by not in self._orders:
+            order = np.argsort(-self.frame[sort_by].to_numpy(), kind='stable')
+            with self._lock:
+                self._orders.setdefault(sort_by, order)
+        return self._orders[sort_by]
+
+    def page_count(self, per_page):
+        return (len(self) + per_page - 1) // per_page
+
+    def page(self, sort_by, page, per_page):
+        """
+        One page of the table sorted by a column.
+
+        Args:
+            sort_by (str): Column to sort by, descending
+            page (int): 1-based page number
+            per_page (int): Rows per page
+
+        Returns:
+            pd.DataFrame: The page's rows, with '#' giving their overall rank
+        """
+        start = (page - 1) * per_page
+        positions = self.order(sort_by)[start:start + per_page]
+        rows = self.frame.iloc[positions].reset_index(drop=True)
+        rows['#'] = np.arange(start + 1, start + len(rows) + 1)
+        return rows
+
+    def csv(self, sort_by):
+        """The whole table sorted by a column, as CSV bytes"""
+        if sort_by not in self._csv:
+            rows = self.frame.iloc[self.order(sort_by)].reset_index(drop=True)
+            rows['#'] = np.arange(1, len(rows) + 1)
+            csv = rows.to_csv(index=False).encode('utf-8')
+            with self._lock:
+                self._csv.setdefault(sort_by, csv)
+        return self._csv[sort_by]
+
+    def top(self, limit=10):
+        """The most active repositories (by total activity) with the TOP_COLUMNS"""
+        return self.frame.iloc[self.repo_matrix.top(limit)][TOP_COLUMNS].reset_index(drop=True)
+
+    def top_activity(self, limit=10):
+        """Total activity of the most active repositories, for charts"""
+        ids = self.repo_matrix.top(limit)
+        return pd.DataFrame({
+            'Repository': self.repo_matrix.repos[ids],
+            'Activity': self.repo_matrix.activity[ids],
+        })
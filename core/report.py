@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from main import REPO_METRICS
+
+
+def _date(value):
+    return value.isoformat() if value is not None else None
+
+
+def _ranges(ranges):
+    """[length, start, end] streaks or gaps as JSON objects"""
+    return [{'days': int(days), 'start': _date(start), 'end': _date(end)} for days, start, end in ranges]
+
+
+def _counts(series):
+    """Series of counts as a JSON object keyed by the string form of the index"""
+    return {str(key): int(value) for key, value in zip(series.index, series.tolist())}
+
+
+def build_report(metrics, org_key=None, org_config=None, source=None):
+    """
+    Turn computed metrics into a machine-readable wrapped report.
+
+    Args:
+        metrics (dict): Output of computeMetrics or ActivityAggregate.report
+        org_key (str): Key of the organization in ORGANIZATIONS
+        org_config (dict): Organization entry from ORGANIZATIONS
+        source (str): Export the metrics were computed from
+
+    Returns:
+        dict: JSON-serializable report
+    """
+    org_config = org_config or {}
+    gap_days, gap_start, gap_end = metrics['longest_gap']
+    streak_days, streak_start, streak_end = metrics['longest_streak']
+    busiest_day, busiest_day_count = metrics['busiest_day']
+    developer_activity, most_active_developer = metrics['developer_activity']
+    repo_matrix = metrics['repo_matrix']
+
+    return {
+        'org': org_key,
+        'name': org_config.get('name'),
+        'full_name': org_config.get('full_name'),
+        'year': org_config.get('year'),
+        'source': source,
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'total_events': int(metrics['total_events']),
+        'total_active_days': int(metrics['total_active_days']),
+        'longest_gap': {'days': int(gap_days), 'start': _date(gap_start), 'end': _date(gap_end)},
+        'longest_streak': {'days': int(streak_days), 'start': _date(streak_start), 'end': _date(streak_end)},
+        'busiest_day': {'date': _date(busiest_day), 'events': int(busiest_day_count)},
+        'top_streaks': _ranges(metrics['top_streaks']),
+        'top_gaps': _ranges(metrics['top_gaps']),
+        'totals': dict(zip(REPO_METRICS, repo_matrix.totals.tolist())),
+        'repository_count': len(repo_matrix),
+        'repositories': repo_matrix.to_dict(),
+        'top_repositories': [{'repository': repo, 'activity': sum(counts.values())}
+                             for repo, counts in metrics['top_repos']],
+        'most_active_developer': most_active_developer,
+        'developers': developer_activity,
+        'top_contributors': _counts(metrics['contributor_stats']),
+        'monthly_activity': _counts(metrics['month_wise_activity']),
+        'time_of_day_activity': _counts(metrics['time_wise_activity']),
+        'hourly_activity': {str(int(hour)): int(n) for hour, n in zip(metrics['hourly_activity'].index,
+                                                                      metrics['hourly_activity'].tolist())},
+        'weekday_activity': _counts(metrics['commit_frequency']),
+        'daily_activity': {_date(day): int(n) for day, n in zip(metrics['daily_activity'].index,
+                                                               metrics['daily_activity'].tolist())},
+    }
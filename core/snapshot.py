@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from main import EVENT_COLUMNS, clean_data
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # snapshots are an optimization; fall back to the CSV
+    pa = None
+    feather = None
+
+SNAPSHOT_SUFFIX = '.feather'
+# Schema metadata key holding the fingerprint of the CSV a snapshot was made from
+SOURCE_KEY = b'wrapped.source'
+
+
+def snapshot_path(csv_path, cache_dir=None):
+    """
+    Location of the columnar snapshot for a CSV export.
+
+    The name carries a hash of the CSV's absolute path, so exports with the
+    same file name in different directories do not share a snapshot.
+
+    Args:
+        csv_path (str): Path to the Discrub CSV export
+        cache_dir (str): Directory for snapshots; next to the CSV when None
+
+    Returns:
+        str: Path of the snapshot file
+    """
+    csv_path = os.path.abspath(csv_path)
+    directory = cache_dir or os.path.dirname(csv_path)
+    path_hash = hashlib.sha1(csv_path.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(directory, f"{os.path.basename(csv_path)}.{path_hash}{SNAPSHOT_SUFFIX}")
+
+
+def source_fingerprint(csv_path):
+    """Modification time (ns) and size of the CSV, recorded in its snapshot"""
+    stat = os.stat(csv_path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def is_fresh(csv_path, path):
+    """
+    True when the snapshot exists and was made from the CSV as it is now.
+
+    The CSV's modification time and size must equal the ones recorded in
+    the snapshot, so a re-export copied with its timestamp preserved (or
+    an older file put back) is not mistaken for the snapshotted one.
+    """
+    if not os.path.exists(path):
+        return False
+    with pa.memory_map(path) as source:
+        metadata = pa.ipc.open_file(source).schema.metadata or {}
+    recorded = metadata.get(SOURCE_KEY)
+    return recorded is not None and json.loads(recorded) == source_fingerprint(csv_path)
+
+
+def project_events(data):
+    """
+    Reduce a raw export to the typed columns the metrics use.
+
+    Args:
+        data (pd.DataFrame): Raw export as read from the CSV
+
+    Returns:
+        pd.DataFrame: EVENT_COLUMNS present in the export, with 'timestamp'
+        parsed to datetime64
+    """
+    events = data[[c for c in EVENT_COLUMNS if c in data.columns]].copy()
+    if 'timestamp' in events.columns:
+        events['timestamp'] = pd.to_datetime(
+            events['timestamp'], format='ISO8601', errors='coerce', utc=True).dt.tz_convert(None)
+    return events
+
+
+def write_snapshot(events, path, source):
+    """
+    Write an uncompressed Feather file, recording the fingerprint of the
+    CSV it was made from (see source_fingerprint).
+
+    The file is written under a temporary name and moved into place, so a
+    concurrent reader never sees a partial snapshot.
+    """
+    table = pa.Table.from_pandas(events.reset_index(drop=True), preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), SOURCE_KEY: json.dumps(source)})
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path):
+    """
+    Read a Feather snapshot into a DataFrame.
+
+    The file is mapped rather than read into a buffer, but converting to
+    pandas still copies every column, so the frame does not stay backed by
+    the file.
+    """
+    return feather.read_table(path, memory_map=True).to_pandas()
+
+
+def load_events(csv_path, cache_dir=None):
+    """
+    Load a Discrub export, preferring an up-to-date columnar snapshot.
+
+    On a cold load the CSV is parsed, projected to EVENT_COLUMNS and written
+    as a snapshot; later loads read the snapshot instead, as long as the CSV
+    still has the modification time and size recorded in it. Without pyarrow, or when the snapshot cannot be written,
+    the projected CSV data is returned as-is.
+
+    Args:
+        csv_path (str): Path to the Discrub CSV export
+        cache_dir (str): Directory for snapshots; next to the CSV when None
+
+    Returns:
+        pd.DataFrame: Projected, typed export data
+    """
+    if feather is None:
+        return project_events(clean_data(csv_path))
+
+    path = snapshot_path(csv_path, cache_dir)
+    try:
+        if is_fresh(csv_path, path):
+            return read_snapshot(path)
+    except (OSError, ValueError, pa.ArrowInvalid):
+        pass  # unreadable snapshot; rebuild it from the CSV
+
+    # Fingerprinted before parsing, so a CSV rewritten meanwhile is not
+    # recorded as the version that was read
+    source = source_fingerprint(csv_path)
+    events = project_events(clean_data(csv_path))
+    try:
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        write_snapshot(events, path, source)
+    except OSError:
+        pass  # read-only data directory; snapshots are best effort
+    return events
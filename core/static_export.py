@@ -0,0 +1,382 @@
+"""
+Self-contained static HTML recap.
+
+Renders the Overview, Contributors and Repositories views once, with the
+same figures as the dashboard embedded as Plotly JSON, so the recap can be
+served from any static host without recomputing anything per viewer.
+Contributor charts are embedded as each contributor's series plus one
+shared figure per kind of chart, and put together in the browser.
+"""
+import base64
+import html
+import json
+import os
+from datetime import datetime
+
+from plotly.offline import get_plotlyjs
+from plotly.offline.offline import get_plotlyjs_version
+
+from main import contributorProfiles
+from recap import (key_metrics, summary_statistics, heatmap_figure, monthly_activity_figure, hourly_activity_figure,
+                   weekday_activity_figure, top_repositories_figure, top_contributors_figure,
+                   activity_breakdown_figure, timeline_table, timeline_daily_counts, contributor_timeline_figure)
+
+# Banner embedded by export_html when the organization shows one
+BANNER_PATH = 'banner.jpeg'
+
+# Fields of the first trace that each contributor chart takes from the
+# contributor's series
+CONTRIBUTOR_CHARTS = {'activity': ('labels', 'values'), 'timeline': ('x', 'y')}
+
+STYLE = """
+body { font-family: "Source Sans Pro", -apple-system, BlinkMacSystemFont, sans-serif; margin: 0; color: #262730; }
+header { background: linear-gradient(135deg, {primary} 0%, {secondary} 100%); color: white; padding: 32px 48px; }
+header h1 { margin: 0 0 8px; }
+header img { display: block; max-width: 100%; margin-top: 16px; border-radius: 10px; }
+main { padding: 0 48px 32px; }
+nav { display: flex; gap: 8px; border-bottom: 1px solid #ddd; margin: 24px 0; }
+nav button { border: none; background: none; padding: 10px 16px; font-size: 16px; cursor: pointer; }
+nav button.active { border-bottom: 3px solid {primary}; font-weight: bold; }
+section[hidden], .profile[hidden] { display: none; }
+.metrics { display: grid; grid-template-columns: repeat(5, 1fr); gap: 12px; margin-bottom: 12px; }
+.metrics.four { grid-template-columns: repeat(4, 1fr); }
+.metric-card { background: linear-gradient(135deg, {primary} 0%, {secondary} 100%); padding: 20px;
+               border-radius: 10px; color: white; text-align: center; }
+.metric-value { font-size: 32px; font-weight: bold; margin: 10px 0; }
+.metric-label { font-size: 14px; opacity: 0.9; }
+.columns { display: grid; grid-template-columns: repeat(auto-fit, minmax(320px, 1fr)); gap: 24px; }
+.info { background: #e8f0fe; border-radius: 8px; padding: 12px 16px; }
+table { border-collapse: collapse; width: 100%; font-size: 14px; }
+th, td { border-bottom: 1px solid #eee; padding: 6px 10px; text-align: left; }
+th[data-sort] { cursor: pointer; }
+.table-scroll { max-height: 600px; overflow: auto; }
+footer { text-align: center; padding: 20px; color: gray; }
+"""
+
+SCRIPT = """
+const figures = JSON.parse(document.getElementById('figures').textContent);
+function contributorFigure(index, kind) {
+  // The shared figure of the chart's kind, with the contributor's series and name
+  const contributor = figures.contributors[index], shared = figures.shared[kind];
+  const figure = JSON.parse(JSON.stringify(shared.figure));
+  shared.fields.forEach((field, i) => figure.data[0][field] = contributor[kind][i]);
+  figure.layout.title.text = contributor.name + figure.layout.title.text;
+  return figure;
+}
+function draw(container) {
+  container.querySelectorAll('.chart:not([data-drawn])').forEach(div => {
+    const figure = div.dataset.kind ? contributorFigure(div.dataset.contributor, div.dataset.kind)
+                                    : figures.figures[div.dataset.figure];
+    figure.layout.template = figures.template;
+    Plotly.newPlot(div, figure.data, figure.layout, {responsive: true});
+    div.dataset.drawn = '1';
+  });
+}
+function show(id) {
+  document.querySelectorAll('main > section').forEach(s => s.hidden = s.id !== id);
+  document.querySelectorAll('nav button').forEach(b => b.classList.toggle('active', b.dataset.section === id));
+  draw(document.getElementById(id));
+}
+document.querySelectorAll('nav button').forEach(b => b.onclick = () => show(b.dataset.section));
+const contributor = document.getElementById('contributor');
+if (contributor) {
+  contributor.onchange = () => {
+    document.querySelectorAll('.profile').forEach(p => p.hidden = p.dataset.index !== contributor.value);
+    draw(document.getElementById('contributors'));
+  };
+}
+document.querySelectorAll('th[data-sort]').forEach(th => th.onclick = () => {
+  const body = th.closest('table').tBodies[0], column = th.cellIndex;
+  const value = row => Number(row.cells[column].textContent);
+  const order = row => Number(row.dataset.order);
+  Array.from(body.rows).sort((a, b) => value(b) - value(a) || order(a) - order(b)).forEach((row, i) => {
+    row.cells[0].textContent = i + 1;
+    body.appendChild(row);
+  });
+});
+show('overview');
+"""
+
+
+class _Figures:
+    """
+    Figures of the page, serialized once with a single shared template.
+
+    Contributor charts are not built per contributor: each kind in
+    CONTRIBUTOR_CHARTS is serialized once, without its series, and each
+    contributor only adds the series of its charts.
+    """
+
+    def __init__(self):
+        self.figures = []
+        self.template = None
+        self.shared = {}
+        self.contributors = []
+
+    def _serialize(self, fig):
+        figure = json.loads(fig.to_json())
+        template = figure['layout'].pop('template', None)
+        if self.template is None:
+            self.template = template
+        return figure
+
+    def div(self, fig):
+        """Placeholder that the page script fills with the figure when shown"""
+        self.figures.append(self._serialize(fig))
+        return f'<div class="chart" data-figure="{len(self.figures) - 1}"></div>'
+
+    def contributor(self, name):
+        """Add a contributor, returning the index its charts refer to"""
+        self.contributors.append({'name': name})
+        return len(self.contributors) - 1
+
+    def contributor_div(self, index, kind, series, build):
+        """
+        Placeholder for one of a contributor's charts.
+
+        Args:
+            index (int): Contributor, from contributor()
+            kind (str): Key of CONTRIBUTOR_CHARTS
+            series (tuple): Lists for the kind's fields
+            build (callable): Builds the chart for a contributor with an
+                empty name (the page prefixes each name to its title);
+                called only the first time a kind is used
+        """
+        if kind not in self.shared:
+            figure = self._serialize(build())
+            for field in CONTRIBUTOR_CHARTS[kind]:
+                figure['data'][0].pop(field, None)
+            self.shared[kind] = {'figure': figure, 'fields': CONTRIBUTOR_CHARTS[kind]}
+        self.contributors[index][kind] = series
+        return f'<div class="chart" data-contributor="{index}" data-kind="{kind}"></div>'
+
+    def script(self):
+        payload = json.dumps({'figures': self.figures, 'template': self.template, 'shared': self.shared,
+                              'contributors': self.contributors}, separators=(',', ':'))
+        # Keep the JSON from closing the script element early
+        return ('<script type="application/json" id="figures">'
+                + payload.replace('</', '<\\/') + '</script>')
+
+
+def _metric_cards(counters, css_class='metrics'):
+    cards = ''.join(
+        f'<div class="metric-card"><div class="metric-label">{html.escape(label)}</div>'
+        f'<div class="metric-value">{html.escape(str(value))}</div></div>'
+        for label, value in counters)
+    return f'<div class="{css_class}">{cards}</div>'
+
+
+def _table(frame):
+    return frame.to_html(index=False, border=0, escape=True, na_rep='')
+
+
+def _other_ranges(label, ranges):
+    """Runner-up streaks or gaps, collapsed like the dashboard's expanders"""
+    if len(ranges) <= 1:
+        return ''
+    items = ''.join(f'<li><b>{days} days:</b> {start} to {end}</li>' for days, start, end in ranges[1:])
+    return f'<details><summary>Other long {label}</summary><ul>{items}</ul></details>'
+
+
+def _repository_details(repo_table, csv_name):
+    """Top 10 table plus every repository (sortable by clicking a count column)"""
+    frame = repo_table.frame
+    values = frame.iloc[:, 1:].to_numpy(dtype=object)
+    headers = ''.join(f'<th data-sort>{html.escape(c)}</th>' if c not in ('#', 'Repository')
+                      else f'<th>{html.escape(c)}</th>' for c in frame.columns)
+    # data-order keeps repository order for ties, as RepoTable.order does
+    rows = ''.join(
+        f'<tr data-order="{position}"><td>{rank}</td>'
+        + ''.join(f'<td>{html.escape(str(v))}</td>' for v in values[position]) + '</tr>'
+        for rank, position in enumerate(repo_table.order('Stars'), start=1))
+    csv = base64.b64encode(repo_table.csv('Stars')).decode('ascii')
+    return (
+        '<h3>Repository Details (Top 10)</h3>' + _table(repo_table.top(10))
+        + '<h3>Repository Details (All Repositories)</h3>'
+        f'<p>{len(repo_table)} repositories, sorted by Stars; click a column to sort by it. '
+        f'<a download="{html.escape(csv_name)}" href="data:text/csv;base64,{csv}">Download All Repositories as CSV</a></p>'
+        f'<div class="table-scroll"><table><thead><tr>{headers}</tr></thead><tbody>{rows}</tbody></table></div>'
+    )
+
+
+def _overview(metrics, repo_table, figures):
+    longest_gap, gap_start_date, gap_end_date = metrics['longest_gap']
+    longest_streak, streak_start_date, streak_end_date = metrics['longest_streak']
+    busiest_day, busiest_day_count = metrics['busiest_day']
+    counters = key_metrics(metrics)
+    fig_contrib = top_contributors_figure(metrics['contributor_stats'])
+    summary = ''.join(
+        f'<div><h4>{html.escape(section)}</h4>'
+        + ''.join(f'<p>{html.escape(label)}: <b>{html.escape(value)}</b></p>' for label, value in rows) + '</div>'
+        for section, rows in summary_statistics(metrics).items())
+
+    return (
+        '<h3>Key Metrics</h3>' + _metric_cards(counters[:5]) + _metric_cards(counters[5:])
+        + '<hr><h3>Activity Heatmap</h3>' + figures.div(heatmap_figure(metrics['activity_heatmap']))
+        + '<hr><div class="columns"><div><h3>Longest Streaks</h3><div class="info">'
+        f'<b>Streak Duration:</b> {longest_streak} days<br><b>From:</b> {streak_start_date} to {streak_end_date}</div>'
+        + _other_ranges('streaks', metrics['top_streaks']) + '</div>'
+        '<div><h3>Time Statistics</h3><div class="info">'
+        f'<b>Longest Gap:</b> {longest_gap} days<br><b>From:</b> {gap_start_date} to {gap_end_date}<br>'
+        f'<b>Busiest Day:</b> {busiest_day} ({busiest_day_count} events)</div>'
+        + _other_ranges('gaps', metrics['top_gaps']) + '</div></div>'
+        + '<hr><div class="columns">'
+        '<div><h3>Monthly Activity</h3>' + figures.div(monthly_activity_figure(metrics['month_wise_activity'])) + '</div>'
+        '<div><h3>Activity by Hour</h3>' + figures.div(hourly_activity_figure(metrics['hourly_activity'])) + '</div>'
+        '</div>'
+        + '<hr><h3>Activity by Day of Week</h3>' + figures.div(weekday_activity_figure(metrics['commit_frequency']))
+        + '<hr><h3>Top 10 Most Active Repositories</h3>' + figures.div(top_repositories_figure(repo_table, 10))
+        + '<hr><h3>Top 10 Contributors</h3>'
+        + (figures.div(fig_contrib) if fig_contrib is not None
+           else '<div class="info">No contributor data available or all contributors are unknown.</div>')
+        + '<hr>' + _repository_details(repo_table, 'all_repositories.csv')
+        + f'<hr><h3>Summary Statistics</h3><div class="columns">{summary}</div>'
+    )
+
+
+def _profile(index, name, info, figures):
+    chart = figures.contributor(name)
+    counters = [("Total Activities", info['total_activities']),
+                ("Repositories", len(info['repositories_contributed']))]
+    if info['most_active_day']:
+        counters.append(("Most Active Day", info['most_active_day']))
+    if info['most_active_hour'] is not None:
+        counters.append(("Most Active Hour", f"{info['most_active_hour']}:00"))
+
+    breakdown = info['activity_type_breakdown']
+    fig_activity = ''
+    if breakdown:
+        fig_activity = figures.contributor_div(
+            chart, 'activity', (list(breakdown), [int(count) for count in breakdown.values()]),
+            lambda: activity_breakdown_figure('', breakdown))
+    repositories = ''.join(f'<li>{html.escape(repo)}</li>' for repo in info['repositories_contributed'])
+    timeline_data = info['timeline']
+    timeline = ''
+    if len(timeline_data) > 0:
+        daily = timeline_daily_counts(timeline_data)
+        timeline = _table(timeline_table(timeline_data)) + figures.contributor_div(
+            chart, 'timeline', ([str(day) for day in daily['date']], daily['count'].tolist()),
+            lambda: contributor_timeline_figure('', timeline_data))
+
+    return (
+        f'<div class="profile" data-index="{index}" hidden>'
+        f'<h3>{html.escape(name)} - Contribution Profile</h3>' + _metric_cards(counters, 'metrics four')
+        + '<hr><div class="columns"><div><h3>Activity Type Breakdown</h3>' + fig_activity + '</div>'
+        '<div><h3>Repositories Contributed To</h3>'
+        + (f'<ul>{repositories}</ul>' if repositories else '<div class="info">No repository data available</div>')
+        + '</div></div><hr><h3>Recent Activities Timeline</h3>' + timeline + '</div>'
+    )
+
+
+def _contributors(contributors, figures):
+    names = contributors.contributors() if contributors is not None else []
+    if not names:
+        return '<h3>Contributor Analytics</h3><div class="info">No contributors found in the data.</div>'
+    options = ''.join(f'<option value="{i}">{html.escape(name)}</option>' for i, name in enumerate(names))
+    # Every profile in one grouped pass rather than a scan per contributor
+    grouped = contributorProfiles(contributors.data, limit=20)
+    profiles = ''.join(_profile(i, name, grouped[name.lower()], figures) for i, name in enumerate(names))
+    return (
+        '<h3>Contributor Analytics</h3><h4>Select Contributor</h4>'
+        '<select id="contributor"><option value="">Choose a contributor to view their contribution details</option>'
+        f'{options}</select>{profiles}'
+    )
+
+
+def render_html(metrics, repo_table, contributors, org_config, plotlyjs='inline', banner_path=None):
+    """
+    Render the whole recap as one HTML page.
+
+    Args:
+        metrics (dict): Output of computeMetrics or ActivityCube.metrics
+        repo_table (RepoTable): Repository table of the same data
+        contributors (ContributorIndex): Index of the same data's rows; the
+            Contributors tab is left empty when None
+        org_config (dict): Organization entry from ORGANIZATIONS, for
+            names, year and colors
+        plotlyjs (str): 'inline' to embed plotly.js (about 4.5 MB, works
+            offline) or 'cdn' to load it from cdn.plot.ly
+        banner_path (str): Banner image embedded in the header when the
+            organization shows one and the file exists
+
+    Returns:
+        str: The page, with every figure embedded as Plotly JSON
+    """
+    figures = _Figures()
+    overview = _overview(metrics, repo_table, figures)
+    contributors_html = _contributors(contributors, figures)
+    repositories = ('<h3>Top 10 Most Active Repositories</h3>' + figures.div(top_repositories_figure(repo_table, 10))
+                    + '<hr>' + _repository_details(repo_table, 'all_repositories.csv'))
+
+    name = html.escape(org_config['name'])
+    full_name = html.escape(org_config['full_name'])
+    year = org_config['year']
+    banner = ''
+    if org_config.get('show_banner') and banner_path and os.path.exists(banner_path):
+        with open(banner_path, 'rb') as f:
+            banner = f'<img alt="" src="data:image/jpeg;base64,{base64.b64encode(f.read()).decode("ascii")}">'
+    if plotlyjs == 'cdn':
+        plotly_script = f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"></script>'
+    else:
+        plotly_script = f'<script>{get_plotlyjs()}</script>'
+    style = (STYLE.replace('{primary}', org_config['color_primary'])
+             .replace('{secondary}', org_config['color_secondary']))
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{name} GitHub Analytics {year}</title>
+<style>{style}</style>
+{plotly_script}
+</head>
+<body>
+<header>
+<h1>{full_name} GitHub Analytics</h1>
+<div>Comprehensive GitHub activity analysis and insights - {year} Yearly Recap</div>
+<div>{html.escape(org_config.get('description', ''))}</div>
+{banner}
+</header>
+<main>
+<nav>
+<button data-section="overview">Overview</button>
+<button data-section="contributors">Contributors</button>
+<button data-section="repositories">Repositories</button>
+</nav>
+<section id="overview">{overview}</section>
+<section id="contributors" hidden>{contributors_html}</section>
+<section id="repositories" hidden>{repositories}</section>
+</main>
+<footer>{full_name} - GitHub Analytics Dashboard | {name} {year} Yearly Recap | Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</footer>
+{figures.script()}
+<script>{SCRIPT}</script>
+</body>
+</html>
+"""
+
+
+def export_html(path, metrics, repo_table, contributors, org_config, plotlyjs='inline', banner_path=BANNER_PATH):
+    """
+    Write the recap from render_html to a file, replacing it atomically.
+
+    Returns:
+        str: Path of the written page
+    """
+    return write_html(path, render_html(metrics, repo_table, contributors, org_config, plotlyjs, banner_path))
+
+
+def write_html(path, page):
+    """
+    Write a rendered page to a file, replacing it atomically.
+
+    Returns:
+        str: Path of the written page
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(page)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,314 @@
+"""
+Local SQLite store of Discrub exports.
+
+Keeps years of exports for an organization in one indexed database, so a
+dashboard or report over one year reads only that year's rows.
+
+Examples:
+    python core/store.py stores/gdgvit.sqlite exports/GDGVIT_2023.csv exports/GDGVIT_2024.csv
+"""
+import argparse
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from cube import NO_DAY, ActivityCube, first_appearance, renumber, author_logins
+from instrumentation import configure_logging, instrumented
+from main import EVENT_COLUMNS, EVENT_SCHEMA, classifyEvents, clean_data, normalize_events
+from streaming import DEFAULT_CHUNKSIZE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS repos (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS authors (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    source INTEGER NOT NULL REFERENCES sources(id),
+    timestamp INTEGER,
+    day INTEGER,
+    hour INTEGER,
+    event_type INTEGER NOT NULL,
+    repo INTEGER REFERENCES repos(id),
+    count INTEGER NOT NULL,
+    author INTEGER NOT NULL REFERENCES authors(id),
+    title TEXT
+);
+CREATE INDEX IF NOT EXISTS events_timestamp ON events(timestamp);
+CREATE INDEX IF NOT EXISTS events_repo ON events(repo);
+CREATE INDEX IF NOT EXISTS events_author ON events(author);
+CREATE INDEX IF NOT EXISTS events_event_type ON events(event_type);
+CREATE INDEX IF NOT EXISTS events_source ON events(source);
+-- One row per (name, url); a missing value maps to a blob, which never
+-- equals a text value, so authors without a name or URL are not repeated
+CREATE UNIQUE INDEX IF NOT EXISTS authors_identity ON authors(IFNULL(name, x''), IFNULL(url, x''));
+-- Events counted once across exports: a message stored from several
+-- exports is read from the first one ingested. The unary + keeps SQLite on
+-- the timestamp index, far more selective than the author one. Position
+-- orders events by export, then by row, so re-ingesting an export that
+-- changed keeps its place
+CREATE VIEW IF NOT EXISTS unique_events AS
+SELECT e.*, (e.source << 40) + e.id AS position FROM events e WHERE NOT EXISTS (
+    SELECT 1 FROM events d WHERE d.timestamp IS e.timestamp AND +d.author = e.author
+    AND d.title IS e.title AND d.source < e.source
+);
+"""
+EVENT_FIELDS = 'source, timestamp, day, hour, event_type, repo, count, author, title'
+
+
+_US_PER_DAY = 86_400_000_000
+
+
+def year_range(year):
+    """First and last day of a year, the slice a dashboard over one org-year reads"""
+    return date(year, 1, 1), date(year, 12, 31)
+
+
+class EventStore:
+    """
+    Discrub events of one or more exports, in a SQLite database.
+
+    Each event is stored classified: timestamp (microseconds since the
+    epoch, naive UTC), day and hour, event type (index into REPO_METRICS),
+    repository and author (interned into their own tables), commit count
+    and title. Timestamp, repository, author and event type are indexed.
+    Events keep the order they were ingested in, export by export, so
+    metrics computed from the store list repositories and people in the
+    same order as computeMetrics on the exports.
+
+    A message is identified by its timestamp, author (name and URL) and
+    title. Exports may overlap, such as a Q1 export and one of the whole
+    year. Every export's events are stored, and queries read a message only
+    from the first export ingested that has it, so it is counted once
+    however the exports are re-ingested. Repeats within one export are
+    kept, as computeMetrics on that export counts them.
+
+    Connections are opened per call, so a store can be shared between
+    threads.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with self._connect() as db:
+            db.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    @instrumented
+    def ingest(self, csv_path, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Add a Discrub export to the store.
+
+        An export is identified by its absolute path. Ingesting it again is
+        a no-op while the file is unchanged; once it changes, its events are
+        replaced. Messages other exports also have are stored too, and
+        counted once when the store is queried.
+
+        Args:
+            csv_path (str): Path to the Discrub CSV export
+            chunksize (int): Rows parsed and inserted at a time
+
+        Returns:
+            int: Events added, 0 when the export was already up to date
+        """
+        stat = os.stat(csv_path)
+        path = os.path.abspath(csv_path)
+        with self._connect() as db:
+            known = db.execute('SELECT id, mtime_ns, size FROM sources WHERE path = ?', (path,)).fetchone()
+            if known and known[1:] == (stat.st_mtime_ns, stat.st_size):
+                return 0
+            if known:
+                source = known[0]
+                db.execute('DELETE FROM events WHERE source = ?', (source,))
+                db.execute('UPDATE sources SET mtime_ns = ?, size = ? WHERE id = ?',
+                           (stat.st_mtime_ns, stat.st_size, source))
+            else:
+                source = db.execute('INSERT INTO sources (path, mtime_ns, size) VALUES (?, ?, ?)',
+                                    (path, stat.st_mtime_ns, stat.st_size)).lastrowid
+
+            repos = dict(db.execute('SELECT name, id FROM repos'))
+            authors = {(name, url): id for id, name, url in db.execute('SELECT id, name, url FROM authors')}
+            added = 0
+            for chunk in clean_data(csv_path, chunksize=chunksize):
+                rows = self._event_rows(db, normalize_events(chunk), source, repos, authors)
+                added += db.executemany(
+                    f'INSERT INTO events ({EVENT_FIELDS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows).rowcount
+        return added
+
+    @staticmethod
+    def _event_rows(db, events, source, repos, authors):
+        """Rows to insert for a normalized chunk, interning new repositories and authors"""
+        classified = classifyEvents(events['embeds.0.title'])
+        event_type = classified['event_type'].to_numpy()
+
+        # Interned with INSERT OR IGNORE and read back, so a name another
+        # connection added meanwhile is reused rather than repeated
+        names = classified['repo'].where(event_type >= 0).dropna().unique()
+        for name in names:
+            if name not in repos:
+                db.execute('INSERT OR IGNORE INTO repos (name) VALUES (?)', (name,))
+                repos[name] = db.execute('SELECT id FROM repos WHERE name = ?', (name,)).fetchone()[0]
+        repo = classified['repo'].where(event_type >= 0).map(repos)
+
+        keys = list(zip(_nullable(events['embeds.0.author.name']), _nullable(events['embeds.0.author.url'])))
+        for key in dict.fromkeys(keys):
+            if key not in authors:
+                db.execute('INSERT OR IGNORE INTO authors (name, url) VALUES (?, ?)', key)
+                authors[key] = db.execute('SELECT id FROM authors WHERE name IS ? AND url IS ?', key).fetchone()[0]
+
+        timestamps = events['timestamp']
+        dated = timestamps.notna()
+        micros = timestamps.to_numpy().astype('datetime64[us]').view(np.int64)
+        return zip(
+            [source] * len(events),
+            _nullable(pd.Series(micros).where(dated.to_numpy())),
+            _nullable(pd.Series(micros // _US_PER_DAY).where(dated.to_numpy())),
+            _nullable(events['hour']),
+            event_type.tolist(),
+            _nullable(repo),
+            classified['count'].tolist(),
+            [authors[key] for key in keys],
+            _nullable(events['embeds.0.title']),
+        )
+
+    @instrumented
+    def cube(self, start=None, end=None):
+        """
+        Aggregate the stored events between two dates (inclusive) into an
+        ActivityCube with SQL; without dates, every event is included.
+
+        Returns:
+            ActivityCube: Same cube as build_cube on the matching rows
+        """
+        where, params = _range_clause(start, end)
+        with self._connect() as db:
+            cells = pd.read_sql_query(
+                'SELECT day, repo, event_type, author, COUNT(*) AS events, SUM(count) AS count, '
+                f'MIN(position) AS first FROM unique_events {where} '
+                'GROUP BY day, repo, event_type, author ORDER BY day', db, params=params)
+            dated = f'{where} AND' if where else 'WHERE'
+            hours = pd.read_sql_query(
+                f'SELECT day, hour, COUNT(*) AS events FROM unique_events {dated} timestamp IS NOT NULL '
+                'GROUP BY day, hour ORDER BY day, hour', db, params=params)
+            repo_names = dict(db.execute('SELECT id, name FROM repos'))
+            author_rows = pd.read_sql_query('SELECT id, name, url FROM authors', db, index_col='id')
+
+        cells['day'] = cells['day'].fillna(NO_DAY).astype(np.int32)
+        cells['repo'] = cells['repo'].fillna(-1).astype(np.int64)
+        cells['event_type'] = cells['event_type'].astype(np.int8)
+        cells['events'] = cells['events'].astype(np.int64)
+        cells['count'] = cells['count'].astype(np.int64)
+
+        # Renumber repositories and authors by first appearance in the slice
+        known = cells['repo'].to_numpy() >= 0
+        repo_ids = first_appearance(cells['repo'].to_numpy()[known], cells['first'].to_numpy()[known])
+        cells['repo'] = renumber(cells['repo'].to_numpy(), repo_ids)
+        author_ids = first_appearance(cells['author'].to_numpy(), cells['first'].to_numpy())
+        cells['author'] = renumber(cells['author'].to_numpy(), author_ids)
+        cells['first'] = cells['first'].astype(np.int64)
+
+        authors = author_rows.loc[author_ids]
+        authors = pd.DataFrame({
+            'name': authors['name'].to_numpy(dtype=object),
+            'login': author_logins(authors['url'].reset_index(drop=True)),
+        })
+        hours = pd.DataFrame({
+            'day': hours['day'].to_numpy(dtype=np.int32),
+            'hour': hours['hour'].to_numpy(dtype=np.int8),
+            'events': hours['events'].to_numpy(dtype=np.int64),
+        })
+        return ActivityCube(cells, hours,
+                            np.array([repo_names[id] for id in repo_ids], dtype=object), authors)
+
+    def metrics(self, start=None, end=None):
+        """
+        Compute the dashboard metrics over the stored events between two
+        dates (inclusive), or over every event.
+
+        Returns:
+            dict: Same keys and values as computeMetrics
+        """
+        return self.cube(start, end).metrics()
+
+    @instrumented
+    def events(self, start=None, end=None):
+        """
+        Read the stored events between two dates (inclusive) back as an
+        export, for views that need individual events.
+
+        Returns:
+            pd.DataFrame: EVENT_COLUMNS in ingestion order, with 'timestamp'
+            parsed to datetime64 (as load_events returns them)
+        """
+        where, params = _range_clause(start, end, column='e.timestamp')
+        with self._connect() as db:
+            rows = pd.read_sql_query(
+                'SELECT e.timestamp, e.title, a.name, a.url FROM unique_events e JOIN authors a ON a.id = e.author '
+                f'{where} ORDER BY e.position', db, params=params)
+        rows.columns = EVENT_COLUMNS
+        rows['timestamp'] = pd.to_datetime(rows['timestamp'], unit='us')
+        for column in ['embeds.0.title', 'embeds.0.author.name', 'embeds.0.author.url']:
+            rows[column] = rows[column].astype(EVENT_SCHEMA[column])
+        return rows
+
+
+def _nullable(values):
+    """Python values for SQLite, with missing values as None"""
+    values = pd.Series(values).astype(object)
+    return values.where(values.notna(), None).tolist()
+
+
+def _range_clause(start, end, column='timestamp'):
+    """WHERE clause (and parameters) selecting events between two dates, inclusive"""
+    if start is None and end is None:
+        return '', []
+    start = start or date.min
+    end = end or date.max - timedelta(days=1)
+    bounds = [_day_number(start) * _US_PER_DAY, (_day_number(end) + 1) * _US_PER_DAY]
+    return f'WHERE {column} >= ? AND {column} < ?', bounds
+
+
+def _day_number(day):
+    return int(np.datetime64(pd.Timestamp(day).date(), 'D').view(np.int64))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest Discrub exports into a local event store.")
+    parser.add_argument('store', help="SQLite database to create or update")
+    parser.add_argument('csvs', nargs='+', metavar='CSV', help="exports to ingest")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="rows read per chunk")
+    args = parser.parse_args(argv)
+    configure_logging()
+
+    store = EventStore(args.store)
+    for path in args.csvs:
+        added = store.ingest(path, chunksize=args.chunksize)
+        print(f"{path}: {added} events added" if added else f"{path}: up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
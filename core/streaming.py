@@ -0,0 +1,193 @@
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from main import (REPO_METRICS, clean_data, normalize_events, calendarFromDaily, heatmapFromDaily,
+                  timeBucketsFromHourly, developerCounts, developerActivityFromCounts, RepoMatrix, buildRepoMatrix,
+                  getTopRepositories, weekdayFrequencyFromCounts, topContributorsFromCounts)
+
+DEFAULT_CHUNKSIZE = 200_000
+
+
+def _add_counts(counter, counts):
+    """Add a Series of counts into a Counter, keeping first-seen key order"""
+    counter.update(dict(zip(counts.index, counts.tolist())))
+
+
+class ActivityAggregate:
+    """
+    Mergeable summary of an event stream.
+
+    Holds only per-day, per-hour, per-weekday, per-repository and per-author
+    counters, so its size depends on the number of distinct days, repos and
+    people rather than on the number of events. Aggregates built from
+    separate chunks, files or orgs combine with merge(), and report()
+    produces the same results as computeMetrics on the full event table.
+    """
+
+    def __init__(self):
+        self.total_events = 0
+        self.daily = Counter()          # day (pd.Timestamp) -> events
+        self.hourly = np.zeros(24, dtype=np.int64)
+        self.weekday = np.zeros(7, dtype=np.int64)
+        self.developers = Counter()     # GitHub login -> events
+        self.authors = Counter()        # author display name -> events
+        self.repos = {}                 # repo -> np.ndarray of REPO_METRICS counts
+        self.totals = np.zeros(len(REPO_METRICS), dtype=np.int64)
+
+    def update(self, data):
+        """
+        Fold one chunk of events into the aggregate.
+
+        Args:
+            data (pd.DataFrame): Event table from normalize_events
+        """
+        self.total_events += len(data)
+        _add_counts(self.daily, data.groupby('date').size())
+        self.hourly += np.bincount(data['hour'].dropna().astype(np.int64), minlength=24)
+        self.weekday += np.bincount(data['weekday'].dropna().astype(np.int64), minlength=7)
+        _add_counts(self.developers, developerCounts(data))
+        names = data['embeds.0.author.name'].dropna().astype(object)
+        _add_counts(self.authors, names.groupby(names, sort=False).size())
+
+        repo_matrix = buildRepoMatrix(data)
+        self._add_repos(repo_matrix.repos, repo_matrix.counts)
+        self.totals += repo_matrix.totals
+
+    def merge(self, other):
+        """
+        Combine another aggregate into this one.
+
+        Args:
+            other (ActivityAggregate): Aggregate of events not yet counted here
+
+        Returns:
+            ActivityAggregate: self, for chaining
+        """
+        self.total_events += other.total_events
+        self.daily.update(other.daily)
+        self.hourly += other.hourly
+        self.weekday += other.weekday
+        self.developers.update(other.developers)
+        self.authors.update(other.authors)
+        self._add_repos(list(other.repos), list(other.repos.values()))
+        self.totals += other.totals
+        return self
+
+    def to_dict(self):
+        """JSON-serializable copy of the counters, preserving key order"""
+        return {
+            'total_events': self.total_events,
+            'daily': {day.strftime('%Y-%m-%d'): int(n) for day, n in self.daily.items()},
+            'hourly': self.hourly.tolist(),
+            'weekday': self.weekday.tolist(),
+            'developers': dict(self.developers),
+            'authors': dict(self.authors),
+            'repos': {repo: row.tolist() for repo, row in self.repos.items()},
+            'totals': self.totals.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """Rebuild an aggregate from the output of to_dict"""
+        aggregate = cls()
+        aggregate.total_events = state['total_events']
+        aggregate.daily = Counter({pd.Timestamp(day): n for day, n in state['daily'].items()})
+        aggregate.hourly = np.array(state['hourly'], dtype=np.int64)
+        aggregate.weekday = np.array(state['weekday'], dtype=np.int64)
+        aggregate.developers = Counter(state['developers'])
+        aggregate.authors = Counter(state['authors'])
+        aggregate.repos = {repo: np.array(row, dtype=np.int64) for repo, row in state['repos'].items()}
+        aggregate.totals = np.array(state['totals'], dtype=np.int64)
+        return aggregate
+
+    def _add_repos(self, repos, rows):
+        for repo, row in zip(repos, rows):
+            if repo in self.repos:
+                self.repos[repo] += row
+            else:
+                self.repos[repo] = np.array(row, dtype=np.int64)
+
+    def daily_counts(self):
+        """Events per active day, sorted by day"""
+        return pd.Series(self.daily, dtype=np.int64).sort_index()
+
+    def report(self):
+        """
+        Compute the dashboard metrics from the aggregated counters.
+
+        Returns:
+            dict: Same keys and values as computeMetrics
+        """
+        daily = self.daily_counts()
+        days = daily.index.to_numpy().astype('datetime64[D]')
+        calendar_metrics = calendarFromDaily(days, daily.to_numpy())
+
+        month_wise_activity = daily.groupby(daily.index.to_period('M')).sum()
+        month_wise_activity.index.name = 'month'
+
+        hourly = pd.Series(self.hourly)
+        hourly = hourly[hourly > 0]
+        weekday = pd.Series(self.weekday)
+
+        repo_matrix = RepoMatrix(list(self.repos), np.array(list(self.repos.values()), dtype=np.int64),
+                                 self.totals)
+
+        daily_activity = daily.copy()
+        daily_activity.index = daily_activity.index.date
+
+        return {
+            'total_active_days': calendar_metrics['total_active_days'],
+            'longest_gap': calendar_metrics['longest_gap'],
+            'busiest_day': calendar_metrics['busiest_day'],
+            'longest_streak': calendar_metrics['longest_streak'],
+            'top_streaks': calendar_metrics['top_streaks'],
+            'top_gaps': calendar_metrics['top_gaps'],
+            'month_wise_activity': month_wise_activity,
+            'time_wise_activity': timeBucketsFromHourly(hourly),
+            'developer_activity': developerActivityFromCounts(pd.Series(self.developers, dtype=np.int64)),
+            'repo_matrix': repo_matrix,
+            'top_repos': getTopRepositories(repo_matrix, limit=10),
+            'commit_frequency': weekdayFrequencyFromCounts(weekday[weekday > 0]),
+            'hourly_activity': hourly,
+            'daily_activity': daily_activity,
+            'activity_heatmap': heatmapFromDaily(days, daily.to_numpy()),
+            'contributor_stats': topContributorsFromCounts(pd.Series(self.authors, dtype=np.int64)),
+            'total_events': self.total_events,
+        }
+
+
+def aggregate_csv(path, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Stream a Discrub export through an ActivityAggregate in bounded memory.
+
+    Args:
+        path (str or file-like): CSV export to read
+        chunksize (int): Rows parsed and held in memory at a time
+
+    Returns:
+        ActivityAggregate: Counters for every event in the export
+    """
+    aggregate = ActivityAggregate()
+    for chunk in clean_data(path, chunksize=chunksize):
+        aggregate.update(normalize_events(chunk))
+    return aggregate
+
+
+def stream_metrics(paths, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Compute the dashboard metrics over one or more exports without loading
+    any of them fully into memory.
+
+    Args:
+        paths (list): CSV exports to combine, for example several orgs or years
+        chunksize (int): Rows parsed and held in memory at a time
+
+    Returns:
+        dict: Same keys and values as computeMetrics
+    """
+    aggregate = ActivityAggregate()
+    for path in paths:
+        aggregate.merge(aggregate_csv(path, chunksize=chunksize))
+    return aggregate.report()
@@ -1,10 +1,9 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import os
 import sys
-from pathlib import Path
+import json
+import threading
+from collections import OrderedDict
 
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,19 +20,244 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# NOW import remaining modules after set_page_config
-from main import (clean_data, totalActiveDays, longestGap, busiestDay, longestStreak, 
-                  monthWiseActivity, timeWiseActivity, allDeveloperActivity, repoActivity,
-                  getTopRepositories, getCommitFrequency, getActivityByHour, getActivityCalendar,
-                  getMostActiveRepositories, getContributorStats, getContributorDetails, getContributorTimeline)
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime, timedelta
+# NOW import remaining modules after set_page_config. Only modules without
+# heavy dependencies are imported up front, so the sidebar is drawn before
+# pandas, plotly and the analysis modules load; those are imported where a
+# view first needs them.
+from instrumentation import collect_trace, configure_logging
+from datetime import datetime
 
 # Load environment variables
 import dotenv
 dotenv.load_dotenv()
+configure_logging()
+
+
+@st.cache_resource
+def result_cache():
+    """
+    The ResultCache shared by every session of this server process.
+
+    Loaded datasets and their metrics survive reruns (widget changes, page
+    clicks) and are recomputed only when the source file changes. Sessions
+    viewing the same export share one read-only copy, and the cache holds
+    at most RESULT_CACHE_MB of them for the whole process.
+    """
+    from cache import ResultCache
+    return ResultCache(max_bytes=int(os.getenv('RESULT_CACHE_MB', '512')) * 1024 * 1024)
+
+
+def metrics_dataset(columns, cube):
+    """Metrics and tables the dashboard shows, all queried from an activity cube"""
+    from repo_table import RepoTable
+
+    metrics = cube.metrics()
+    return {
+        'columns': columns,
+        'cube': cube,
+        'metrics': metrics,
+        'repo_table': RepoTable(metrics['repo_matrix']),
+        # Guards the parts built on first use, as sessions share datasets
+        'lock': threading.RLock(),
+    }
+
+
+def build_dataset(read, keep_rows=True, source=None):
+    """
+    Read an export, normalize it and aggregate it into everything the
+    dashboard shows.
+
+    Rows are needed only for contributor profiles and timelines. Without
+    keep_rows they are dropped once aggregated and read again through
+    `read` the first time a view needs them, so the dataset holds just the
+    cube; use it when `read` can be repeated cheaply. `source` is then the
+    file `read` loads: with RESULT_CACHE_DIR set, its columns and cube are
+    shared with other processes by the file's fingerprint, and a process
+    that finds them there does not read the file until rows are needed.
+    """
+    from main import normalize_events
+    from cube import build_cube
+    from disk_cache import file_cached
+
+    def aggregate():
+        raw_data = read()
+        events = normalize_events(raw_data)
+        return raw_data.columns.tolist(), build_cube(events), events
+
+    with collect_trace() as trace:
+        if keep_rows or source is None:
+            columns, cube, events = aggregate()
+        else:
+            columns, cube = file_cached(source, lambda: aggregate()[:2], 'build_dataset')
+        dataset = metrics_dataset(columns, cube)
+    if keep_rows:
+        dataset['events'] = events
+    else:
+        dataset['read_events'] = lambda: normalize_events(read())
+    # Per-metric timings of this computation, for the Performance panel
+    dataset['trace'] = trace.records
+    return dataset
+
+
+def store_dataset(path, year):
+    """One year of an event store, aggregated in SQL; rows are read only if the Contributors tab needs them"""
+    from main import EVENT_COLUMNS, normalize_events
+    from store import EventStore, year_range
+
+    store = EventStore(path)
+    start, end = year_range(year)
+    with collect_trace() as trace:
+        dataset = metrics_dataset(EVENT_COLUMNS, store.cube(start, end))
+    dataset['trace'] = trace.records
+    dataset['read_events'] = lambda: normalize_events(store.events(start, end))
+    return dataset
+
+
+def scoped_dataset(dataset, start, end, max_windows=4):
+    """
+    The dataset restricted to events between two dates (inclusive).
+
+    Metrics come from a slice of the activity cube. The matching rows, needed
+    only by the Contributors tab, are sliced from an EventTimeline built on
+    first use. The most recent windows are kept with the dataset. Returns
+    None when no events fall in the range.
+    """
+    with dataset['lock']:
+        windows = dataset.setdefault('windows', OrderedDict())
+        key = (start, end)
+        if key in windows:
+            windows.move_to_end(key)
+            return windows[key]
+
+        cube = dataset['cube'].window(start, end)
+        if cube.total_events == 0:
+            return None
+        with collect_trace() as trace:
+            scoped = metrics_dataset(dataset['columns'], cube)
+        scoped['trace'] = trace.records
+        scoped['read_events'] = lambda: event_timeline(dataset).window(start, end)
+        # Windows are charged to the cached dataset they were cut from
+        scoped['parent'] = dataset
+        windows[key] = scoped
+        while len(windows) > max_windows:
+            windows.popitem(last=False)
+        recharge(dataset)
+        return scoped
+
+
+def lazy_member(dataset, key, build):
+    """dataset[key], built on first use by whichever session needs it first while the others wait"""
+    if key not in dataset:
+        with dataset['lock']:
+            if key not in dataset:
+                dataset[key] = build()
+                recharge(dataset)
+    return dataset[key]
+
+
+def recharge(dataset):
+    """Update the result cache's size of a dataset (or of the one it is a window of) after it grew"""
+    cached = dataset.get('parent', dataset)
+    with cached['lock']:
+        result_cache().recharge(cached)
+
+
+def dataset_events(dataset):
+    """The dataset's rows, read on first use when they were not kept at load time"""
+    return lazy_member(dataset, 'events', lambda: dataset['read_events']())
+
+
+def event_timeline(dataset):
+    from main import EventTimeline
+    return lazy_member(dataset, 'timeline', lambda: EventTimeline(dataset_events(dataset), classify=False))
+
+
+def contributor_index(dataset):
+    """ContributorIndex over the dataset's rows, built the first time the Contributors tab needs it"""
+    from main import ContributorIndex
+    return lazy_member(dataset, 'contributor_index', lambda: ContributorIndex(dataset_events(dataset)))
+
+
+def recap_html(dataset):
+    """The static recap page of a dataset, rendered the first time it is downloaded"""
+    from static_export import render_html
+    return lazy_member(dataset, 'recap_html', lambda: render_html(
+        dataset['metrics'], dataset['repo_table'], contributor_index(dataset), org_config, banner_path="banner.jpeg"))
+
+def render_top_repositories(repo_table, key):
+    """Bar chart of the 10 most active repositories"""
+    from recap import top_repositories_figure
+
+    st.markdown("### Top 10 Most Active Repositories")
+
+    fig_repos = top_repositories_figure(repo_table, 10)
+    st.plotly_chart(fig_repos, use_container_width=True, key=f"top_repos_{key}")
+
+
+def render_repository_details(repo_table, key):
+    """Top 10 table plus the sortable, paginated table of every repository"""
+    st.markdown("### Repository Details (Top 10)")
+    st.dataframe(repo_table.top(10), use_container_width=True)
+
+    st.markdown("---")
+
+    # Detailed Repository Stats - All Repositories
+    st.markdown("### Repository Details (All Repositories)")
+
+    # Sorting options
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.markdown("**Sort by:**")
+    with col2:
+        sort_by = st.selectbox(
+            "Sort repositories by",
+            options=['Stars', 'Commits', 'PRs', 'Issues', 'Forks', 'Actions Success'],
+            label_visibility="collapsed",
+            key=f"sort_by_{key}"
+        )
+
+    # Pagination
+    items_per_page = st.selectbox(
+        "Repositories per page",
+        options=[10, 20, 50, 100, len(repo_table)],
+        index=0,
+        key=f"items_per_page_{key}"
+    )
+
+    total_pages = repo_table.page_count(items_per_page)
+    page = st.number_input(
+        "Page",
+        min_value=1,
+        max_value=max(1, total_pages),
+        value=1,
+        key=f"page_number_{key}"
+    )
+
+    # Sort orders are cached per column, so this only slices the table
+    page_data = repo_table.page(sort_by, page, items_per_page)
+
+    # Display metrics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Repositories", len(repo_table))
+    with col2:
+        st.metric("Total Pages", total_pages)
+    with col3:
+        st.metric("Current Page", page)
+    with col4:
+        st.metric("Repos on Page", len(page_data))
+
+    # Display table
+    st.dataframe(page_data, use_container_width=True, hide_index=True)
+
+    # Export option; the CSV is generated on click and cached per sort order
+    st.download_button(
+        label="Download All Repositories as CSV",
+        data=lambda: repo_table.csv(sort_by),
+        file_name="all_repositories.csv",
+        mime="text/csv",
+        key=f"download_repos_{key}"
+    )
 
 # ===== SIDEBAR CONFIGURATION =====
 st.sidebar.title("Dashboard Configuration")
@@ -61,9 +285,14 @@ st.sidebar.subheader("Data Management")
 # Construct expected filename
 expected_filename = f"{org_name}_{org_year}.csv"
 
-# Support loading from environment variable or specific data directory
+# Organizations with an event store read their year from it instead of a CSV
+store_path = org_config.get("store")
 csv_path = None
-if os.getenv('CSV_DATA_PATH'):
+if store_path:
+    expected_filename = os.path.basename(store_path)
+    csv_path = store_path
+# Support loading from environment variable or specific data directory
+elif os.getenv('CSV_DATA_PATH'):
     # If environment variable is set, use that path
     csv_path = os.path.join(os.getenv('CSV_DATA_PATH'), expected_filename)
 else:
@@ -81,12 +310,24 @@ data_source = st.sidebar.radio(
 )
 
 data_loaded = False
-data = None
+dataset = None
 
 if data_source == "Use Default File":
     if os.path.exists(csv_path):
         try:
-            data = pd.read_csv(csv_path)
+            with st.spinner('Loading and processing data...'):
+                from cache import file_fingerprint
+                if store_path:
+                    dataset = result_cache().get_or_compute(
+                        (org_key, "store"), file_fingerprint(store_path),
+                        lambda: store_dataset(store_path, org_year))
+                else:
+                    from snapshot import load_events
+                    dataset = result_cache().get_or_compute(
+                        (org_key, "default"), file_fingerprint(csv_path),
+                        # Rows are re-read (from the snapshot) only if a view needs them
+                        lambda: build_dataset(lambda: load_events(csv_path, os.getenv('SNAPSHOT_DIR')),
+                                              keep_rows=False, source=csv_path))
             data_loaded = True
             st.sidebar.success(f"Loaded: {expected_filename}")
         except Exception as e:
@@ -101,21 +342,94 @@ else:
     )
     if uploaded_file is not None:
         try:
-            data = pd.read_csv(uploaded_file)
+            with st.spinner('Loading and processing data...'):
+                from cache import content_fingerprint
+                from main import clean_data
+                # Uploads are keyed by content, so sessions uploading different
+                # files do not evict each other. There is no file to read the
+                # rows from again, so they are kept with the dataset. The
+                # content is hashed once per uploaded file, not on every rerun.
+                file_id, digest = st.session_state.get('upload_digest', (None, None))
+                if file_id != uploaded_file.file_id:
+                    digest = content_fingerprint(uploaded_file.getvalue())
+                    st.session_state['upload_digest'] = (uploaded_file.file_id, digest)
+                dataset = result_cache().get_or_compute(
+                    ("upload", digest), digest,
+                    lambda: build_dataset(lambda: clean_data(uploaded_file)))
             data_loaded = True
             st.sidebar.success(f"Loaded: {uploaded_file.name}")
         except Exception as e:
             st.sidebar.error(f"Error loading file: {e}")
 
 # Data preview in sidebar
-if data_loaded and data is not None:
+if data_loaded and dataset is not None:
     st.sidebar.markdown("---")
     st.sidebar.subheader("Data Preview")
-    st.sidebar.write(f"**Rows:** {len(data)}")
-    st.sidebar.write(f"**Columns:** {len(data.columns)}")
+    st.sidebar.write(f"**Rows:** {dataset['metrics']['total_events']}")
+    st.sidebar.write(f"**Columns:** {len(dataset['columns'])}")
     
     with st.sidebar.expander("View Columns"):
-        st.write(data.columns.tolist())
+        st.write(dataset['columns'])
+
+    # Date range; every metric below is re-scoped to the selected window
+    active_days = dataset['metrics']['daily_activity'].index
+    if len(active_days) > 1:
+        first_day, last_day = active_days[0], active_days[-1]
+        date_range = st.sidebar.slider(
+            "Date range",
+            min_value=first_day,
+            max_value=last_day,
+            value=(first_day, last_day),
+            format="YYYY-MM-DD",
+            key=f"date_range_{first_day}_{last_day}",
+            help="Limit the dashboard to a period, such as a semester or a hackathon week"
+        )
+        if date_range != (first_day, last_day):
+            try:
+                scoped = scoped_dataset(dataset, *date_range)
+            except Exception as e:
+                st.sidebar.warning(f"Could not compute the selected range ({e}); showing the whole export.")
+            else:
+                if scoped is None:
+                    st.sidebar.warning("No activity in the selected range; showing the whole export.")
+                else:
+                    dataset = scoped
+                    st.sidebar.write(f"**Rows in range:** {dataset['metrics']['total_events']}")
+
+    # Static recap of the current view, rendered only when downloaded
+    st.sidebar.download_button(
+        "Download static recap (HTML)",
+        data=lambda: recap_html(dataset),
+        file_name=f"{org_name}_{org_year}_recap.html",
+        mime="text/html",
+        help="Self-contained page with the Overview, Contributors and Repositories views, for static hosting"
+    )
+
+    # Optional timing breakdown of the last computation
+    if st.sidebar.checkbox("Show performance", value=False):
+        with st.sidebar.expander("Performance", expanded=True):
+            import pandas as pd
+            # tracemalloc covers the whole server process, so it is set when
+            # the server starts rather than toggled by one session
+            if not os.getenv('WRAPPED_TRACE_MEMORY'):
+                st.caption("Peak memory is measured when the server runs with WRAPPED_TRACE_MEMORY=1 "
+                           "(slower, for every session).")
+
+            trace = pd.DataFrame(dataset['trace'], columns=['name', 'seconds', 'rows', 'peak_bytes', 'depth'])
+            total_seconds = trace.loc[trace['depth'] == 0, 'seconds'].sum()
+            st.write(f"**Computed in:** {total_seconds:.2f}s")
+            st.dataframe(pd.DataFrame({
+                'Step': ['· ' * depth + name for name, depth in zip(trace['name'], trace['depth'])],
+                'ms': (trace['seconds'] * 1000).round(1),
+                'Rows': trace['rows'].astype('Int64'),
+                'Peak MB': (trace['peak_bytes'].astype(float) / 2**20).round(1),
+            }), hide_index=True, use_container_width=True)
+            st.download_button(
+                "Download trace (JSON)",
+                data=json.dumps(dataset['trace'], indent=2),
+                file_name=f"{org_name}_{org_year}_trace.json",
+                mime="application/json",
+            )
 
 st.sidebar.markdown("---")
 st.sidebar.subheader("About")
@@ -194,98 +508,49 @@ if not data_loaded:
        - `embeds.0.author.url`: Author URL
     """)
 else:
-    # Data processing and analysis
-    with st.spinner('Loading and processing data...'):
-        # Calculate all metrics
-        total_active_days = totalActiveDays(data)
-        longest_gap, gap_start_date, gap_end_date = longestGap(data)
-        busiest_day, busiest_day_count = busiestDay(data)
-        longest_streak, streak_start_date, streak_end_date = longestStreak(data)
-        month_wise_activity = monthWiseActivity(data)
-        time_wise_activity = timeWiseActivity(data)
-        developer_activity, most_active_developer = allDeveloperActivity(data)
-        repo_activity_dict, stars, issues_opened, issues_resolved, pr_opened, pr_closed, commits, branches, forks, actions_success, action_failures, new_collaborator, comments = repoActivity(data)
-        
-        # New metrics
-        top_repos = getTopRepositories(repo_activity_dict, limit=10)
-        commit_frequency = getCommitFrequency(data)
-        hourly_activity = getActivityByHour(data)
-        daily_activity = getActivityCalendar(data)
-        contributor_stats = getContributorStats(data)
-
-    # Add tabs for different views
-    tab1, tab2, tab3 = st.tabs(["Overview", "Contributors", "Repositories"])
+    import pandas as pd
+    from recap import (key_metrics, summary_statistics, heatmap_figure, monthly_activity_figure,
+                       hourly_activity_figure, weekday_activity_figure, top_contributors_figure,
+                       activity_breakdown_figure, timeline_table, contributor_timeline_figure)
+
+    # Metrics are computed once per dataset by the cached loader
+    metrics = dataset['metrics']
+    longest_gap, gap_start_date, gap_end_date = metrics['longest_gap']
+    busiest_day, busiest_day_count = metrics['busiest_day']
+    longest_streak, streak_start_date, streak_end_date = metrics['longest_streak']
+    month_wise_activity = metrics['month_wise_activity']
+    time_wise_activity = metrics['time_wise_activity']
+    developer_activity, most_active_developer = metrics['developer_activity']
+    commit_frequency = metrics['commit_frequency']
+    hourly_activity = metrics['hourly_activity']
+    daily_activity = metrics['daily_activity']
+    contributor_stats = metrics['contributor_stats']
+    repo_table = dataset['repo_table']
+
+    # Add tabs for different views. Each tab's content is a fragment that is
+    # only run while its tab is open, and widgets inside a tab rerun just
+    # that tab.
+    tab1, tab2, tab3 = st.tabs(["Overview", "Contributors", "Repositories"], key="section", on_change="rerun")
     
-    with tab1:
-        # Key metrics row 1
+    @st.fragment
+    def overview_section():
+        # Key metrics, two rows of five
         st.markdown("### Key Metrics")
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        with col1:
-            st.metric("Active Days", f"{total_active_days}", delta=None)
-        with col2:
-            st.metric("Total Stars", f"{stars}", delta=None)
-        with col3:
-            st.metric("Pull Requests", f"{pr_opened + pr_closed}", delta=None)
-        with col4:
-            st.metric("Issues", f"{issues_opened + issues_resolved}", delta=None)
-        with col5:
-            st.metric("Commits", f"{commits}", delta=None)
-
-        # Key metrics row 2
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        with col1:
-            st.metric("Branches", f"{branches}", delta=None)
-        with col2:
-            st.metric("Forks", f"{forks}", delta=None)
-        with col3:
-            st.metric("Actions Success", f"{actions_success}", delta=None)
-        with col4:
-            st.metric("Action Failures", f"{action_failures}", delta=None)
-        with col5:
-            st.metric("Repositories", f"{len(repo_activity_dict)}", delta=None)
+        counters = key_metrics(metrics)
+        for row in (counters[:5], counters[5:]):
+            for col, (label, value) in zip(st.columns(5), row):
+                with col:
+                    st.metric(label, f"{value}", delta=None)
 
         st.markdown("---")
 
         # Activity Heatmap
         st.markdown("### Activity Heatmap")
         
-        # Convert daily activity to DataFrame for heatmap
-        activity_df = pd.DataFrame({
-            'date': daily_activity.index,
-            'activity': daily_activity.values
-        })
-        activity_df['date'] = pd.to_datetime(activity_df['date'])
-        activity_df['week'] = activity_df['date'].dt.isocalendar().week
-        activity_df['day'] = activity_df['date'].dt.day_name()
-        activity_df['day_num'] = activity_df['date'].dt.dayofweek
-        
-        # Create heatmap
-        heatmap_data = activity_df.pivot_table(
-            values='activity', 
-            index='day_num', 
-            columns='week', 
-            aggfunc='sum',
-            fill_value=0
-        )
-        
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
-        fig = go.Figure(data=go.Heatmap(
-            z=heatmap_data.values,
-            y=[days[i] for i in heatmap_data.index],
-            colorscale='Greens',
-            showscale=True
-        ))
-        
-        fig.update_layout(
-            title="Activity Heatmap (Weekly View)",
-            xaxis_title="Week",
-            yaxis_title="Day of Week",
-            height=300
-        )
-        
+        # Weekday x week grid, computed once with the dataset's metrics
+        heatmap_data = metrics['activity_heatmap']
+
+        fig = heatmap_figure(heatmap_data)
         st.plotly_chart(fig, use_container_width=True, key="heatmap_overview")
 
         st.markdown("---")
@@ -299,6 +564,10 @@ else:
             **Streak Duration:** {longest_streak} days  
             **From:** {streak_start_date} to {streak_end_date}
             """)
+            if len(metrics['top_streaks']) > 1:
+                with st.expander("Other long streaks"):
+                    for days, start, end in metrics['top_streaks'][1:]:
+                        st.write(f"**{days} days:** {start} to {end}")
         
         with col2:
             st.markdown("### Time Statistics")
@@ -307,6 +576,10 @@ else:
             **From:** {gap_start_date} to {gap_end_date}  
             **Busiest Day:** {busiest_day} ({busiest_day_count} events)
             """)
+            if len(metrics['top_gaps']) > 1:
+                with st.expander("Other long gaps"):
+                    for days, start, end in metrics['top_gaps'][1:]:
+                        st.write(f"**{days} days:** {start} to {end}")
 
         st.markdown("---")
 
@@ -315,235 +588,60 @@ else:
         
         with col1:
             st.markdown("### Monthly Activity")
-            month_wise_activity.index = month_wise_activity.index.astype(str)
-            fig_month = px.bar(
-                x=month_wise_activity.index, 
-                y=month_wise_activity.values,
-                labels={'x': 'Month', 'y': 'Activity Count'},
-                color=month_wise_activity.values,
-                color_continuous_scale='Blues'
-            )
-            fig_month.update_layout(height=400, showlegend=False)
+            fig_month = monthly_activity_figure(month_wise_activity)
             st.plotly_chart(fig_month, use_container_width=True, key="monthly_activity_tab1")
         
         with col2:
             st.markdown("### Activity by Hour")
-            fig_hour = px.bar(
-                x=hourly_activity.index,
-                y=hourly_activity.values,
-                labels={'x': 'Hour of Day', 'y': 'Activity Count'},
-                color=hourly_activity.values,
-                color_continuous_scale='Purples'
-            )
-            fig_hour.update_layout(height=400, showlegend=False)
+            fig_hour = hourly_activity_figure(hourly_activity)
             st.plotly_chart(fig_hour, use_container_width=True, key="hourly_activity_tab1")
 
         st.markdown("---")
 
         # Day of Week Distribution
         st.markdown("### Activity by Day of Week")
-        fig_dow = px.bar(
-            x=commit_frequency.index,
-            y=commit_frequency.values,
-            labels={'x': 'Day of Week', 'y': 'Activity Count'},
-            color=commit_frequency.values,
-            color_continuous_scale='Oranges'
-        )
-        fig_dow.update_layout(height=400)
+        fig_dow = weekday_activity_figure(commit_frequency)
         st.plotly_chart(fig_dow, use_container_width=True, key="day_of_week_overview")
 
         st.markdown("---")
 
         # Top Repositories
-        st.markdown("### Top 10 Most Active Repositories")
-        
-        repo_names = [repo[0] for repo in top_repos]
-        repo_activities = [sum(repo[1].values()) for repo in top_repos]
-        
-        repos_df = pd.DataFrame({
-            'Repository': repo_names,
-            'Activity': repo_activities
-        })
-        
-        fig_repos = px.bar(
-            repos_df,
-            x='Activity',
-            y='Repository',
-            orientation='h',
-            color='Activity',
-            color_continuous_scale='Viridis'
-        )
-        fig_repos.update_layout(height=400, showlegend=False)
-        st.plotly_chart(fig_repos, use_container_width=True, key="top_repos_overview")
+        render_top_repositories(repo_table, "overview")
 
         st.markdown("---")
 
         # Top Contributors
         st.markdown("### Top 10 Contributors")
         
-        contributor_stats = getContributorStats(data)
-        
-        if contributor_stats is None or len(contributor_stats) == 0:
+        fig_contrib = top_contributors_figure(contributor_stats)
+        if fig_contrib is None:
             st.info("No contributor data available or all contributors are unknown.")
         else:
-            contrib_df = pd.DataFrame({
-                'Contributor': contributor_stats.index,
-                'Contributions': contributor_stats.values
-            })
-            
-            fig_contrib = px.bar(
-                contrib_df,
-                x='Contributions',
-                y='Contributor',
-                orientation='h',
-                color='Contributions',
-                color_continuous_scale='Reds'
-            )
-            fig_contrib.update_layout(height=400, showlegend=False)
             st.plotly_chart(fig_contrib, use_container_width=True, key="top_contributors_overview")
 
         st.markdown("---")
 
         # Detailed Repository Stats
-        st.markdown("### Repository Details (Top 10)")
-        
-        repo_details = []
-        for repo_name, metrics in top_repos:
-            repo_details.append({
-                'Repository': repo_name,
-                'Stars': metrics.get('stars', 0),
-                'PRs': metrics.get('pr_opened', 0) + metrics.get('pr_closed', 0),
-                'Issues': metrics.get('issues_opened', 0) + metrics.get('issues_resolved', 0),
-                'Commits': metrics.get('commits', 0),
-                'Forks': metrics.get('forks', 0),
-                'Actions Success': metrics.get('actions_success', 0),
-                'Branches': metrics.get('branches', 0)
-            })
-        
-        repo_df = pd.DataFrame(repo_details)
-        st.dataframe(repo_df, use_container_width=True)
-
-        st.markdown("---")
-
-        # Detailed Repository Stats - All Repositories
-        st.markdown("### Repository Details (All Repositories)")
-        
-        # Create detailed stats for ALL repositories
-        all_repo_details = []
-        for repo_name, metrics in repo_activity_dict.items():
-            all_repo_details.append({
-                '#': len(all_repo_details) + 1,
-                'Repository': repo_name,
-                'Stars': metrics.get('stars', 0),
-                'PRs': metrics.get('pr_opened', 0) + metrics.get('pr_closed', 0),
-                'Issues': metrics.get('issues_opened', 0) + metrics.get('issues_resolved', 0),
-                'Commits': metrics.get('commits', 0),
-                'Forks': metrics.get('forks', 0),
-                'Branches': metrics.get('branches', 0),
-                'Actions Success': metrics.get('actions_success', 0),
-                'Actions Failed': metrics.get('action_failures', 0),
-                'Comments': metrics.get('comments', 0),
-                'Collaborators': metrics.get('new_collaborator', 0)
-            })
-        
-        all_repo_df = pd.DataFrame(all_repo_details)
-        
-        # Sorting options
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            st.markdown("**Sort by:**")
-        with col2:
-            sort_by = st.selectbox(
-                "Sort repositories by",
-                options=['Stars', 'Commits', 'PRs', 'Issues', 'Forks', 'Actions Success'],
-                label_visibility="collapsed",
-                key="sort_by_tab1"
-            )
-        
-        # Sort the dataframe
-        all_repo_df_sorted = all_repo_df.sort_values(by=sort_by, ascending=False).reset_index(drop=True)
-        all_repo_df_sorted['#'] = range(1, len(all_repo_df_sorted) + 1)
-        
-        # Pagination
-        items_per_page = st.selectbox(
-            "Repositories per page",
-            options=[10, 20, 50, 100, len(all_repo_df_sorted)],
-            index=0,
-            key="items_per_page_tab1"
-        )
-        
-        # Calculate pagination
-        total_pages = (len(all_repo_df_sorted) + items_per_page - 1) // items_per_page
-        page = st.number_input(
-            "Page",
-            min_value=1,
-            max_value=max(1, total_pages),
-            value=1,
-            key="page_number_tab1"
-        )
-        
-        # Get data for current page
-        start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
-        page_data = all_repo_df_sorted.iloc[start_idx:end_idx]
-        
-        # Display metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Repositories", len(all_repo_df_sorted))
-        with col2:
-            st.metric("Total Pages", total_pages)
-        with col3:
-            st.metric("Current Page", page)
-        with col4:
-            st.metric("Repos on Page", len(page_data))
-        
-        # Display table
-        st.dataframe(page_data, use_container_width=True, hide_index=True)
-        
-        # Export option
-        csv = all_repo_df_sorted.to_csv(index=False)
-        st.download_button(
-            label="Download All Repositories as CSV",
-            data=csv,
-            file_name="all_repositories.csv",
-            mime="text/csv",
-            key="download_repos_tab1"
-        )
+        render_repository_details(repo_table, "tab1")
 
         st.markdown("---")
 
         # Summary Statistics
         st.markdown("### Summary Statistics")
         
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("#### Repository Metrics")
-            st.write(f"Total Repositories: **{len(repo_activity_dict)}**")
-            st.write(f"Avg Stars per Repo: **{stars/len(repo_activity_dict) if len(repo_activity_dict) > 0 else 0:.1f}**")
-            st.write(f"Avg Commits per Repo: **{commits/len(repo_activity_dict) if len(repo_activity_dict) > 0 else 0:.1f}**")
-        
-        with col2:
-            st.markdown("#### Activity Metrics")
-            st.write(f"Total Events: **{len(data)}**")
-            st.write(f"Avg Events per Day: **{len(data)/total_active_days if total_active_days > 0 else 0:.1f}**")
-            st.write(f"Most Active Day: **{commit_frequency.idxmax()}**")
-        
-        with col3:
-            st.markdown("#### Action Metrics")
-            success_rate = (actions_success / (actions_success + action_failures) * 100) if (actions_success + action_failures) > 0 else 0
-            st.write(f"Action Success Rate: **{success_rate:.1f}%**")
-            st.write(f"Total Actions: **{actions_success + action_failures}**")
-            st.write(f"PR Merge Rate: **{pr_closed / (pr_opened + pr_closed) * 100 if (pr_opened + pr_closed) > 0 else 0:.1f}%**")
-
-    with tab2:
+        for col, (section, rows) in zip(st.columns(3), summary_statistics(metrics).items()):
+            with col:
+                st.markdown(f"#### {section}")
+                for label, value in rows:
+                    st.write(f"{label}: **{value}**")
+
+    @st.fragment
+    def contributors_section():
         st.markdown("### Contributor Analytics")
         
         # Get all unique contributors
-        all_contributors = data['embeds.0.author.name'].dropna().unique().tolist()
-        all_contributors = [c for c in all_contributors if c.strip().lower() not in ['unknown', 'nan', '']]
-        all_contributors = sorted(all_contributors)
+        contributors = contributor_index(dataset)
+        all_contributors = contributors.contributors()
         
         if len(all_contributors) == 0:
             st.warning("No contributors found in the data.")
@@ -558,7 +656,7 @@ else:
             
             if selected_contributor:
                 # Get contributor details
-                contributor_info = getContributorDetails(data, selected_contributor)
+                contributor_info = contributors.details(selected_contributor)
                 
                 if contributor_info:
                     st.markdown("---")
@@ -587,18 +685,8 @@ else:
                         st.subheader("Activity Type Breakdown")
                         activity_breakdown = contributor_info['activity_type_breakdown']
                         
-                        if activity_breakdown:
-                            activity_df = pd.DataFrame({
-                                'Activity Type': list(activity_breakdown.keys()),
-                                'Count': list(activity_breakdown.values())
-                            })
-                            
-                            fig_activity = px.pie(
-                                activity_df,
-                                values='Count',
-                                names='Activity Type',
-                                title=f"{selected_contributor}'s Activity Distribution"
-                            )
+                        fig_activity = activity_breakdown_figure(selected_contributor, activity_breakdown)
+                        if fig_activity is not None:
                             st.plotly_chart(fig_activity, use_container_width=True, key=f"activity_breakdown_{selected_contributor}")
                     
                     with col2:
@@ -615,163 +703,29 @@ else:
                     
                     # Activity timeline
                     st.subheader("Recent Activities Timeline")
-                    timeline_data = getContributorTimeline(data, selected_contributor, limit=20)
+                    timeline_data = contributors.timeline(selected_contributor, limit=20)
                     
                     if len(timeline_data) > 0:
-                        # Format timeline data for display
-                        display_data = timeline_data.copy()
-                        display_data['timestamp'] = pd.to_datetime(display_data['timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
-                        display_data.columns = ['Date & Time', 'Activity', 'URL']
-                        
-                        st.dataframe(display_data, use_container_width=True, hide_index=True)
+                        st.dataframe(timeline_table(timeline_data), use_container_width=True, hide_index=True)
                         
                         # Timeline chart
-                        timeline_for_chart = timeline_data.copy()
-                        timeline_for_chart['timestamp'] = pd.to_datetime(timeline_for_chart['timestamp'])
-                        timeline_for_chart['date'] = timeline_for_chart['timestamp'].dt.date
-                        activity_by_date = timeline_for_chart.groupby('date').size().reset_index(name='count')
-                        
-                        fig_timeline = px.bar(
-                            activity_by_date,
-                            x='date',
-                            y='count',
-                            title=f"{selected_contributor}'s Activity Over Time",
-                            labels={'date': 'Date', 'count': 'Number of Activities'}
-                        )
+                        fig_timeline = contributor_timeline_figure(selected_contributor, timeline_data)
                         st.plotly_chart(fig_timeline, use_container_width=True, key=f"timeline_{selected_contributor}")
         
         st.markdown("---")
     
-    with tab3:
-        st.markdown("### Top 10 Most Active Repositories")
-        
-        repo_names = [repo[0] for repo in top_repos]
-        repo_activities = [sum(repo[1].values()) for repo in top_repos]
-        
-        repos_df = pd.DataFrame({
-            'Repository': repo_names,
-            'Activity': repo_activities
-        })
-        
-        fig_repos = px.bar(
-            repos_df,
-            x='Activity',
-            y='Repository',
-            orientation='h',
-            color='Activity',
-            color_continuous_scale='Viridis'
-        )
-        fig_repos.update_layout(height=400, showlegend=False)
-        st.plotly_chart(fig_repos, use_container_width=True, key="top_repos_tab3")
+    @st.fragment
+    def repositories_section():
+        render_top_repositories(repo_table, "tab3")
 
         st.markdown("---")
 
-        # Detailed Repository Stats
-        st.markdown("### Repository Details (Top 10)")
-        
-        repo_details = []
-        for repo_name, metrics in top_repos:
-            repo_details.append({
-                'Repository': repo_name,
-                'Stars': metrics.get('stars', 0),
-                'PRs': metrics.get('pr_opened', 0) + metrics.get('pr_closed', 0),
-                'Issues': metrics.get('issues_opened', 0) + metrics.get('issues_resolved', 0),
-                'Commits': metrics.get('commits', 0),
-                'Forks': metrics.get('forks', 0),
-                'Actions Success': metrics.get('actions_success', 0),
-                'Branches': metrics.get('branches', 0)
-            })
-        
-        repo_df = pd.DataFrame(repo_details)
-        st.dataframe(repo_df, use_container_width=True)
-
-        st.markdown("---")
+        render_repository_details(repo_table, "tab3")
 
-        # Detailed Repository Stats - All Repositories
-        st.markdown("### Repository Details (All Repositories)")
-        
-        # Create detailed stats for ALL repositories
-        all_repo_details = []
-        for repo_name, metrics in repo_activity_dict.items():
-            all_repo_details.append({
-                '#': len(all_repo_details) + 1,
-                'Repository': repo_name,
-                'Stars': metrics.get('stars', 0),
-                'PRs': metrics.get('pr_opened', 0) + metrics.get('pr_closed', 0),
-                'Issues': metrics.get('issues_opened', 0) + metrics.get('issues_resolved', 0),
-                'Commits': metrics.get('commits', 0),
-                'Forks': metrics.get('forks', 0),
-                'Branches': metrics.get('branches', 0),
-                'Actions Success': metrics.get('actions_success', 0),
-                'Actions Failed': metrics.get('action_failures', 0),
-                'Comments': metrics.get('comments', 0),
-                'Collaborators': metrics.get('new_collaborator', 0)
-            })
-        
-        all_repo_df = pd.DataFrame(all_repo_details)
-        
-        # Sorting options
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            st.markdown("**Sort by:**")
-        with col2:
-            sort_by = st.selectbox(
-                "Sort repositories by",
-                options=['Stars', 'Commits', 'PRs', 'Issues', 'Forks', 'Actions Success'],
-                label_visibility="collapsed",
-                key="sort_by_tab3"
-            )
-        
-        # Sort the dataframe
-        all_repo_df_sorted = all_repo_df.sort_values(by=sort_by, ascending=False).reset_index(drop=True)
-        all_repo_df_sorted['#'] = range(1, len(all_repo_df_sorted) + 1)
-        
-        # Pagination
-        items_per_page = st.selectbox(
-            "Repositories per page",
-            options=[10, 20, 50, 100, len(all_repo_df_sorted)],
-            index=0,
-            key="items_per_page_tab3"
-        )
-        
-        # Calculate pagination
-        total_pages = (len(all_repo_df_sorted) + items_per_page - 1) // items_per_page
-        page = st.number_input(
-            "Page",
-            min_value=1,
-            max_value=max(1, total_pages),
-            value=1,
-            key="page_number_tab3"
-        )
-
-        # Get data for current page
-        start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
-        page_data = all_repo_df_sorted.iloc[start_idx:end_idx]
-        
-        # Display metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Repositories", len(all_repo_df_sorted))
-        with col2:
-            st.metric("Total Pages", total_pages)
-        with col3:
-            st.metric("Current Page", page)
-        with col4:
-            st.metric("Repos on Page", len(page_data))
-        
-        # Display table
-        st.dataframe(page_data, use_container_width=True, hide_index=True)
-        
-        # Export option
-        csv = all_repo_df_sorted.to_csv(index=False)
-        st.download_button(
-            label="Download All Repositories as CSV",
-            data=csv,
-            file_name="all_repositories.csv",
-            mime="text/csv",
-            key="download_repos_tab3"
-        )
+    for tab, section in [(tab1, overview_section), (tab2, contributors_section), (tab3, repositories_section)]:
+        if tab.open:
+            with tab:
+                section()
 
     st.markdown("---")
     
@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'core'), os.path.join(ROOT, 'benchmarks')]
+
+import main
+from store import EventStore
+from synthetic import write_events
+
+
+def test_reingesting_an_overlapping_export_keeps_every_event(tmp_path):
+    year = write_events(str(tmp_path / 'year.csv'), 20_000, seed=3)
+    rows = pd.read_csv(year, dtype=str)
+    quarter = str(tmp_path / 'quarter.csv')
+    rows.iloc[:10_000].to_csv(quarter, index=False)
+
+    store = EventStore(str(tmp_path / 'store.sqlite'))
+    assert store.ingest(quarter) == 10_000
+    assert store.ingest(year) == 20_000
+
+    # The quarter shrinks to messages the year export still has
+    rows.iloc[:5_000].to_csv(quarter, index=False)
+    assert store.ingest(quarter) == 5_000
+    assert store.ingest(year) == 0
+
+    expected = main.normalize_events(main.clean_data(year))
+    assert store.metrics()['total_events'] == len(expected) == 20_000
+    stored = main.normalize_events(store.events())
+    columns = main.EVENT_COLUMNS
+    assert stored[columns].astype(str).equals(expected[columns].astype(str))